@@ -1,33 +1,84 @@
 from collections import namedtuple
-from collections.abc import Callable
+from collections.abc import Callable, Generator, Iterable, Iterator
+from multiprocessing import Pool
+from time import perf_counter
 
 from .maze import (
+    create_cells,
     update_all_neighbors,
     recursive_space_division,
     dfs_maze,
     DFSMazeCell,
     random_barriers,
+    fast_recursive_space_division,
+    fast_dfs_maze,
+    kruskal_maze,
+    prim_maze,
+    wilson_maze,
+    eller_maze,
+    random_terrain,
 )
-from .maze import SquareCell
+from .maze import ArrayCells, Connectivity, FOUR_NEIGHBORS, SquareCell
+from .maze import Components, connected_components
 from .pathing import astar
+from .pathing import bidirectional_astar, bidirectional_dijkstra
 from .pathing import dfs
 from .pathing import dijkstra
+from .pathing import dijkstra_bucket
+from .pathing import jump_point_search
+from .pathing import JunctionGraph, junction_astar, junction_graph
+from .pathing import Landmarks, alt, landmarks
+from .pathing import ClusterGraph, cluster_graph, hpa_star
+from .pathing import LPAStar, lpa_star
+from .pathing import Heuristic, heuristics, get_heuristic, tightest_heuristic
+from .stats import SearchStats
+from .utils import Colors, Seed, Step, run_steps
 
-PathingAlgorithm = Callable[[SquareCell, SquareCell, Callable[[], None]], bool]
+# Pathing algorithms and barrier generations are generators yielding one Step
+# per step, pathing algorithms returning whether a path was found. Pathing
+# algorithms keep their counters in the optional SearchStats they are given.
+PathingAlgorithm = Callable[
+    [SquareCell, SquareCell, SearchStats | None], Generator[Step, None, bool]
+]
+BarrierGeneration = Callable[
+    [list[list[SquareCell]], Seed], Generator[Step, None, None]
+]
 pathing_algorithms: dict[str, PathingAlgorithm] = {
     "a*": astar,
+    "alt": alt,
+    "jps": jump_point_search,
     "dijkstra": dijkstra,
+    "dijkstra_bucket": dijkstra_bucket,
+    "bidirectional_a*": bidirectional_astar,
+    "bidirectional_dijkstra": bidirectional_dijkstra,
+    "lpa*": lpa_star,
+    "hpa*": hpa_star,
+    "junctions": junction_astar,
     "dfs": dfs,
 }
 
+# duration: seconds each frame of the barrier generation animation is held,
+# 0 to play it at the frame rate of the grid
+# seed: randomness of every generation, see Seed, None for a fresh seed each time
 BarrierSpecs = namedtuple(
-    "BarrierSpecs", ("cell_type", "barrier_generation", "duration")
+    "BarrierSpecs",
+    ("cell_type", "barrier_generation", "duration", "seed"),
+    defaults=(None,),
 )
 barriers: dict[str, BarrierSpecs] = {
     "diy": BarrierSpecs(SquareCell, update_all_neighbors, 0),
     "recursive_division_maze": BarrierSpecs(SquareCell, recursive_space_division, 0),
+    "recursive_division_maze_fast": BarrierSpecs(
+        SquareCell, fast_recursive_space_division, 0
+    ),
     "dfs": BarrierSpecs(DFSMazeCell, dfs_maze, 0),
+    "dfs_fast": BarrierSpecs(DFSMazeCell, fast_dfs_maze, 0),
+    "kruskal": BarrierSpecs(DFSMazeCell, kruskal_maze, 0),
+    "prim": BarrierSpecs(DFSMazeCell, prim_maze, 0),
+    "wilson": BarrierSpecs(DFSMazeCell, wilson_maze, 0),
+    "eller": BarrierSpecs(DFSMazeCell, eller_maze, 0),
     "random": BarrierSpecs(SquareCell, random_barriers, 0),
+    "terrain": BarrierSpecs(SquareCell, random_terrain, 0),
 }
 
 
@@ -45,3 +96,184 @@ def get_barrier(name: str) -> BarrierSpecs:
         return barriers[_name]
     else:
         raise ValueError(f"Barrier {name} not found!")
+
+
+SearchResult = namedtuple("SearchResult", ("found", "path", "expanded", "elapsed"))
+
+
+def solve(
+    pathing_name: str,
+    barrier_name: str,
+    num_rows: int,
+    num_columns: int,
+    start: (int, int),
+    end: (int, int),
+    walls: Iterable[(int, int)] = (),
+    backend: str = "objects",
+    seed: Seed = None,
+    connectivity: Connectivity = FOUR_NEIGHBORS,
+) -> SearchResult:
+    """Build a board and run a pathing algorithm on it without pygame.
+
+    start, end and walls are (row_id, col_id) pairs, walls being the barriers
+    a user would draw by hand before the barrier generation runs.
+    The result holds the path from start to end as (row_id, col_id) pairs,
+    the number of search steps and the search time in seconds.
+    backend selects the board representation, see create_cells, seed the
+    randomness of the barrier generation, see Seed, and connectivity the
+    moves between cells.
+    """
+    pathing = get_pathing_algorithm(pathing_name)
+    barrier_specs = get_barrier(barrier_name)
+    cells = create_cells(
+        barrier_specs.cell_type, num_rows, num_columns, 1, backend, connectivity
+    )
+
+    cells[start[0]][start[1]].make_start()
+    cells[end[0]][end[1]].make_end()
+    for row_id, col_id in walls:
+        cells[row_id][col_id].make_barrier()
+    run_steps(barrier_specs.barrier_generation(cells, seed))
+    return _answer(cells, pathing, start, end)
+
+
+def solve_many(
+    cells: list[list[SquareCell]] | ArrayCells,
+    pathing_name: str,
+    queries: Iterable[((int, int), (int, int))],
+    processes: int = 1,
+) -> Iterator[(int, SearchResult)]:
+    """Answer many (start, end) queries on one board built beforehand.
+
+    Barriers and neighbors are kept between queries, only the search state
+    is cleared, by bumping the search generation of the board.
+    Yields (query index, SearchResult) pairs as queries finish. With
+    processes > 1 the queries are spread over a process pool, each worker
+    rebuilding the board once, and the pairs arrive out of order.
+    """
+    pathing = get_pathing_algorithm(pathing_name)
+    if processes <= 1:
+        for i, (start, end) in enumerate(queries):
+            yield i, _answer(cells, pathing, start, end)
+        return
+
+    with Pool(
+        processes,
+        initializer=_init_worker,
+        initargs=(_snapshot(cells), pathing_name),
+    ) as pool:
+        yield from pool.imap_unordered(_answer_in_worker, enumerate(queries))
+
+
+def _answer(
+    cells: list[list[SquareCell]] | ArrayCells,
+    pathing: PathingAlgorithm,
+    start: (int, int),
+    end: (int, int),
+) -> SearchResult:
+    cells[0][0].search_epoch.bump()
+    start_cell = cells[start[0]][start[1]]
+    end_cell = cells[end[0]][end[1]]
+    # Endpoints are painted for this query only, and given their color back
+    # below: later queries on the board run on the same barriers
+    start_color, end_color = start_cell.color, end_cell.color
+    start_cell.make_start()
+    end_cell.make_end()
+
+    steps = 0
+
+    def _count_step(step: Step) -> None:
+        nonlocal steps
+        steps += 1
+
+    t0 = perf_counter()
+    found = run_steps(pathing(start_cell, end_cell), _count_step)
+    elapsed = perf_counter() - t0
+
+    path = []
+    if found:
+        curr = end_cell
+        while curr != start_cell:
+            path.append((curr.row_id, curr.col_id))
+            curr = curr.prev
+        path.append(start)
+        path.reverse()
+    _restore(end_cell, end_color)
+    _restore(start_cell, start_color)
+    # Algorithms step once per expansion, then once per inner path cell
+    expanded = steps - max(len(path) - 2, 0)
+    return SearchResult(found, path, expanded, elapsed)
+
+
+def _restore(cell: SquareCell, color: Colors) -> None:
+    """Give an endpoint of a query its color from before the query, a
+    barrier closing again through make_barrier."""
+    if color == Colors.BLACK:
+        cell.color = Colors.WHITE
+        cell.make_barrier()
+    else:
+        cell.color = color
+
+
+def _snapshot(
+    cells: list[list[SquareCell]] | ArrayCells,
+) -> (int, int, bytes, bytes, Connectivity, bytes | None):
+    """Picklable copy of the board: its barriers, its terrain costs, its
+    connectivity, and the neighbors of every cell as 4-bit masks when walls
+    between cells block moves as well."""
+    num_rows, num_columns = len(cells), len(cells[0])
+    barrier_bitmap = bytes(cell.is_barrier() for row in cells for cell in row)
+    costs = bytes(cells[0][0].terrain.costs)
+    connectivity = cells[0][0].connectivity
+    if not isinstance(cells[0][0], DFSMazeCell):
+        return num_rows, num_columns, barrier_bitmap, costs, connectivity, None
+
+    # Bits in the order of NeighborProvider, left, right, up and down
+    offsets = {(0, -1): 1, (0, 1): 2, (-1, 0): 4, (1, 0): 8}
+    mask = bytes(
+        sum(
+            offsets[(neighbor.row_id - cell.row_id, neighbor.col_id - cell.col_id)]
+            for neighbor in cell.neighbors
+        )
+        for row in cells
+        for cell in row
+    )
+    return num_rows, num_columns, barrier_bitmap, costs, connectivity, mask
+
+
+_worker_cells: list[list[SquareCell]] = []
+_worker_pathing: PathingAlgorithm | None = None
+
+
+def _init_worker(
+    snapshot: (int, int, bytes, bytes, Connectivity, bytes | None),
+    pathing_name: str,
+) -> None:
+    """Rebuild the board of solve_many once per worker process."""
+    global _worker_cells, _worker_pathing
+    num_rows, num_columns, barrier_bitmap, costs, connectivity, mask = snapshot
+    cells = create_cells(SquareCell, num_rows, num_columns, 1, "objects", connectivity)
+    cells[0][0].terrain.assign(costs)
+    for cell, is_barrier in zip((c for row in cells for c in row), barrier_bitmap):
+        if is_barrier:
+            cell.make_barrier()
+
+    if mask is None:
+        run_steps(update_all_neighbors(cells))
+    else:
+        directions = ((1, 0, -1), (2, 0, 1), (4, -1, 0), (8, 1, 0))
+        for row in cells:
+            for cell in row:
+                bits = mask[cell.row_id * num_columns + cell.col_id]
+                cell.neighbors = [
+                    cells[cell.row_id + d_row][cell.col_id + d_col]
+                    for bit, d_row, d_col in directions
+                    if bits & bit
+                ]
+    _worker_cells = cells
+    _worker_pathing = get_pathing_algorithm(pathing_name)
+
+
+def _answer_in_worker(query: (int, ((int, int), (int, int)))) -> (int, SearchResult):
+    i, (start, end) = query
+    return i, _answer(_worker_cells, _worker_pathing, start, end)
@@ -1,9 +1,38 @@
-from .square_cell import SquareCell
+from .connectivity import (
+    Connectivity,
+    FOUR_NEIGHBORS,
+    EIGHT_NEIGHBORS,
+    STRAIGHT,
+    DIAGONAL,
+)
+from .square_cell import SquareCell, SearchEpoch, BoardEdits, Terrain
+from .square_cell import MIN_COST, MAX_COST
+from .array_cells import ArrayCells, ArrayCell
 from .dfs_cell import DFSMazeCell
 from .chamber import Chamber
+from .neighbors import NeighborProvider
+from .components import Components, connected_components
 from .maze_functions import (
+    create_cells,
     update_all_neighbors,
     dfs_maze,
     recursive_space_division,
     random_barriers,
 )
+from .dfs_walls import dfs_maze_walls, apply_maze_walls, fast_dfs_maze
+from .recursive_division import (
+    recursive_division_walls,
+    fast_recursive_space_division,
+)
+from .spanning_tree_mazes import (
+    kruskal_maze_walls,
+    prim_maze_walls,
+    wilson_maze_walls,
+    eller_maze_rows,
+    eller_maze_walls,
+    kruskal_maze,
+    prim_maze,
+    wilson_maze,
+    eller_maze,
+)
+from .terrain import terrain_costs, random_terrain
@@ -0,0 +1,340 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .connectivity import FOUR_NEIGHBORS, Connectivity
+from .square_cell import TERRAIN_COLORS, BoardEdits, SearchEpoch, SquareCell, Terrain
+from ..utils import Colors
+
+if TYPE_CHECKING:
+    import pygame
+    from pygame import Surface
+
+
+INF = int(np.iinfo(np.int32).max)
+
+# uint8 state codes, indexed by the value stored in ArrayCells.state
+STATE_COLORS: tuple[Colors, ...] = (
+    Colors.WHITE,
+    Colors.BLACK,
+    Colors.START,
+    Colors.END,
+    Colors.OPEN,
+    Colors.CLOSE,
+    Colors.PATH,
+    Colors.GREY,
+    Colors.OPEN_REVERSE,
+    Colors.CLOSE_REVERSE,
+)
+COLOR_STATES: dict[Colors, int] = {color: i for i, color in enumerate(STATE_COLORS)}
+BARRIER: int = COLOR_STATES[Colors.BLACK]
+
+
+class ArrayCells:
+    """Compact grid backend storing the board in flat NumPy arrays.
+
+    Cell (r, c) lives at index r * num_columns + c of every array. Indexing
+    mirrors list[list[SquareCell]], cells[r][c] returning an ArrayCell view,
+    so the barrier generators and pathing algorithms run unchanged.
+    """
+
+    def __init__(
+        self,
+        num_rows: int,
+        num_columns: int,
+        cell_size: int,
+        connectivity: Connectivity = FOUR_NEIGHBORS,
+    ) -> None:
+        self.num_rows: int = num_rows
+        self.num_columns: int = num_columns
+        self.cell_size: int = cell_size
+        self.connectivity: Connectivity = connectivity
+
+        size = num_rows * num_columns
+        self.state: np.ndarray = np.zeros(size, dtype=np.uint8)
+        self.dist: np.ndarray = np.full(size, INF, dtype=np.int32)
+        self.g_score: np.ndarray = np.full(size, INF, dtype=np.int32)
+        self.h_score: np.ndarray = np.full(size, INF, dtype=np.int32)
+        self.prev: np.ndarray = np.full(size, -1, dtype=np.int32)
+        self.visited: np.ndarray = np.zeros(size, dtype=np.bool_)
+        self.search_epoch: SearchEpoch = SearchEpoch()
+        self.edits: BoardEdits = BoardEdits()
+        self.stamp: np.ndarray = np.zeros(size, dtype=np.int32)
+        self.terrain: Terrain = Terrain(size)
+
+        self.is_dirty: np.ndarray = np.zeros(size, dtype=np.bool_)
+        self.dirty_cells: list[SquareCell] | None = None
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __getitem__(self, r: int | slice) -> ArrayRow | list[ArrayRow]:
+        if isinstance(r, slice):
+            return [ArrayRow(self, row_id) for row_id in range(self.num_rows)[r]]
+        if r < 0:
+            r += self.num_rows
+        if not 0 <= r < self.num_rows:
+            raise IndexError("row index out of range")
+        return ArrayRow(self, r)
+
+    def __iter__(self):
+        for row_id in range(self.num_rows):
+            yield ArrayRow(self, row_id)
+
+    def cell(self, index: int) -> ArrayCell:
+        return ArrayCell(self, index)
+
+    def get_cell(self, row_id: int, col_id: int) -> ArrayCell:
+        cell = ArrayCell(self, row_id * self.num_columns + col_id)
+        cell.refresh_search_state()
+        return cell
+
+    def is_open(self, row_id: int, col_id: int) -> bool:
+        """Whether (row_id, col_id) is on the board and not a barrier."""
+        return (
+            0 <= row_id < self.num_rows
+            and 0 <= col_id < self.num_columns
+            and self.state.item(row_id * self.num_columns + col_id) != BARRIER
+        )
+
+    def reset(self) -> None:
+        """Vectorized SquareCell.reset for every cell."""
+        self.state.fill(COLOR_STATES[Colors.WHITE])
+        self.search_epoch.bump()
+        self.mark_all_dirty()
+
+    def mark_all_dirty(self) -> None:
+        """Queue every cell for repainting, after a bulk write to state."""
+        self.edits.bump()
+        if self.dirty_cells is not None:
+            self.dirty_cells.clear()
+            self.dirty_cells.extend(self.cell(i) for i in range(self.state.size))
+            self.is_dirty.fill(True)
+
+
+class ArrayRow:
+    def __init__(self, cells: ArrayCells, row_id: int) -> None:
+        self.cells: ArrayCells = cells
+        self.row_id: int = row_id
+
+    def __len__(self) -> int:
+        return self.cells.num_columns
+
+    def __getitem__(self, c: int | slice) -> ArrayCell | list[ArrayCell]:
+        offset = self.row_id * self.cells.num_columns
+        if isinstance(c, slice):
+            col_ids = range(self.cells.num_columns)[c]
+            return [ArrayCell(self.cells, offset + col_id) for col_id in col_ids]
+        if c < 0:
+            c += self.cells.num_columns
+        if not 0 <= c < self.cells.num_columns:
+            raise IndexError("column index out of range")
+        return ArrayCell(self.cells, offset + c)
+
+    def __iter__(self):
+        offset = self.row_id * self.cells.num_columns
+        for col_id in range(self.cells.num_columns):
+            yield ArrayCell(self.cells, offset + col_id)
+
+
+class ArrayCell(SquareCell):
+    """Lightweight SquareCell view over one index of an ArrayCells board.
+
+    Views are created on demand and hold no state of their own, two views
+    of the same index compare equal.
+    """
+
+    __slots__ = ("cells", "index")
+
+    def __init__(self, cells: ArrayCells, index: int) -> None:
+        self.cells: ArrayCells = cells
+        self.index: int = index
+
+    @property
+    def row_id(self) -> int:
+        return self.index // self.cells.num_columns
+
+    @property
+    def col_id(self) -> int:
+        return self.index % self.cells.num_columns
+
+    @property
+    def x_coord(self) -> int:
+        return self.col_id * self.cells.cell_size
+
+    @property
+    def y_coord(self) -> int:
+        return self.row_id * self.cells.cell_size
+
+    @property
+    def cell_size(self) -> int:
+        return self.cells.cell_size
+
+    @property
+    def num_rows(self) -> int:
+        return self.cells.num_rows
+
+    @property
+    def num_columns(self) -> int:
+        return self.cells.num_columns
+
+    @property
+    def color(self) -> Colors:
+        return STATE_COLORS[self.cells.state.item(self.index)]
+
+    @color.setter
+    def color(self, color: Colors) -> None:
+        state = COLOR_STATES[color]
+        if self.cells.state.item(self.index) != state:
+            self.cells.state[self.index] = state
+            self.mark_dirty()
+
+    @property
+    def dist(self) -> int:
+        return self.cells.dist.item(self.index)
+
+    @dist.setter
+    def dist(self, dist: int) -> None:
+        self.cells.dist[self.index] = min(dist, INF)
+
+    @property
+    def g_score(self) -> int:
+        return self.cells.g_score.item(self.index)
+
+    @g_score.setter
+    def g_score(self, g_score: int) -> None:
+        self.cells.g_score[self.index] = min(g_score, INF)
+
+    @property
+    def h_score(self) -> int:
+        return self.cells.h_score.item(self.index)
+
+    @h_score.setter
+    def h_score(self, h_score: int) -> None:
+        self.cells.h_score[self.index] = min(h_score, INF)
+
+    @property
+    def prev(self) -> ArrayCell | None:
+        index = self.cells.prev.item(self.index)
+        return None if index < 0 else ArrayCell(self.cells, index)
+
+    @prev.setter
+    def prev(self, prev: ArrayCell | None) -> None:
+        self.cells.prev[self.index] = -1 if prev is None else prev.index
+
+    @property
+    def visited(self) -> bool:
+        return self.cells.visited.item(self.index)
+
+    @visited.setter
+    def visited(self, visited: bool) -> None:
+        self.cells.visited[self.index] = visited
+
+    @property
+    def search_epoch(self) -> SearchEpoch:
+        return self.cells.search_epoch
+
+    @property
+    def edits(self) -> BoardEdits:
+        return self.cells.edits
+
+    @property
+    def terrain(self) -> Terrain:
+        return self.cells.terrain
+
+    @property
+    def connectivity(self) -> Connectivity:
+        return self.cells.connectivity
+
+    @property
+    def stamp(self) -> int:
+        return self.cells.stamp.item(self.index)
+
+    @stamp.setter
+    def stamp(self, stamp: int) -> None:
+        self.cells.stamp[self.index] = stamp
+
+    @property
+    def is_dirty(self) -> bool:
+        return self.cells.is_dirty.item(self.index)
+
+    @property
+    def neighbors(self) -> list[ArrayCell]:
+        """Accessible neighbors, derived from the state array on every call."""
+        cells = self.cells
+        state = cells.state
+        row_id, col_id = divmod(self.index, cells.num_columns)
+        candidates = []
+        if col_id > 0:
+            candidates.append(self.index - 1)
+        if col_id < cells.num_columns - 1:
+            candidates.append(self.index + 1)
+        if row_id > 0:
+            candidates.append(self.index - cells.num_columns)
+        if row_id < cells.num_rows - 1:
+            candidates.append(self.index + cells.num_columns)
+        neighbors = [
+            ArrayCell(cells, i) for i in candidates if state.item(i) != BARRIER
+        ]
+        if cells.connectivity.diagonal:
+            neighbors.extend(
+                ArrayCell(cells, self.index + d_row * cells.num_columns + d_col)
+                for d_row, d_col in cells.connectivity.open_diagonals(
+                    cells.is_open, row_id, col_id
+                )
+            )
+        epoch = cells.search_epoch.value
+        stamp = cells.stamp
+        for neighbor in neighbors:
+            if stamp.item(neighbor.index) != epoch:
+                neighbor.refresh_search_state()
+        return neighbors
+
+    def refresh_search_state(self) -> None:
+        cells, index = self.cells, self.index
+        if cells.stamp.item(index) != cells.search_epoch.value:
+            cells.stamp[index] = cells.search_epoch.value
+            cells.dist[index] = INF
+            cells.g_score[index] = INF
+            cells.h_score[index] = INF
+            cells.prev[index] = -1
+            cells.visited[index] = False
+
+    def track_dirty(self, dirty_cells: list[SquareCell]) -> None:
+        self.cells.dirty_cells = dirty_cells
+        self.cells.is_dirty[self.index] = False
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        cells = self.cells
+        if not cells.is_dirty[self.index] and cells.dirty_cells is not None:
+            cells.is_dirty[self.index] = True
+            cells.dirty_cells.append(self)
+
+    def draw(self, screen: Surface) -> pygame.Rect:
+        import pygame
+
+        self.cells.is_dirty[self.index] = False
+        rect = pygame.Rect(self.x_coord, self.y_coord, self.cell_size, self.cell_size)
+        color = self.color.value
+        if self.color is Colors.WHITE:
+            color = TERRAIN_COLORS[self.cells.terrain.costs[self.index]]
+        pygame.draw.rect(screen, color, rect)
+        return rect
+
+    def update_neighbors(self, cells: ArrayCells) -> None:
+        """Neighbors are derived from the state array, nothing to populate."""
+
+    def __lt__(self, other: ArrayCell) -> bool:
+        return self.cells.dist.item(self.index) < other.cells.dist.item(other.index)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ArrayCell)
+            and other.index == self.index
+            and other.cells is self.cells
+        )
+
+    def __hash__(self) -> int:
+        return self.index
@@ -1,10 +1,10 @@
 from __future__ import annotations
-from collections.abc import Callable
+import random
+from collections.abc import Generator
 from collections import namedtuple
-from random import choice, randint
 
 from .square_cell import SquareCell
-
+from ..utils import Step
 
 Door = namedtuple("Door", ["row_id", "col_id", "is_open"])
 Wall = namedtuple("Wall", ["from_", "to_", "door"])
@@ -28,6 +28,7 @@ class Chamber:
         col_id_max: int,
         row_ids_to_avoid: list[int],
         col_idx_to_avoid: list[int],
+        rng: random.Random,
     ) -> None:
         # Set up chamber boundaries
         self.row_id_min: int = row_id_min
@@ -38,6 +39,8 @@ class Chamber:
         # Walls should not be placed on these positions
         self.row_ids_to_avoid: list[int] = row_ids_to_avoid
         self.col_ids_to_avoid: list[int] = col_idx_to_avoid
+        # Shared by all the chambers of a maze
+        self.rng: random.Random = rng
         self.is_divisible, self.center_row_id, self.center_col_id = (
             self._select_center_ids()
         )
@@ -56,37 +59,43 @@ class Chamber:
             if col_id not in col_ids_to_avoid_set
         ]
         if row_candidate_ids and col_candidate_ids:
-            return True, choice(row_candidate_ids), choice(col_candidate_ids)
+            return (
+                True,
+                self.rng.choice(row_candidate_ids),
+                self.rng.choice(col_candidate_ids),
+            )
         else:
             return False, -1, -1
 
     def divide(
-        self, cells: list[list[SquareCell]], draw: Callable[[], None]
-    ) -> list["Chamber"]:
+        self, cells: list[list[SquareCell]]
+    ) -> Generator[Step, None, list["Chamber"]]:
         if self.is_divisible:
-            self._build_dividing_walls(cells, draw)
-            walls = self._open_doors(cells, draw)
+            yield from self._build_dividing_walls(cells)
+            walls = self._open_doors(cells)
+            for wall in walls.values():
+                if wall.door.is_open:
+                    door = cells[wall.door.row_id][wall.door.col_id]
+                    yield door.index, door.color
             sub_chambers = self._build_sub_chambers(walls)
             return sub_chambers
         else:
             return []
 
     def _build_dividing_walls(
-        self, cells: list[list[SquareCell]], draw: Callable[[], None]
-    ) -> None:
+        self, cells: list[list[SquareCell]]
+    ) -> Generator[Step, None, None]:
         # build horizontal wall
         for cell in cells[self.center_row_id][self.col_id_min : self.col_id_max + 1]:
             cell.make_barrier()
-            draw()
+            yield cell.index, cell.color
         # build vertical wall
         for row in cells[self.row_id_min : self.row_id_max + 1]:
             cell = row[self.center_col_id]
             cell.make_barrier()
-            draw()
+            yield cell.index, cell.color
 
-    def _open_doors(
-        self, cells: list[list[SquareCell]], draw: Callable[[], None]
-    ) -> dict[str, Wall]:
+    def _open_doors(self, cells: list[list[SquareCell]]) -> dict[str, Wall]:
         # Illustration for Chamber c, and its sub-chambers c1, c2, c3, and c4:
         # c:
         # -----------------------  v_upper_wall -> c1 | c2
@@ -106,11 +115,10 @@ class Chamber:
             wall = Wall(wall_from, wall_to, door)
             if is_open:  # Reset this cell on the wall as door
                 cells[door_row_id][door_col_id].reset()
-                draw()
             return wall
 
         # Randomly select a wall to keep it closed
-        closed_wall = choice(
+        closed_wall = self.rng.choice(
             ["v_upper_wall", "v_lower_wall", "h_left_wall", "h_right_wall"]
         )
         walls = {
@@ -118,27 +126,27 @@ class Chamber:
                 self.col_id_min,
                 self.center_col_id - 1,
                 self.center_row_id,
-                randint(self.col_id_min, self.center_col_id - 1),
+                self.rng.randint(self.col_id_min, self.center_col_id - 1),
                 "v_upper_wall" != closed_wall,
             ),
             "v_lower_wall": get_wall(
                 self.center_col_id + 1,
                 self.col_id_max - 1,
                 self.center_row_id,
-                randint(self.center_col_id + 1, self.col_id_max),
+                self.rng.randint(self.center_col_id + 1, self.col_id_max),
                 "v_lower_wall" != closed_wall,
             ),
             "h_left_wall": get_wall(
                 self.row_id_min,
                 self.center_row_id - 1,
-                randint(self.row_id_min, self.center_row_id - 1),
+                self.rng.randint(self.row_id_min, self.center_row_id - 1),
                 self.center_col_id,
                 "h_left_wall" != closed_wall,
             ),
             "h_right_wall": get_wall(
                 self.center_row_id + 1,
                 self.row_id_max,
-                randint(self.center_row_id + 1, self.row_id_max),
+                self.rng.randint(self.center_row_id + 1, self.row_id_max),
                 self.center_col_id,
                 "h_right_wall" != closed_wall,
             ),
@@ -180,6 +188,7 @@ class Chamber:
                         col_id_max,
                         row_ids_to_avoid,
                         col_ids_to_avoid,
+                        self.rng,
                     )
                     sub_chambers.append(sub_chamber)
         return sub_chambers
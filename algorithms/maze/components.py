@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from collections import deque
+
+import numpy as np
+
+from .array_cells import BARRIER, ArrayCells
+from .square_cell import SquareCell
+
+
+class Components:
+    """Connected regions of the open cells of a board, by label.
+
+    Cells are labelled at once with a union-find over the links between open
+    cells: every round each root is hooked to the smallest root it is linked
+    to, then every cell jumps to its grandparent until all point at their
+    root, all vectorized. Links come from the barrier bitmap, or from the neighbors of
+    every cell when walls between cells block moves as well. Diagonal steps
+    only link regions when they may pass the corners of barriers, any other
+    corner rule leaving an orthogonal way around.
+
+    After cells change one at a time, see BoardEdits, cells opened again
+    join the regions around them. Then the open cells next to new barriers
+    start one search each, run in turns within their region: once all but
+    one met or ran out of cells, the pieces they ran out in are labelled
+    again, the smaller sides of a split. Barriers have label -1.
+    """
+
+    def __init__(self, cells: list[list[SquareCell]] | ArrayCells) -> None:
+        self.cells: list[list[SquareCell]] | ArrayCells = cells
+        cell = cells[0][0]
+        self.num_rows: int = cell.num_rows
+        self.num_columns: int = cell.num_columns
+
+        # Changes of the board since the labels were last up to date
+        self.edits = cell.edits
+        self.version: int = self.edits.version
+        self.changed: list[SquareCell] = []
+        # Past one change per cell, labelling all again costs less
+        self.edits.track(self.changed, self.num_rows * self.num_columns)
+        self.labels: np.ndarray = np.empty(0, dtype=np.int32)
+        self.next_label: int = 0
+        self.label_all()
+
+    def connected(self, cell: SquareCell, other: SquareCell) -> bool:
+        """Whether a path may join two open cells."""
+        self.sync()
+        label = self.labels.item(cell.index)
+        return label != -1 and label == self.labels.item(other.index)
+
+    def sync(self) -> None:
+        """Bring the labels up to date with the board."""
+        if self.edits.version == self.version:
+            return
+        if self.edits.version - self.version != len(self.changed):
+            # The whole board changed
+            self.label_all()
+        else:
+            # Cells opened again first, so labels only have to be split
+            closed = []
+            for cell in self.changed:
+                labelled = self.labels.item(cell.index) != -1
+                if cell.is_barrier() and labelled:
+                    self.labels[cell.index] = -1
+                    closed.append(cell)
+                elif not cell.is_barrier() and not labelled:
+                    self._join(cell)
+
+            # A region a barrier cut in pieces has cells next to the barrier
+            # in each piece
+            starts = {}
+            for cell in closed:
+                for neighbor in self._open_neighbors(cell):
+                    label = self.labels.item(neighbor.index)
+                    starts.setdefault(label, {})[neighbor.index] = neighbor
+            for cells in starts.values():
+                if len(cells) > 1:
+                    self._split(list(cells.values()))
+        self.changed.clear()
+        self.version = self.edits.version
+
+    def label_all(self) -> None:
+        """Label every cell again, from the board as it is."""
+        size = self.num_rows * self.num_columns
+        is_open, first, second = self._links()
+        parent = np.arange(size)
+        while True:
+            first_root, second_root = parent[first], parent[second]
+            apart = first_root != second_root
+            if not apart.any():
+                break
+            # Links inside a tree stay inside it
+            first, second = first[apart], second[apart]
+            first_root, second_root = first_root[apart], second_root[apart]
+            np.minimum.at(
+                parent,
+                np.maximum(first_root, second_root),
+                np.minimum(first_root, second_root),
+            )
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+
+        self.labels = np.where(is_open, parent, -1).astype(np.int32)
+        self.next_label = size
+        self.changed.clear()
+        self.version = self.edits.version
+
+    def _links(self) -> (np.ndarray, np.ndarray, np.ndarray):
+        """Whether each cell is open, and the indices of the two cells of
+        every link between open cells."""
+        cells = self.cells
+        cell = cells[0][0]
+        shape = (self.num_rows, self.num_columns)
+        if isinstance(cells, ArrayCells):
+            is_open = (cells.state != BARRIER).reshape(shape)
+        elif cell.neighbor_provider is not None:
+            barriers = np.frombuffer(cell.neighbor_provider.barriers, dtype=np.uint8)
+            is_open = (barriers == 0).reshape(shape)
+        else:
+            # Neighbors of their own, walls between cells block moves
+            is_open = np.array(
+                [[not c.is_barrier() for c in row] for row in cells], dtype=np.bool_
+            )
+            first, second = [], []
+            for row in cells:
+                for c in row:
+                    if c.is_barrier():
+                        continue
+                    for neighbor in c.neighbors:
+                        if neighbor.index > c.index:
+                            first.append(c.index)
+                            second.append(neighbor.index)
+            return is_open.ravel(), np.array(first, int), np.array(second, int)
+
+        steps = [(0, 1), (1, 0)]
+        connectivity = cell.connectivity
+        if connectivity.diagonal and connectivity.min_open_sides == 0:
+            steps += [(1, 1), (1, -1)]
+        indices = np.arange(is_open.size).reshape(shape)
+        first, second = [], []
+        for d_row, d_col in steps:
+            # Cells at (row, col) and (row + d_row, col + d_col)
+            rows = slice(0, self.num_rows - d_row)
+            cols = slice(max(-d_col, 0), self.num_columns - max(d_col, 0))
+            next_rows = slice(d_row, self.num_rows)
+            next_cols = slice(max(d_col, 0), self.num_columns + min(d_col, 0))
+            linked = is_open[rows, cols] & is_open[next_rows, next_cols]
+            first.append(indices[rows, cols][linked])
+            second.append(indices[next_rows, next_cols][linked])
+        return is_open.ravel(), np.concatenate(first), np.concatenate(second)
+
+    def _split(self, starts: list[SquareCell]) -> None:
+        """Label again the pieces of a region its cells starts may be in."""
+        # Search i belongs to the group of searches it met, groups[i]
+        groups = list(range(len(starts)))
+        owners = {start.index: i for i, start in enumerate(starts)}
+        reached: list[list[SquareCell]] = [[start] for start in starts]
+        queues = [deque([start]) for start in starts]
+
+        def _group(i: int) -> int:
+            while groups[i] != i:
+                i = groups[i]
+            return i
+
+        while True:
+            running = {_group(i) for i, q in enumerate(queues) if q}
+            if len(running) <= 1 or len({_group(i) for i in range(len(starts))}) == 1:
+                break
+            for i, q in enumerate(queues):
+                if not q:
+                    continue
+                curr = q.popleft()
+                for neighbor in self._open_neighbors(curr):
+                    owner = owners.get(neighbor.index)
+                    if owner is None:
+                        owners[neighbor.index] = i
+                        reached[i].append(neighbor)
+                        q.append(neighbor)
+                    elif _group(owner) != _group(i):
+                        groups[_group(owner)] = _group(i)
+
+        # Groups that ran out of cells are regions of their own, unless all
+        # searches met
+        done = {_group(i) for i in range(len(starts))}
+        if len(done) == 1:
+            return
+        keep = running.pop() if running else done.pop()
+        for group in done - {keep}:
+            label = self.next_label
+            self.next_label += 1
+            for i in range(len(starts)):
+                if _group(i) == group:
+                    for reached_cell in reached[i]:
+                        self.labels[reached_cell.index] = label
+
+    def _join(self, cell: SquareCell) -> None:
+        """Join the regions around a cell opened again."""
+        labels = {
+            self.labels.item(neighbor.index) for neighbor in self._open_neighbors(cell)
+        }
+        labels.discard(-1)
+        if not labels:
+            self.labels[cell.index] = self.next_label
+            self.next_label += 1
+            return
+        label = labels.pop()
+        self.labels[cell.index] = label
+        if labels:
+            self.labels[np.isin(self.labels, list(labels))] = label
+
+    def _open_neighbors(self, cell: SquareCell) -> list[SquareCell]:
+        return [neighbor for neighbor in cell.neighbors if not neighbor.is_barrier()]
+
+
+def connected_components(cells: list[list[SquareCell]] | ArrayCells) -> Components:
+    """Components of a board, labelled once and kept with the board."""
+    caches = cells[0][0].edits.caches
+    if "components" not in caches:
+        caches["components"] = Components(cells)
+    return caches["components"]
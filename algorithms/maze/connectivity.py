@@ -0,0 +1,84 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterator
+
+# Weights of a straight and a diagonal step on 8-connected boards, 14 / 10
+# approximating sqrt(2) with ints: distances stay ints for the bucket queue
+# and the array backend
+STRAIGHT: int = 10
+DIAGONAL: int = 14
+
+# Diagonal steps may pass the corner of barriers ("allow"), not squeeze
+# between two barriers touching by their corners ("no_squeeze"), or not pass
+# the corner of any barrier ("no_cut"): the orthogonal cells on either side
+# of the step need this many open cells
+CORNER_RULES: dict[str, int] = {"allow": 0, "no_squeeze": 1, "no_cut": 2}
+
+# (d_row, d_col) of the diagonal steps, in the order of the neighbor lists
+DIAGONALS: tuple[(int, int), ...] = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class Connectivity:
+    """Moves between the cells of a board: to the 4 orthogonal neighbors, or
+    to all 8 around under a corner rule, see CORNER_RULES."""
+
+    def __init__(self, num_neighbors: int = 4, corner_rule: str = "no_cut") -> None:
+        if num_neighbors not in (4, 8):
+            raise ValueError(f"Connectivity {num_neighbors} not found!")
+        if corner_rule not in CORNER_RULES:
+            raise ValueError(f"Corner rule {corner_rule} not found!")
+        self.num_neighbors: int = num_neighbors
+        self.corner_rule: str = corner_rule
+        self.min_open_sides: int = CORNER_RULES[corner_rule]
+
+    @property
+    def diagonal(self) -> bool:
+        return self.num_neighbors == 8
+
+    @property
+    def weights(self) -> (int, int):
+        """Weights of a straight and a diagonal step, a diagonal taking two
+        straight steps on 4-connected boards."""
+        if self.diagonal:
+            return STRAIGHT, DIAGONAL
+        return 1, 2
+
+    @property
+    def step_weights(self) -> (int, int) | None:
+        """Weights of a diagonal and a straight step, indexed by whether the
+        step is straight, None when every step weighs 1."""
+        if self.diagonal:
+            return DIAGONAL, STRAIGHT
+        return None
+
+    def open_diagonals(
+        self, is_open: Callable[[int, int], bool], row_id: int, col_id: int
+    ) -> Iterator[(int, int)]:
+        """(d_row, d_col) of the diagonal steps allowed from (row_id, col_id),
+        is_open telling the open cells of the board."""
+        if not self.diagonal:
+            return
+        for d_row, d_col in DIAGONALS:
+            if not is_open(row_id + d_row, col_id + d_col):
+                continue
+            open_sides = is_open(row_id + d_row, col_id) + is_open(
+                row_id, col_id + d_col
+            )
+            if open_sides >= self.min_open_sides:
+                yield d_row, d_col
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Connectivity)
+            and other.num_neighbors == self.num_neighbors
+            and other.corner_rule == self.corner_rule
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.num_neighbors, self.corner_rule))
+
+    def __repr__(self) -> str:
+        return f"Connectivity({self.num_neighbors}, {self.corner_rule!r})"
+
+
+FOUR_NEIGHBORS: Connectivity = Connectivity(4)
+EIGHT_NEIGHBORS: Connectivity = Connectivity(8)
@@ -1,24 +1,35 @@
-from random import randint
-from typing import Optional
-
-import pygame
-from pygame import Surface
+from __future__ import annotations
+import random
+from typing import Optional, TYPE_CHECKING
 
 from .square_cell import SquareCell
 from ..utils import Colors
 
+if TYPE_CHECKING:
+    import pygame
+    from pygame import Surface
+
+
+# Wall bits of DFSMazeCell.walls
+TOP, BOTTOM, LEFT, RIGHT = 1, 2, 4, 8
+ALL_WALLS = TOP | BOTTOM | LEFT | RIGHT
+
 
 class DFSMazeCell(SquareCell):
     def __init__(self, r: int, c: int, cell_size: int, num_rows: int, num_columns: int):
         SquareCell.__init__(self, r, c, cell_size, num_rows, num_columns)
 
-        self.color: Colors = Colors.GREY
-        self.lines: dict[str, (int, int)] = self._get_lines()
+        self._color: Colors = Colors.GREY
+        self.walls: int = ALL_WALLS
+        # Cells with no wall towards this one, barriers included
+        self.passages: list["DFSMazeCell"] = []
 
         self.next_maze_cell_candidates: list["DFSMazeCell"] = []
         self.visited_during_maze_generation: bool = False
 
-    def _get_lines(self) -> dict[str, (int, int)]:
+    @property
+    def lines(self) -> dict[str, (int, int)]:
+        """End points of the remaining walls, derived from the walls bits."""
         # Relative point positions:
         #   p1 - p2
         #   |    |
@@ -34,12 +45,14 @@ class DFSMazeCell(SquareCell):
             "left": (p1, p4),
             "right": (p2, p3),
         }
-        return lines
+        bits = {"top": TOP, "bottom": BOTTOM, "left": LEFT, "right": RIGHT}
+        return {side: line for side, line in lines.items() if self.walls & bits[side]}
 
     def update_reachable_cells(self, cells: list[list["DFSMazeCell"]]) -> None:
         self.update_neighbors(cells)
         self.next_maze_cell_candidates = self.neighbors
         self.neighbors = []
+        self.passages = []
 
     def update_maze_cell_candidates(self) -> None:
         unvisited_candidates = [
@@ -52,11 +65,11 @@ class DFSMazeCell(SquareCell):
     def has_maze_cell_candidates(self) -> bool:
         return len(self.next_maze_cell_candidates) > 0
 
-    def get_next_maze_cell(self) -> Optional["DFSMazeCell"]:
+    def get_next_maze_cell(self, rng: random.Random) -> Optional["DFSMazeCell"]:
         """Randomly choose a cell among its unvisited neighboring cells."""
         self.update_maze_cell_candidates()
         if self.has_maze_cell_candidates():
-            idx = randint(0, len(self.next_maze_cell_candidates) - 1)
+            idx = rng.randint(0, len(self.next_maze_cell_candidates) - 1)
             return self.next_maze_cell_candidates.pop(idx)
         else:
             return None
@@ -68,33 +81,40 @@ class DFSMazeCell(SquareCell):
                 #   other
                 #   -----
                 #   self
-                self.lines.pop("top", None)
-                other.lines.pop("bottom", None)
+                self.walls &= ~TOP
+                other.walls &= ~BOTTOM
 
             elif other.row_id - self.row_id == 1:
                 #   self
                 #   -----
                 #   other
-                self.lines.pop("bottom", None)
-                other.lines.pop("top", None)
+                self.walls &= ~BOTTOM
+                other.walls &= ~TOP
 
             elif self.col_id - other.col_id == 1:
                 # other | self
-                self.lines.pop("left", None)
-                other.lines.pop("right", None)
+                self.walls &= ~LEFT
+                other.walls &= ~RIGHT
 
             elif other.col_id - self.col_id == 1:
                 # self | other
-                self.lines.pop("right", None)
-                other.lines.pop("left", None)
+                self.walls &= ~RIGHT
+                other.walls &= ~LEFT
         else:
             return
+        self.mark_dirty()
+        other.mark_dirty()
+        self.edits.bump()
 
         # self and other are now reachable during path finding
         if other not in self.neighbors:
             self.neighbors.append(other)
         if self not in other.neighbors:
             other.neighbors.append(self)
+        if other not in self.passages:
+            self.passages.append(other)
+        if self not in other.passages:
+            other.passages.append(self)
 
         # self and other are now not reachable during maze building
         if other in self.next_maze_cell_candidates:
@@ -107,23 +127,53 @@ class DFSMazeCell(SquareCell):
             self.color = Colors.WHITE
         self.visited_during_maze_generation = True
 
+    def make_barrier(self) -> None:
+        """Paint a barrier, and take it out of the neighbors of the cells
+        with no wall towards it."""
+        if self.is_start() or self.is_end() or self.is_barrier():
+            return
+        SquareCell.make_barrier(self)
+        for passage in self.passages:
+            if self in passage.neighbors:
+                passage.neighbors.remove(self)
+
+    def make_start(self) -> None:
+        if self.is_barrier():
+            self._open_passages()
+        SquareCell.make_start(self)
+
+    def make_end(self) -> None:
+        if self.is_barrier():
+            self._open_passages()
+        SquareCell.make_end(self)
+
     def reset(self) -> None:
         """Resetting cell for maze generation"""
+        if self.is_barrier():
+            self._open_passages()
         self.color = Colors.GREY
-        self.dist = float("inf")
-        self.g_score = float("inf")
-        self.h_score = float("inf")
-        self.prev = None
-        self.visited = False
+        self.stamp = -1
 
-        self.lines = self._get_lines()
+        self.walls = ALL_WALLS
+        self.mark_dirty()
+        self.edits.bump()
         self.next_maze_cell_candidates: list["DFSMazeCell"] = []
         self.visited_during_maze_generation = False
 
-    def draw(self, screen: Surface) -> None:
-        rect = pygame.Rect(self.x_coord, self.y_coord, self.cell_size, self.cell_size)
-        pygame.draw.rect(screen, self.color.value, rect)
+    def _open_passages(self) -> None:
+        """Make a barrier reachable again from the open cells with no wall
+        towards it."""
+        self.neighbors = [c for c in self.passages if not c.is_barrier()]
+        for neighbor in self.neighbors:
+            if self not in neighbor.neighbors:
+                neighbor.neighbors.append(self)
+
+    def draw(self, screen: Surface) -> pygame.Rect:
+        import pygame
 
+        rect = SquareCell.draw(self, screen)
         for line in self.lines.values():
             start_pos, end_pos = line
             pygame.draw.line(screen, Colors.BLACK.value, start_pos, end_pos, 3)
+        # Walls are 3px wide and spill one pixel over the cell borders
+        return rect.inflate(2, 2)
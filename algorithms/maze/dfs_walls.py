@@ -0,0 +1,152 @@
+from __future__ import annotations
+import random
+from collections.abc import Generator
+
+from .dfs_cell import ALL_WALLS, BOTTOM, LEFT, RIGHT, TOP, DFSMazeCell
+from ..utils import Colors, Seed, Step, make_rng
+
+# Masks clearing each wall bit, and the bit on the other side of the wall,
+# indexed by wall bit
+_CLEAR: list[int] = [ALL_WALLS & ~bit for bit in range(9)]
+_OPPOSITE: list[int] = [0] * 9
+_OPPOSITE[TOP], _OPPOSITE[BOTTOM] = BOTTOM, TOP
+_OPPOSITE[LEFT], _OPPOSITE[RIGHT] = RIGHT, LEFT
+# Set bits of every 4-bit mask, lowest first
+_BITS: list[tuple[int, ...]] = [
+    tuple(bit for bit in (TOP, BOTTOM, LEFT, RIGHT) if mask & bit) for mask in range(16)
+]
+
+
+def dfs_maze_walls(
+    num_rows: int,
+    num_columns: int,
+    rng: random.Random | None = None,
+    barriers: bytes | None = None,
+) -> bytearray:
+    """Randomized depth first search maze as one 4-bit wall mask per cell.
+
+    Cell (r, c) is at index r * num_columns + c, its bits are the walls
+    still standing, as in DFSMazeCell.walls. A second mask per cell holds
+    the sides leading to unvisited cells, so candidates are read in one
+    lookup instead of being filtered again on every visit.
+    barriers, one byte per cell as well, marks the cells the maze goes
+    around, as the cells of dfs_maze skip barriers.
+    """
+    if rng is None:
+        rng = random.Random()
+    size = num_rows * num_columns
+    walls = bytearray([ALL_WALLS]) * size
+    steps = _steps(num_columns)
+    inside = _inside_sides(num_rows, num_columns, barriers)
+    # Sides of inside minus those leading to visited cells
+    unvisited = bytearray(inside)
+
+    random_ = rng.random
+    index = _random_root(size, rng, barriers)
+    if index is None:
+        return walls
+    stack = [index]
+    while True:
+        # Visiting index: it is no candidate of its neighbors anymore
+        for bit in _BITS[inside[index]]:
+            unvisited[index + steps[bit]] &= _CLEAR[_OPPOSITE[bit]]
+
+        bits = _BITS[unvisited[index]]
+        while not bits:
+            stack.pop()
+            if not stack:
+                return walls
+            index = stack[-1]
+            bits = _BITS[unvisited[index]]
+
+        bit = bits[int(random_() * len(bits))] if len(bits) > 1 else bits[0]
+        walls[index] &= _CLEAR[bit]
+        index += steps[bit]
+        walls[index] &= _CLEAR[_OPPOSITE[bit]]
+        stack.append(index)
+
+
+def _steps(num_columns: int) -> list[int]:
+    """Index offsets of the neighbor behind each wall bit."""
+    steps = [0] * 9
+    steps[TOP], steps[BOTTOM] = -num_columns, num_columns
+    steps[LEFT], steps[RIGHT] = -1, 1
+    return steps
+
+
+def _inside_sides(
+    num_rows: int, num_columns: int, barriers: bytes | None = None
+) -> bytes:
+    """Sides of every cell leading to a cell on the board, as wall bits.
+
+    Sides from and to barriers lead nowhere.
+    """
+    size = num_rows * num_columns
+    inside = bytearray([ALL_WALLS]) * size
+    for col_id in range(num_columns):
+        inside[col_id] &= ~TOP
+        inside[size - num_columns + col_id] &= ~BOTTOM
+    for row_id in range(num_rows):
+        inside[row_id * num_columns] &= ~LEFT
+        inside[row_id * num_columns + num_columns - 1] &= ~RIGHT
+    if barriers is not None:
+        steps = _steps(num_columns)
+        for index in range(size):
+            if barriers[index]:
+                for bit in _BITS[inside[index]]:
+                    inside[index + steps[bit]] &= _CLEAR[_OPPOSITE[bit]]
+                inside[index] = 0
+    return bytes(inside)
+
+
+def _random_root(
+    size: int, rng: random.Random, barriers: bytes | None = None
+) -> int | None:
+    """Random cell to grow a maze from, None when all cells are barriers."""
+    if barriers is not None and all(barriers):
+        return None
+    index = rng.randrange(size)
+    while barriers is not None and barriers[index]:
+        index = rng.randrange(size)
+    return index
+
+
+def barrier_bitmap(cells: list[list[DFSMazeCell]]) -> bytes:
+    """One byte per cell, 1 for barriers, in the layout of the wall masks."""
+    return bytes(cell.is_barrier() for row in cells for cell in row)
+
+
+def apply_maze_walls(cells: list[list[DFSMazeCell]], walls: bytearray) -> None:
+    """Carve the walls of dfs_maze_walls into a board of DFSMazeCell.
+
+    Barriers keep their color, the masks keeping all their walls up.
+    """
+    num_columns = len(cells[0])
+    steps = {TOP: (-1, 0), BOTTOM: (1, 0), LEFT: (0, -1), RIGHT: (0, 1)}
+    for row in cells:
+        for cell in row:
+            cell_walls = walls[cell.row_id * num_columns + cell.col_id]
+            cell.walls = cell_walls
+            # The order of SquareCell.update_neighbors: left, right, up, down
+            cell.passages = [
+                cells[cell.row_id + steps[bit][0]][cell.col_id + steps[bit][1]]
+                for bit in (LEFT, RIGHT, TOP, BOTTOM)
+                if not cell_walls & bit
+            ]
+            cell.neighbors = list(cell.passages)
+            cell.next_maze_cell_candidates = []
+            cell.visited_during_maze_generation = True
+            if not cell.is_start() and not cell.is_end() and not cell.is_barrier():
+                cell.color = Colors.WHITE
+            cell.mark_dirty()
+    cells[0][0].edits.bump()
+
+
+def fast_dfs_maze(
+    cells: list[list[DFSMazeCell]], seed: Seed = None
+) -> Generator[Step, None, None]:
+    """DFS maze built on wall masks, then carved into the board at once."""
+    rng = make_rng(seed)
+    walls = dfs_maze_walls(len(cells), len(cells[0]), rng, barrier_bitmap(cells))
+    apply_maze_walls(cells, walls)
+    yield from ()
@@ -1,86 +1,138 @@
 from collections import deque
-from random import randint, shuffle
-from typing import Callable
+from collections.abc import Generator
 
-from .square_cell import SquareCell
+from .array_cells import ArrayCells
+from .connectivity import FOUR_NEIGHBORS, Connectivity
+from .neighbors import NeighborProvider
+from .square_cell import BoardEdits, SquareCell, SearchEpoch, Terrain
 from .dfs_cell import DFSMazeCell
 from .chamber import Chamber
-from ..utils import should_quit
+from ..utils import Seed, Step, make_rng
+
+
+def create_cells(
+    cell_cls: type[SquareCell],
+    num_rows: int,
+    num_columns: int,
+    cell_size: int,
+    backend: str = "objects",
+    connectivity: Connectivity = FOUR_NEIGHBORS,
+) -> list[list[SquareCell]] | ArrayCells:
+    """Build the board with one object per cell, or on NumPy arrays."""
+    # Walls between cells have no corners for diagonal steps to pass
+    if connectivity.diagonal and cell_cls is not SquareCell:
+        raise ValueError(f"{cell_cls.__name__} does not support diagonal steps")
+    if backend == "array":
+        if cell_cls is not SquareCell:
+            raise ValueError(f"The array backend does not support {cell_cls.__name__}")
+        return ArrayCells(num_rows, num_columns, cell_size, connectivity)
+    if backend != "objects":
+        raise ValueError(f"Grid backend {backend} not found!")
+
+    search_epoch = SearchEpoch()
+    edits = BoardEdits()
+    terrain = Terrain(num_rows * num_columns)
+    cells = []
+    for r in range(num_rows):
+        row = []
+        for c in range(num_columns):
+            cell = cell_cls(r, c, cell_size, num_rows, num_columns)
+            cell.search_epoch = search_epoch
+            cell.edits = edits
+            cell.terrain = terrain
+            cell.connectivity = connectivity
+            row.append(cell)
+        cells.append(row)
+    return cells
 
 
 def update_all_neighbors(
-    cells: list[list[SquareCell]], draw: Callable[[], None]
-) -> None:
-    for rows in cells:
-        for cell in rows:
-            cell.update_neighbors(cells)
+    cells: list[list[SquareCell]], seed: Seed = None
+) -> Generator[Step, None, None]:
+    """Wire every cell to a NeighborProvider reading the barrier bitmap.
+
+    Barriers drawn by hand are already on the board, there is no step to show
+    and nothing random, seed is only there to match the other generations.
+    """
+    # ArrayCell neighbors are derived from the state array, and once wired,
+    # make_barrier and reset keep the bitmap in sync cell by cell
+    if not isinstance(cells, ArrayCells) and cells[0][0].neighbor_provider is None:
+        provider = NeighborProvider(cells)
+        for rows in cells:
+            for cell in rows:
+                cell.neighbor_provider = provider
+    yield from ()
 
 
 def dfs_maze(
-    cells: list[list[DFSMazeCell]], draw: Callable[[], None]
-) -> list[list[DFSMazeCell]]:
+    cells: list[list[DFSMazeCell]], seed: Seed = None
+) -> Generator[Step, None, None]:
+    rng = make_rng(seed)
     for rows in cells:
         for cell in rows:
             cell.update_reachable_cells(cells)
 
-    row_id = randint(0, len(cells) - 1)
-    col_id = randint(0, len(cells[0]) - 1)
-    root = cells[row_id][col_id]
+    if all(cell.is_barrier() for rows in cells for cell in rows):
+        return
+    # The maze grows around barriers, from an open cell
+    root = None
+    while root is None or root.is_barrier():
+        row_id = rng.randint(0, len(cells) - 1)
+        col_id = rng.randint(0, len(cells[0]) - 1)
+        root = cells[row_id][col_id]
     root.make_maze_path()
 
     stack = deque()
     stack.append(root)
     while stack:
-        should_quit()
         current_maze_cell = stack.pop()
-        next_maze_cell = current_maze_cell.get_next_maze_cell()
+        next_maze_cell = current_maze_cell.get_next_maze_cell(rng)
         if next_maze_cell is not None:
             current_maze_cell.remove_wall_between(next_maze_cell)
             next_maze_cell.make_maze_path()
             if current_maze_cell.has_maze_cell_candidates():
                 stack.append(current_maze_cell)
             stack.append(next_maze_cell)
-
-        draw()
-
-    return cells
+            yield next_maze_cell.index, next_maze_cell.color
+        else:
+            yield current_maze_cell.index, current_maze_cell.color
 
 
 def recursive_space_division(
-    cells: list[list[SquareCell]], draw: Callable[[], None]
-) -> list[list[SquareCell]]:
+    cells: list[list[SquareCell]], seed: Seed = None
+) -> Generator[Step, None, None]:
     for rows in cells:
         for cell in rows:
             if not cell.is_start() and not cell.is_end():
                 cell.reset()
     num_rows, num_columns = len(cells), len(cells[0])
-    root = Chamber(0, num_rows - 1, 0, num_columns - 1, [], [])
+    root = Chamber(0, num_rows - 1, 0, num_columns - 1, [], [], make_rng(seed))
     stack = deque()
     stack.append(root)
     while stack:
         curr_chamber = stack.pop()
-        sub_chambers = curr_chamber.divide(cells, draw)
+        sub_chambers = yield from curr_chamber.divide(cells)
         stack.extend(sub_chambers)
-    update_all_neighbors(cells, draw)
-    return cells
+    yield from update_all_neighbors(cells)
 
 
 def random_barriers(
-    cells: list[list[SquareCell]], draw: Callable[[], None]
-) -> list[list[SquareCell]]:
+    cells: list[list[SquareCell]], seed: Seed = None
+) -> Generator[Step, None, None]:
     """Generate random barriers for each column from left to right."""
+    rng = make_rng(seed)
     num_rows, num_columns = len(cells), len(cells[0])
     max_num_barriers_per_column = int(num_columns * 0.08)
     # create barriers for each column by randomly selecting rows
     for column_id in range(num_columns):
-        num_barriers = randint(
+        num_barriers = rng.randint(
             max_num_barriers_per_column - 3, max_num_barriers_per_column
         )
         row_candidate_ids = list(range(0, num_rows))
-        shuffle(row_candidate_ids)
+        rng.shuffle(row_candidate_ids)
         row_barrier_idx = row_candidate_ids[:num_barriers]
         for row_id in row_barrier_idx:
-            cells[row_id][column_id].make_barrier()
-            draw()
-    update_all_neighbors(cells, draw)
-    return cells
+            cell = cells[row_id][column_id]
+            cell.make_barrier()
+            yield cell.index, cell.color
+    yield from update_all_neighbors(cells)
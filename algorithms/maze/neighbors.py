@@ -0,0 +1,171 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .connectivity import DIAGONALS
+
+if TYPE_CHECKING:
+    from .connectivity import Connectivity
+    from .square_cell import SquareCell
+
+
+# Adjacency mask bits, in the order SquareCell.update_neighbors visits them,
+# then the diagonals of 8-connected boards in the order of DIAGONALS
+LEFT, RIGHT, UP, DOWN = 1, 2, 4, 8
+UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT = 16, 32, 64, 128
+# Bit and (d_row, d_col) of the orthogonal steps, bits of the diagonal steps
+_ORTHOGONAL_STEPS = ((LEFT, 0, -1), (RIGHT, 0, 1), (UP, -1, 0), (DOWN, 1, 0))
+_DIAGONAL_BITS = dict(zip(DIAGONALS, (UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT)))
+
+
+class NeighborProvider:
+    """Derive the neighborhood of every cell on the fly.
+
+    The board is kept as a flat barrier bitmap, no cell owns a neighbor list.
+    With use_mask, an adjacency mask per cell is precomputed as well so that
+    a lookup is a single table access instead of four, or eight, barrier
+    checks. Changing one cell only touches that cell and the cells around it.
+    The neighborhood follows the connectivity of the cells.
+    """
+
+    def __init__(self, cells: list[list[SquareCell]], use_mask: bool = True) -> None:
+        self.num_rows: int = len(cells)
+        self.num_columns: int = len(cells[0])
+        self.flat: list[SquareCell] = [cell for row in cells for cell in row]
+        self.connectivity: Connectivity = self.flat[0].connectivity
+
+        n = self.num_columns
+        # Index offsets of the neighbors encoded by each mask value
+        directions = [
+            (bit, d_row * n + d_col) for bit, d_row, d_col in _ORTHOGONAL_STEPS
+        ]
+        directions += [
+            (bit, d_row * n + d_col) for (d_row, d_col), bit in _DIAGONAL_BITS.items()
+        ]
+        self.offsets: list[tuple[int, ...]] = [
+            tuple(offset for bit, offset in directions if mask & bit)
+            for mask in range(256)
+        ]
+
+        self.barriers: bytearray = bytearray()
+        self.mask: bytearray | None = bytearray() if use_mask else None
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Read the barrier bitmap and the connectivity back from the cells."""
+        self.connectivity = self.flat[0].connectivity
+        self.barriers = bytearray(cell.is_barrier() for cell in self.flat)
+        if self.mask is not None:
+            self.mask = self._build_mask()
+
+    def _build_mask(self) -> bytearray:
+        num_rows, num_columns = self.num_rows, self.num_columns
+        # Open cells inside a frame of barriers
+        is_open = np.zeros((num_rows + 2, num_columns + 2), dtype=np.bool_)
+        is_open[1:-1, 1:-1] = (
+            np.frombuffer(self.barriers, dtype=np.uint8).reshape(num_rows, num_columns)
+            == 0
+        )
+
+        def _open(d_row: int, d_col: int) -> np.ndarray:
+            """Whether the cell d_row, d_col away from each cell is open."""
+            return is_open[
+                1 + d_row : num_rows + 1 + d_row, 1 + d_col : num_columns + 1 + d_col
+            ]
+
+        mask = np.zeros((num_rows, num_columns), dtype=np.uint8)
+        for bit, d_row, d_col in _ORTHOGONAL_STEPS:
+            mask |= np.where(_open(d_row, d_col), bit, 0).astype(np.uint8)
+        if self.connectivity.diagonal:
+            min_open_sides = self.connectivity.min_open_sides
+            for (d_row, d_col), bit in _DIAGONAL_BITS.items():
+                open_sides = _open(d_row, 0).astype(np.uint8) + _open(0, d_col)
+                allowed = _open(d_row, d_col) & (open_sides >= min_open_sides)
+                mask |= np.where(allowed, bit, 0).astype(np.uint8)
+        return bytearray(mask.tobytes())
+
+    def _cell_mask(self, row_id: int, col_id: int) -> int:
+        """Adjacency mask of one cell, as _build_mask builds them."""
+        is_open = self.is_open
+        mask = 0
+        for bit, d_row, d_col in _ORTHOGONAL_STEPS:
+            if is_open(row_id + d_row, col_id + d_col):
+                mask |= bit
+        for step in self.connectivity.open_diagonals(is_open, row_id, col_id):
+            mask |= _DIAGONAL_BITS[step]
+        return mask
+
+    def get_cell(self, row_id: int, col_id: int) -> SquareCell:
+        cell = self.flat[row_id * self.num_columns + col_id]
+        cell.refresh_search_state()
+        return cell
+
+    def is_open(self, row_id: int, col_id: int) -> bool:
+        """Whether (row_id, col_id) is on the board and not a barrier."""
+        return (
+            0 <= row_id < self.num_rows
+            and 0 <= col_id < self.num_columns
+            and not self.barriers[row_id * self.num_columns + col_id]
+        )
+
+    def neighbors(self, row_id: int, col_id: int) -> list[SquareCell]:
+        index = row_id * self.num_columns + col_id
+        flat = self.flat
+        if self.mask is not None:
+            return [flat[index + offset] for offset in self.offsets[self.mask[index]]]
+        if self.connectivity.diagonal:
+            mask = self._cell_mask(row_id, col_id)
+            return [flat[index + offset] for offset in self.offsets[mask]]
+
+        barriers = self.barriers
+        n = self.num_columns
+        neighbors = []
+        if col_id > 0 and not barriers[index - 1]:
+            neighbors.append(flat[index - 1])
+        if col_id < n - 1 and not barriers[index + 1]:
+            neighbors.append(flat[index + 1])
+        if row_id > 0 and not barriers[index - n]:
+            neighbors.append(flat[index - n])
+        if row_id < self.num_rows - 1 and not barriers[index + n]:
+            neighbors.append(flat[index + n])
+        return neighbors
+
+    def update(self, cell: SquareCell) -> None:
+        """Sync the bitmap after cell became, or stopped being, a barrier."""
+        row_id, col_id = cell.row_id, cell.col_id
+        index = row_id * self.num_columns + col_id
+        is_barrier = cell.is_barrier()
+        if self.barriers[index] == is_barrier:
+            return
+        self.barriers[index] = is_barrier
+        if self.mask is None:
+            return
+        if self.connectivity.diagonal:
+            # Diagonal steps around cell pass its corners
+            n = self.num_columns
+            for neighbor_row in range(
+                max(row_id - 1, 0), min(row_id + 2, self.num_rows)
+            ):
+                for neighbor_col in range(max(col_id - 1, 0), min(col_id + 2, n)):
+                    self.mask[neighbor_row * n + neighbor_col] = self._cell_mask(
+                        neighbor_row, neighbor_col
+                    )
+            return
+
+        # The bit pointing back at cell flips on each neighbor
+        n = self.num_columns
+        sides = []
+        if col_id > 0:
+            sides.append((index - 1, RIGHT))
+        if col_id < n - 1:
+            sides.append((index + 1, LEFT))
+        if row_id > 0:
+            sides.append((index - n, DOWN))
+        if row_id < self.num_rows - 1:
+            sides.append((index + n, UP))
+        for neighbor_index, bit in sides:
+            if is_barrier:
+                self.mask[neighbor_index] &= ~bit
+            else:
+                self.mask[neighbor_index] |= bit
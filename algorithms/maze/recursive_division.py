@@ -0,0 +1,218 @@
+from __future__ import annotations
+from collections.abc import Generator
+
+import numpy as np
+
+from .array_cells import ArrayCells, BARRIER, COLOR_STATES
+from .maze_functions import update_all_neighbors
+from .square_cell import SquareCell
+from ..utils import Colors, Seed, Step, make_numpy_rng
+
+# Padding of the avoided row / column arrays, sorts after every real index
+_NONE = np.iinfo(np.int64).max
+
+
+def recursive_division_walls(
+    num_rows: int,
+    num_columns: int,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """Barrier bitmap of a recursive division maze, built with NumPy.
+
+    Draws mazes from the same distribution as Chamber.divide, but every
+    chamber of a level is divided at once. Descendants never build walls on
+    the dividing lines of their ancestors, so all wall segments are
+    collected first, painted in one pass, and then the doors are opened.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # Chambers of the current level, and their avoided rows / columns as
+    # sorted rows padded with _NONE
+    r0 = np.array([0], dtype=np.int64)
+    r1 = np.array([num_rows - 1], dtype=np.int64)
+    c0 = np.array([0], dtype=np.int64)
+    c1 = np.array([num_columns - 1], dtype=np.int64)
+    avoid_rows = np.full((1, 0), _NONE, dtype=np.int64)
+    avoid_cols = np.full((1, 0), _NONE, dtype=np.int64)
+
+    h_walls, v_walls, doors = [], [], []
+    while r0.size:
+        # Centers uniform over the inner rows / columns not avoided
+        rows_ok, center_row = _choose_center(rng, r0, r1, avoid_rows)
+        cols_ok, center_col = _choose_center(rng, c0, c1, avoid_cols)
+        divisible = rows_ok & cols_ok
+        r0, r1, c0, c1 = r0[divisible], r1[divisible], c0[divisible], c1[divisible]
+        avoid_rows, avoid_cols = avoid_rows[divisible], avoid_cols[divisible]
+        center_row, center_col = center_row[divisible], center_col[divisible]
+        if not r0.size:
+            break
+
+        h_walls.append((center_row, c0, c1))
+        v_walls.append((center_col, r0, r1))
+
+        # One of the four wall halves keeps its door closed
+        closed = rng.integers(0, 4, size=r0.size)
+        upper_col = rng.integers(c0, center_col - 1, endpoint=True)
+        lower_col = rng.integers(center_col + 1, c1, endpoint=True)
+        left_row = rng.integers(r0, center_row - 1, endpoint=True)
+        right_row = rng.integers(center_row + 1, r1, endpoint=True)
+        is_open = [closed != side for side in range(4)]
+        doors.append((center_row[is_open[0]], upper_col[is_open[0]]))
+        doors.append((center_row[is_open[1]], lower_col[is_open[1]]))
+        doors.append((left_row[is_open[2]], center_col[is_open[2]]))
+        doors.append((right_row[is_open[3]], center_col[is_open[3]]))
+
+        # Sub-chambers in the order of Chamber._build_sub_chambers
+        v_sides = (
+            (c0, center_col - 1, upper_col, is_open[0]),
+            # Chamber stops the lower half one column short of the boundary
+            (center_col + 1, c1 - 1, lower_col, is_open[1]),
+        )
+        h_sides = (
+            (r0, center_row - 1, left_row, is_open[2]),
+            (center_row + 1, r1, right_row, is_open[3]),
+        )
+        parts = []
+        for col_min, col_max, door_col, v_open in v_sides:
+            for row_min, row_max, door_row, h_open in h_sides:
+                keep = (row_max - row_min >= 3) & (col_max - col_min >= 3)
+                parts.append(
+                    (
+                        row_min[keep],
+                        row_max[keep],
+                        col_min[keep],
+                        col_max[keep],
+                        _inherit(
+                            avoid_rows[keep],
+                            row_min[keep],
+                            row_max[keep],
+                            door_row[keep],
+                            h_open[keep],
+                        ),
+                        _inherit(
+                            avoid_cols[keep],
+                            col_min[keep],
+                            col_max[keep],
+                            door_col[keep],
+                            v_open[keep],
+                        ),
+                    )
+                )
+        r0, r1, c0, c1 = (np.concatenate([p[i] for p in parts]) for i in range(4))
+        avoid_rows = _stack_padded([p[4] for p in parts])
+        avoid_cols = _stack_padded([p[5] for p in parts])
+
+    walls = _paint_segments(h_walls, num_rows, num_columns, axis=1)
+    walls |= _paint_segments(v_walls, num_rows, num_columns, axis=0)
+    for row_ids, col_ids in doors:
+        walls[row_ids, col_ids] = False
+    return walls
+
+
+def _choose_center(
+    rng: np.random.Generator, lo: np.ndarray, hi: np.ndarray, avoid: np.ndarray
+) -> (np.ndarray, np.ndarray):
+    """Pick an index strictly between lo and hi, skipping avoided ones."""
+    inside = (avoid > lo[:, None]) & (avoid < hi[:, None])
+    avoid = np.sort(np.where(inside, avoid, _NONE), axis=1)
+    num_candidates = hi - lo - 1 - inside.sum(axis=1)
+    ok = num_candidates > 0
+    picks = lo + 1 + rng.integers(0, np.maximum(num_candidates, 1))
+    # Walking the sorted avoided indices, each one at or below the pick
+    # pushes it one further
+    for j in range(avoid.shape[1]):
+        picks += avoid[:, j] <= picks
+    return ok, picks
+
+
+def _inherit(
+    avoid: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    door: np.ndarray,
+    door_open: np.ndarray,
+) -> np.ndarray:
+    """Avoided indices of a sub-chamber: the parent's within its bounds, plus
+    the door of the wall it borders when that door is open."""
+    kept = np.where((avoid >= lo[:, None]) & (avoid <= hi[:, None]), avoid, _NONE)
+    new = np.where(door_open, door, _NONE)[:, None]
+    # Duplicates would be skipped twice by _choose_center
+    new[(kept == new).any(axis=1)] = _NONE
+    avoid = np.sort(np.concatenate([kept, new], axis=1), axis=1)
+    width = int((avoid != _NONE).sum(axis=1).max(initial=0))
+    return avoid[:, :width]
+
+
+def _stack_padded(arrays: list[np.ndarray]) -> np.ndarray:
+    width = max(a.shape[1] for a in arrays)
+    return np.concatenate(
+        [
+            np.pad(a, ((0, 0), (0, width - a.shape[1])), constant_values=_NONE)
+            for a in arrays
+        ]
+    )
+
+
+def _paint_segments(
+    segments: list[(np.ndarray, np.ndarray, np.ndarray)],
+    num_rows: int,
+    num_columns: int,
+    axis: int,
+) -> np.ndarray:
+    """Bitmap of the (line, first, last) segments running along axis, with
+    a running sum over +1 / -1 marks at both ends of every segment.
+
+    Chambers are disjoint, so segments on one line never overlap: no two
+    segments share a first or a last cell, and the running sum stays 0 or 1.
+    """
+    shape = (num_rows, num_columns + 1) if axis == 1 else (num_rows + 1, num_columns)
+    marks = np.zeros(shape, dtype=np.int8)
+    if segments:
+        lines, firsts, lasts = (np.concatenate(s) for s in zip(*segments))
+        if axis == 1:
+            marks[lines, firsts] += 1
+            marks[lines, lasts + 1] -= 1
+        else:
+            marks[firsts, lines] += 1
+            marks[lasts + 1, lines] -= 1
+    if axis == 1:
+        # Every row sums back to 0 in its extra column, so one flat running
+        # sum covers all rows
+        painted = np.cumsum(marks.ravel(), dtype=np.int8).reshape(shape)
+    else:
+        painted = np.cumsum(marks, axis=0, dtype=np.int8)
+    return painted[:num_rows, :num_columns].view(np.bool_)
+
+
+def fast_recursive_space_division(
+    cells: list[list[SquareCell]] | ArrayCells,
+    seed: Seed = None,
+) -> Generator[Step, None, None]:
+    """Recursive division maze written to the board in one go.
+
+    The maze appears at once, there are no steps to show.
+    """
+    num_rows, num_columns = len(cells), len(cells[0])
+    rng = make_numpy_rng(seed)
+    walls = recursive_division_walls(num_rows, num_columns, rng)
+
+    if isinstance(cells, ArrayCells):
+        state = cells.state.reshape(num_rows, num_columns)
+        # Start and end stay where they are, as with make_barrier
+        keep = (state == COLOR_STATES[Colors.START]) | (
+            state == COLOR_STATES[Colors.END]
+        )
+        state[~keep] = COLOR_STATES[Colors.WHITE]
+        state[walls & ~keep] = BARRIER
+        cells.mark_all_dirty()
+    else:
+        for row, row_walls in zip(cells, walls):
+            for cell, is_wall in zip(row, row_walls.tolist()):
+                if cell.is_start() or cell.is_end():
+                    continue
+                if is_wall:
+                    cell.make_barrier()
+                else:
+                    cell.reset()
+    yield from update_all_neighbors(cells)
@@ -0,0 +1,301 @@
+from __future__ import annotations
+import random
+from collections.abc import Callable, Generator, Iterator
+from typing import Optional
+
+from .dfs_cell import ALL_WALLS, BOTTOM, LEFT, RIGHT, TOP, DFSMazeCell
+from .dfs_walls import _BITS, _CLEAR, _OPPOSITE, _inside_sides, _random_root, _steps
+from .dfs_walls import apply_maze_walls, barrier_bitmap
+from ..utils import Seed, Step, make_rng
+
+# Every generator below returns a perfect maze as one 4-bit wall mask per
+# cell, in the layout of dfs_maze_walls, going around the barriers of an
+# optional bitmap in the same layout.
+MazeWalls = Callable[[int, int, random.Random, Optional[bytes]], bytearray]
+
+
+def kruskal_maze_walls(
+    num_rows: int,
+    num_columns: int,
+    rng: random.Random | None = None,
+    barriers: bytes | None = None,
+) -> bytearray:
+    """Randomized Kruskal's algorithm.
+
+    Walls are knocked down in random order whenever they separate two
+    disjoint sets of cells, kept in a union-find with path halving. Regions
+    barriers cut apart get a maze each.
+    """
+    if rng is None:
+        rng = random.Random()
+    size = num_rows * num_columns
+    walls = bytearray([ALL_WALLS]) * size
+    inside = _inside_sides(num_rows, num_columns, barriers)
+
+    # Each inner wall once, from the cell on its left or top, packed as
+    # index * 2 + (1 for the bottom wall)
+    edges = [
+        index << 1 | is_bottom
+        for index in range(size)
+        for is_bottom, bit in ((0, RIGHT), (1, BOTTOM))
+        if inside[index] & bit
+    ]
+    rng.shuffle(edges)
+
+    parent = list(range(size))
+    num_sets = size
+    for edge in edges:
+        index = edge >> 1
+        bit, other = (BOTTOM, index + num_columns) if edge & 1 else (RIGHT, index + 1)
+        # Find both roots, halving the paths on the way
+        root = index
+        while parent[root] != root:
+            parent[root] = root = parent[parent[root]]
+        other_root = other
+        while parent[other_root] != other_root:
+            parent[other_root] = other_root = parent[parent[other_root]]
+        if root == other_root:
+            continue
+        parent[other_root] = root
+        walls[index] &= _CLEAR[bit]
+        walls[other] &= _CLEAR[_OPPOSITE[bit]]
+        num_sets -= 1
+        if num_sets == 1:
+            break
+    return walls
+
+
+def prim_maze_walls(
+    num_rows: int,
+    num_columns: int,
+    rng: random.Random | None = None,
+    barriers: bytes | None = None,
+) -> bytearray:
+    """Randomized Prim's algorithm.
+
+    The maze grows from a random cell through a random wall of its border
+    at a time, over the region of the cell when barriers cut the board.
+    """
+    if rng is None:
+        rng = random.Random()
+    size = num_rows * num_columns
+    walls = bytearray([ALL_WALLS]) * size
+    steps = _steps(num_columns)
+    inside = _inside_sides(num_rows, num_columns, barriers)
+    in_maze = bytearray(size)
+
+    index = _random_root(size, rng, barriers)
+    if index is None:
+        return walls
+    in_maze[index] = 1
+    border = [(index, bit) for bit in _BITS[inside[index]]]
+    while border:
+        # Swap the picked wall with the last one to pop it in O(1)
+        i = rng.randrange(len(border))
+        border[i], border[-1] = border[-1], border[i]
+        index, bit = border.pop()
+        other = index + steps[bit]
+        if in_maze[other]:
+            continue
+        walls[index] &= _CLEAR[bit]
+        walls[other] &= _CLEAR[_OPPOSITE[bit]]
+        in_maze[other] = 1
+        border.extend(
+            (other, side)
+            for side in _BITS[inside[other]]
+            if not in_maze[other + steps[side]]
+        )
+    return walls
+
+
+def wilson_maze_walls(
+    num_rows: int,
+    num_columns: int,
+    rng: random.Random | None = None,
+    barriers: bytes | None = None,
+) -> bytearray:
+    """Wilson's algorithm, drawing uniformly among all perfect mazes.
+
+    Random walks start from cells out of the maze until they hit it, and
+    their loop-erased path is added to the maze. Only the last exit of
+    every cell is kept, which erases the loops. When barriers cut the
+    board, walks only start in the region of the first cell, those from
+    other regions never hitting the maze.
+    """
+    if rng is None:
+        rng = random.Random()
+    size = num_rows * num_columns
+    walls = bytearray([ALL_WALLS]) * size
+    steps = _steps(num_columns)
+    inside = _inside_sides(num_rows, num_columns, barriers)
+    in_maze = bytearray(size)
+    exits = bytearray(size)
+
+    root = _random_root(size, rng, barriers)
+    if root is None:
+        return walls
+    in_maze[root] = 1
+    region = None
+    if barriers is not None and any(barriers):
+        region = _region(root, inside, steps)
+    random_ = rng.random
+    for start in range(size):
+        if region is not None and not region[start]:
+            continue
+        index = start
+        while not in_maze[index]:
+            bits = _BITS[inside[index]]
+            bit = bits[int(random_() * len(bits))]
+            exits[index] = bit
+            index += steps[bit]
+
+        index = start
+        while not in_maze[index]:
+            bit = exits[index]
+            in_maze[index] = 1
+            walls[index] &= _CLEAR[bit]
+            index += steps[bit]
+            walls[index] &= _CLEAR[_OPPOSITE[bit]]
+    return walls
+
+
+def _region(index: int, inside: bytes, steps: list[int]) -> bytearray:
+    """Cells reached from index through the sides of inside, as a bitmap."""
+    region = bytearray(len(inside))
+    region[index] = 1
+    stack = [index]
+    while stack:
+        index = stack.pop()
+        for bit in _BITS[inside[index]]:
+            other = index + steps[bit]
+            if not region[other]:
+                region[other] = 1
+                stack.append(other)
+    return region
+
+
+def eller_maze_rows(
+    num_rows: int,
+    num_columns: int,
+    rng: random.Random | None = None,
+    barriers: bytes | None = None,
+) -> Iterator[bytearray]:
+    """Eller's algorithm, yielding the wall masks of one row at a time.
+
+    Only the set of every cell of the current row is kept, so memory is
+    O(num_columns) however tall the maze is. Barriers belong to no set, -1,
+    and sets with only barriers below them end there: regions barriers cut
+    apart get a maze each, those a row never goes back up into may be
+    split in pieces.
+    """
+    if rng is None:
+        rng = random.Random()
+    random_ = rng.random
+
+    def _is_barrier(row_id: int, col_id: int) -> bool:
+        return barriers is not None and barriers[row_id * num_columns + col_id] != 0
+
+    # Set of every cell of the current row, and the cells of every set
+    sets = [-1 if _is_barrier(0, col_id) else col_id for col_id in range(num_columns)]
+    members = {col_id: [col_id] for col_id in range(num_columns) if sets[col_id] >= 0}
+    next_set = num_columns
+    # Cells of the current row joined to the row above
+    open_top = [False] * num_columns
+    for row_id in range(num_rows):
+        row = bytearray([ALL_WALLS]) * num_columns
+        for col_id in range(num_columns):
+            if open_top[col_id]:
+                row[col_id] &= _CLEAR[TOP]
+        is_last = row_id == num_rows - 1
+
+        # Join neighbors of different sets at random, all of them on the last row
+        for col_id in range(num_columns - 1):
+            left, right = sets[col_id], sets[col_id + 1]
+            if left == right or left < 0 or right < 0:
+                continue
+            if is_last or random_() < 0.5:
+                row[col_id] &= _CLEAR[RIGHT]
+                row[col_id + 1] &= _CLEAR[LEFT]
+                # Relabel the smaller set
+                if len(members[left]) < len(members[right]):
+                    left, right = right, left
+                for moved in members[right]:
+                    sets[moved] = left
+                members[left] += members.pop(right)
+
+        if is_last:
+            yield row
+            return
+
+        # Every set goes down at least once, into one of its cells at random
+        open_top = [False] * num_columns
+        for col_ids in members.values():
+            col_ids = [
+                col_id for col_id in col_ids if not _is_barrier(row_id + 1, col_id)
+            ]
+            if not col_ids:
+                continue
+            down = [col_id for col_id in col_ids if random_() < 0.5]
+            if not down:
+                down = [col_ids[int(random_() * len(col_ids))]]
+            for col_id in down:
+                open_top[col_id] = True
+                row[col_id] &= _CLEAR[BOTTOM]
+
+        # Cells not joined from above start sets of their own
+        members = {}
+        for col_id in range(num_columns):
+            if _is_barrier(row_id + 1, col_id):
+                sets[col_id] = -1
+                continue
+            if not open_top[col_id]:
+                sets[col_id] = next_set
+                next_set += 1
+            members.setdefault(sets[col_id], []).append(col_id)
+        yield row
+
+
+def eller_maze_walls(
+    num_rows: int,
+    num_columns: int,
+    rng: random.Random | None = None,
+    barriers: bytes | None = None,
+) -> bytearray:
+    """Rows of eller_maze_rows, joined into a whole board."""
+    walls = bytearray()
+    for row in eller_maze_rows(num_rows, num_columns, rng, barriers):
+        walls += row
+    return walls
+
+
+def _walls_generation(
+    maze_walls: MazeWalls, cells: list[list[DFSMazeCell]], seed: Seed
+) -> Generator[Step, None, None]:
+    rng = make_rng(seed)
+    walls = maze_walls(len(cells), len(cells[0]), rng, barrier_bitmap(cells))
+    apply_maze_walls(cells, walls)
+    yield from ()
+
+
+def kruskal_maze(
+    cells: list[list[DFSMazeCell]], seed: Seed = None
+) -> Generator[Step, None, None]:
+    return _walls_generation(kruskal_maze_walls, cells, seed)
+
+
+def prim_maze(
+    cells: list[list[DFSMazeCell]], seed: Seed = None
+) -> Generator[Step, None, None]:
+    return _walls_generation(prim_maze_walls, cells, seed)
+
+
+def wilson_maze(
+    cells: list[list[DFSMazeCell]], seed: Seed = None
+) -> Generator[Step, None, None]:
+    return _walls_generation(wilson_maze_walls, cells, seed)
+
+
+def eller_maze(
+    cells: list[list[DFSMazeCell]], seed: Seed = None
+) -> Generator[Step, None, None]:
+    return _walls_generation(eller_maze_walls, cells, seed)
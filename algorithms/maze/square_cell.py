@@ -1,19 +1,140 @@
 from __future__ import annotations
-import pygame
-from pygame import Surface
+from typing import TYPE_CHECKING
 
+from .connectivity import FOUR_NEIGHBORS, Connectivity
 from ..utils import Colors
 
+if TYPE_CHECKING:
+    import pygame
+    from pygame import Surface
+
+    from .neighbors import NeighborProvider
+
+
+class SearchEpoch:
+    """Generation counter shared by the cells of a board.
+
+    Cells remember the generation their search state (dist to visited)
+    belongs to, and clear it the first time a search of a newer generation
+    touches them. bump() therefore clears every cell at once.
+    """
+
+    def __init__(self) -> None:
+        self.value: int = 0
+
+    def bump(self) -> None:
+        self.value += 1
+
+
+class BoardEdits:
+    """Change counter of the barriers and terrain of a board, shared by its
+    cells like SearchEpoch.
+
+    Caches built from the board are kept in caches, by name, with the
+    version they are up to date with. Cells changed one at a time, by
+    make_barrier, reset, cost, and make_start and make_end over a barrier,
+    are also appended to the lists given to track, for the caches to update
+    around them. Changes to the whole board only bump the version, and the
+    caches start over.
+
+    A list holding more cells than its cache would rather build again is
+    emptied: the version then runs ahead of the cells in the list, which
+    tells the cache to start over as well.
+    """
+
+    def __init__(self) -> None:
+        self.version: int = 0
+        self.trackers: list[(list[SquareCell], int)] = []
+        self.caches: dict[str, object] = {}
+
+    def track(self, changed: list[SquareCell], limit: int) -> None:
+        """Report the cells changed from now on to changed, up to limit cells
+        between two updates of the cache."""
+        self.trackers.append((changed, limit))
+
+    def record(self, cell: SquareCell) -> None:
+        self.version += 1
+        for changed, limit in self.trackers:
+            if len(changed) < limit:
+                changed.append(cell)
+            else:
+                changed.clear()
+
+    def bump(self) -> None:
+        self.version += 1
+
+
+# Cost of entering a cell, plain ground costs MIN_COST
+MIN_COST: int = 1
+MAX_COST: int = 255
+
+# Color of an open cell of each cost, from white to dark brown
+_GROUND: (int, int, int) = (101, 67, 33)
+TERRAIN_COLORS: tuple[(int, int, int), ...] = tuple(
+    tuple(
+        round(white + (ground - white) * (cost - MIN_COST) / (MAX_COST - MIN_COST))
+        for white, ground in zip(Colors.WHITE.value, _GROUND)
+    )
+    for cost in range(MAX_COST + 1)
+)
+
+
+class Terrain:
+    """Cost of entering each cell of a board, shared by its cells.
+
+    Costs are kept in one flat bytearray, cell (r, c) at index
+    r * num_columns + c. max_cost is an upper bound on the costs, which the
+    bucket queue of Dial's algorithm is sized by.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.costs: bytearray = bytearray([MIN_COST]) * size
+        self.max_cost: int = MIN_COST
+
+    def set_cost(self, index: int, cost: int) -> None:
+        if not MIN_COST <= cost <= MAX_COST:
+            raise ValueError(f"Cost {cost} not in {MIN_COST}..{MAX_COST}!")
+        self.costs[index] = cost
+        if cost > self.max_cost:
+            self.max_cost = cost
+
+    def assign(self, costs: bytes) -> None:
+        """Replace every cost at once, in the order of costs."""
+        if len(costs) != len(self.costs):
+            raise ValueError(f"Expected {len(self.costs)} costs, got {len(costs)}")
+        if 0 in costs:
+            raise ValueError(f"Cost 0 not in {MIN_COST}..{MAX_COST}!")
+        self.costs[:] = costs
+        self.max_cost = max(self.costs, default=MIN_COST)
+
+    def clear(self) -> None:
+        self.costs[:] = bytes([MIN_COST]) * len(self.costs)
+        self.max_cost = MIN_COST
+
+    def is_uniform(self) -> bool:
+        """Whether every step costs the same, as on a plain grid."""
+        return self.max_cost == MIN_COST
+
 
 class SquareCell:
     # Pygame coordinate system has the origin in the top-left corner,
     # with the x-axis growing from left to right, and the y-axis from
     # top to bottom.
+
+    # Shared by every cell of a board once update_all_neighbors ran
+    neighbor_provider: NeighborProvider | None = None
+    # create_cells gives each board its own
+    search_epoch: SearchEpoch = SearchEpoch()
+    edits: BoardEdits = BoardEdits()
+    terrain: Terrain = Terrain(0)
+    connectivity: Connectivity = FOUR_NEIGHBORS
+
     def __init__(
         self, r: int, c: int, cell_size: int, num_rows: int, num_columns: int
     ) -> None:
         self.row_id: int = r
         self.col_id: int = c
+        self.index: int = r * num_columns + c
 
         self.x_coord: int = c * cell_size
         self.y_coord: int = r * cell_size
@@ -22,7 +143,9 @@ class SquareCell:
         self.num_rows: int = num_rows
         self.num_columns: int = num_columns
 
-        self.color: Colors = Colors.WHITE
+        self._color: Colors = Colors.WHITE
+        self.is_dirty: bool = False
+        self.dirty_cells: list[SquareCell] | None = None
 
         self.dist: float = float("inf")
         self.g_score: float = float("inf")
@@ -30,8 +153,69 @@ class SquareCell:
 
         self.prev: SquareCell | None = None
         self.visited: bool = False
+        self.stamp: int = self.search_epoch.value
+
+        self._neighbors: list[SquareCell] = []
+
+    @property
+    def neighbors(self) -> list[SquareCell]:
+        if self.neighbor_provider is not None:
+            neighbors = self.neighbor_provider.neighbors(self.row_id, self.col_id)
+        else:
+            neighbors = self._neighbors
+        # Searches reach cells through here, clear what an older search left
+        epoch = self.search_epoch.value
+        for neighbor in neighbors:
+            if neighbor.stamp != epoch:
+                neighbor.refresh_search_state()
+        return neighbors
+
+    @neighbors.setter
+    def neighbors(self, neighbors: list[SquareCell]) -> None:
+        self._neighbors = neighbors
 
-        self.neighbors: list[SquareCell] = []
+    @property
+    def cost(self) -> int:
+        """Cost of a step into this cell."""
+        return self.terrain.costs[self.index]
+
+    @cost.setter
+    def cost(self, cost: int) -> None:
+        if cost != self.terrain.costs[self.index]:
+            self.terrain.set_cost(self.index, cost)
+            self.mark_dirty()
+            self.edits.record(self)
+
+    @property
+    def color(self) -> Colors:
+        return self._color
+
+    @color.setter
+    def color(self, color: Colors) -> None:
+        if color is not self._color:
+            self._color = color
+            self.mark_dirty()
+
+    def refresh_search_state(self) -> None:
+        """Clear dist to visited if an older search generation left them."""
+        if self.stamp != self.search_epoch.value:
+            self.stamp = self.search_epoch.value
+            self.dist = float("inf")
+            self.g_score = float("inf")
+            self.h_score = float("inf")
+            self.prev = None
+            self.visited = False
+
+    def track_dirty(self, dirty_cells: list[SquareCell]) -> None:
+        """Report future changes to dirty_cells, starting with a full repaint."""
+        self.dirty_cells = dirty_cells
+        self.is_dirty = False
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        if not self.is_dirty and self.dirty_cells is not None:
+            self.is_dirty = True
+            self.dirty_cells.append(self)
 
     def is_start(self) -> bool:
         return self.color == Colors.START
@@ -43,21 +227,44 @@ class SquareCell:
         return self.color == Colors.BLACK
 
     def make_start(self) -> None:
+        self.refresh_search_state()
+        was_barrier = self.is_barrier()
         self.color = Colors.START
         self.dist = 0
         self.g_score = 0
         self.h_score = 0
+        if self.neighbor_provider is not None:
+            self.neighbor_provider.update(self)
+        if was_barrier:
+            self.edits.record(self)
 
     def make_end(self) -> None:
+        self.refresh_search_state()
+        was_barrier = self.is_barrier()
         self.color = Colors.END
+        if self.neighbor_provider is not None:
+            self.neighbor_provider.update(self)
+        if was_barrier:
+            self.edits.record(self)
 
     def make_barrier(self) -> None:
         if not self.is_start() and not self.is_end():
+            was_barrier = self.is_barrier()
             self.color = Colors.BLACK
+            if self.neighbor_provider is not None:
+                self.neighbor_provider.update(self)
+            if not was_barrier:
+                self.edits.record(self)
 
     def make_frontier(self) -> None:
         self.color = Colors.OPEN
 
+    def make_reverse_frontier(self) -> None:
+        self.color = Colors.OPEN_REVERSE
+
+    def make_reverse_examined(self) -> None:
+        self.color = Colors.CLOSE_REVERSE
+
     def make_path(self) -> None:
         self.color = Colors.PATH
 
@@ -66,19 +273,33 @@ class SquareCell:
 
     def reset(self) -> None:
         # if not self.is_start() and not self.is_end():
+        was_barrier = self.is_barrier()
         self.color = Colors.WHITE
-        self.dist = float("inf")
-        self.g_score = float("inf")
-        self.h_score = float("inf")
-        self.prev = None
-        self.visited = False
+        # Generations only grow, the search state is cleared on the next touch
+        self.stamp = -1
+        if self.neighbor_provider is not None:
+            self.neighbor_provider.update(self)
+        if was_barrier:
+            self.edits.record(self)
 
-    def draw(self, screen: Surface) -> None:
+    def draw(self, screen: Surface) -> pygame.Rect:
+        """Paint the cell and return the screen area that changed."""
+        import pygame
+
+        self.is_dirty = False
         rect = pygame.Rect(self.x_coord, self.y_coord, self.cell_size, self.cell_size)
-        pygame.draw.rect(screen, self.color.value, rect)
+        color = self._color.value
+        # Open cells show the cost of their terrain
+        if self._color is Colors.WHITE:
+            color = TERRAIN_COLORS[self.terrain.costs[self.index]]
+        pygame.draw.rect(screen, color, rect)
+        return rect
 
     def update_neighbors(self, cells: list[list[SquareCell]]) -> None:
-        """Populate accessible neighbors for the current cell."""
+        """Populate a materialized list of accessible neighbors.
+
+        Boards wired to a NeighborProvider derive neighbors on the fly instead.
+        """
         self.neighbors = []
 
         # Add left neighbor
@@ -0,0 +1,60 @@
+from __future__ import annotations
+from collections.abc import Generator
+
+import numpy as np
+
+from .array_cells import ArrayCells
+from .square_cell import MAX_COST, MIN_COST, SquareCell
+from .maze_functions import update_all_neighbors
+from ..utils import Seed, Step, make_numpy_rng
+
+# Cells per side of the squares random_terrain draws its noise on
+TERRAIN_SCALE: int = 12
+
+
+def terrain_costs(
+    num_rows: int, num_columns: int, rng: np.random.Generator | None = None
+) -> np.ndarray:
+    """uint8 cost map of rolling hills: value noise on squares of
+    TERRAIN_SCALE cells, interpolated bilinearly, costs growing
+    exponentially with the height so that plains stay cheap."""
+    if rng is None:
+        rng = np.random.default_rng()
+    lattice = rng.random(
+        (num_rows // TERRAIN_SCALE + 2, num_columns // TERRAIN_SCALE + 2)
+    )
+
+    rows = np.arange(num_rows) / TERRAIN_SCALE
+    cols = np.arange(num_columns) / TERRAIN_SCALE
+    r0, c0 = rows.astype(np.int64), cols.astype(np.int64)
+    # Smoothstep weights hide the lattice lines
+    dr, dc = rows - r0, cols - c0
+    dr, dc = (dr * dr * (3 - 2 * dr))[:, None], dc * dc * (3 - 2 * dc)
+    top = lattice[r0][:, c0] * (1 - dc) + lattice[r0][:, c0 + 1] * dc
+    bottom = lattice[r0 + 1][:, c0] * (1 - dc) + lattice[r0 + 1][:, c0 + 1] * dc
+    height = top * (1 - dr) + bottom * dr
+
+    low, high = height.min(), height.max()
+    height = (height - low) / (high - low) if high > low else height * 0
+    costs = np.rint(np.power(float(MAX_COST), height))
+    return np.clip(costs, MIN_COST, MAX_COST).astype(np.uint8)
+
+
+def random_terrain(
+    cells: list[list[SquareCell]] | ArrayCells, seed: Seed = None
+) -> Generator[Step, None, None]:
+    """Cover the board with weighted terrain, see terrain_costs.
+
+    The terrain appears at once, there are no steps to show.
+    """
+    num_rows, num_columns = len(cells), len(cells[0])
+    costs = terrain_costs(num_rows, num_columns, make_numpy_rng(seed))
+    cells[0][0].terrain.assign(costs.tobytes())
+    cells[0][0].edits.bump()
+    if isinstance(cells, ArrayCells):
+        cells.mark_all_dirty()
+    else:
+        for row in cells:
+            for cell in row:
+                cell.mark_dirty()
+    yield from update_all_neighbors(cells)
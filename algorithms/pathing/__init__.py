@@ -1,3 +1,20 @@
 from .astar import astar
+from .bidirectional import bidirectional_astar, bidirectional_dijkstra
 from .dfs import dfs
 from .dijkstra import dijkstra
+from .dijkstra_bucket import dijkstra_bucket
+from .heuristics import (
+    Heuristic,
+    manhattan,
+    octile,
+    euclidean,
+    chebyshev,
+    heuristics,
+    get_heuristic,
+    tightest_heuristic,
+)
+from .hpa_star import ClusterGraph, cluster_graph, hpa_star
+from .jps import jump_point_search
+from .junctions import JunctionGraph, junction_astar, junction_graph
+from .landmarks import Landmarks, alt, landmarks
+from .lpa_star import LPAStar, lpa_star
@@ -1,55 +1,74 @@
-from queue import PriorityQueue
-from collections.abc import Callable
+from collections.abc import Generator
+from heapq import heappop, heappush
 
 from .build_path import build_path
-from ..utils import set_caption, should_quit
+from .heuristics import Heuristic, tightest_heuristic
 from ..maze import SquareCell
+from ..stats import SearchStats
+from ..utils import Step
 
 
-def astar(start: SquareCell, end: SquareCell, draw: Callable[[], None]) -> bool:
+def astar(
+    start: SquareCell,
+    end: SquareCell,
+    stats: SearchStats | None = None,
+    heuristic: Heuristic | None = None,
+) -> Generator[Step, None, bool]:
     """A* Algorithm"""
-    set_caption(astar.__doc__)
-
-    q = PriorityQueue()
-    q_set = set()
-
+    # Unsynchronized binary heap with lazy deletion: an improved cell is pushed
+    # again and its outdated entries are skipped once the cell is closed.
+    # A step costs the terrain of the cell it enters times the weight of the
+    # step, see Connectivity. Without a heuristic, the tightest admissible one
+    # for the connectivity of the board is used.
+    costs = start.terrain.costs
+    step_weights = start.connectivity.step_weights
+    straight, diagonal = start.connectivity.weights
+    if heuristic is None:
+        heuristic = tightest_heuristic(start.connectivity)
     count = 0
-    q.put((start.dist, count, start))
-    q_set.add(start)
+    q = [(start.dist, count, start)]
+    if stats is not None:
+        stats.pushes += 1
 
-    while q_set:
-        should_quit()
-        curr = q.get()[-1]
-        q_set.remove(curr)
+    while q:
+        curr = heappop(q)[-1]
+        if stats is not None:
+            stats.pops += 1
+        if curr.visited:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+        curr.visited = True
 
         if curr == end:
-            build_path(curr, start, draw)
-            set_caption(astar.__doc__ + "- Path Found!")
+            yield from build_path(curr, start)
             return True
 
-        new_g_score = curr.g_score + 1
+        g_score = curr.g_score
         for neighbor in curr.neighbors:
+            step = costs[neighbor.index]
+            if step_weights is not None:
+                step *= step_weights[
+                    neighbor.row_id == curr.row_id or neighbor.col_id == curr.col_id
+                ]
+            new_g_score = g_score + step
             if neighbor.g_score > new_g_score:
                 neighbor.g_score = new_g_score
-                neighbor.h_score = compute_h_score(neighbor, end)
+                neighbor.h_score = heuristic(neighbor, end, straight, diagonal)
                 neighbor.dist = neighbor.g_score + neighbor.h_score
                 neighbor.prev = curr
 
-                if neighbor not in q_set:
-                    if neighbor != end:
-                        neighbor.make_frontier()
+                if neighbor != end:
+                    neighbor.make_frontier()
 
-                    count += 1
-                    q.put((neighbor.dist, count, neighbor))
-                    q_set.add(neighbor)
+                count += 1
+                heappush(q, (neighbor.dist, count, neighbor))
+                if stats is not None:
+                    stats.relaxations += 1
+                    stats.pushes += 1
 
         if curr != start:
             curr.make_examined()
 
-        draw()
-    set_caption(astar.__doc__ + "- No Path Found!")
+        yield curr.index, curr.color
     return False
-
-
-def compute_h_score(cell: SquareCell, end: SquareCell) -> int:
-    return abs(cell.row_id - end.row_id) + abs(cell.col_id - end.col_id)
@@ -0,0 +1,151 @@
+from collections.abc import Generator
+from heapq import heappop, heappush
+
+from .build_path import build_path
+from .heuristics import Heuristic, tightest_heuristic
+from ..maze import SquareCell
+from ..stats import SearchStats
+from ..utils import Step
+
+
+def bidirectional_dijkstra(
+    start: SquareCell, end: SquareCell, stats: SearchStats | None = None
+) -> Generator[Step, None, bool]:
+    """Bidirectional Dijkstra's Algorithm"""
+    return _bidirectional_search(start, end, None, stats)
+
+
+def bidirectional_astar(
+    start: SquareCell,
+    end: SquareCell,
+    stats: SearchStats | None = None,
+    heuristic: Heuristic | None = None,
+) -> Generator[Step, None, bool]:
+    """Bidirectional A* Algorithm"""
+    if heuristic is None:
+        heuristic = tightest_heuristic(start.connectivity)
+    return _bidirectional_search(start, end, heuristic, stats)
+
+
+def _bidirectional_search(
+    start: SquareCell,
+    end: SquareCell,
+    heuristic: Heuristic | None,
+    stats: SearchStats | None,
+) -> Generator[Step, None, bool]:
+    # The forward search keeps its state on the cells like the other
+    # algorithms, the backward one in dicts so both can share the board.
+    # Each step expands the side whose queue has the smaller key. A step
+    # costs the terrain of the cell it enters in the forward direction, times
+    # the weight of the step, see Connectivity.
+    costs = start.terrain.costs
+    step_weights = start.connectivity.step_weights
+    weights = start.connectivity.weights
+    count = 0
+    forward = [(start.dist, count, start)]
+    backward = [
+        (0 if heuristic is None else heuristic(end, start, *weights), count, end)
+    ]
+    backward_g_scores: dict[SquareCell, int] = {end: 0}
+    backward_closed: set[SquareCell] = set()
+    successors: dict[SquareCell, SquareCell] = {}
+    if stats is not None:
+        stats.pushes += 2
+
+    # Length of the best path seen so far and where its two halves meet
+    best, meet = float("inf"), None
+    while True:
+        while forward and forward[0][-1].visited:
+            heappop(forward)
+            if stats is not None:
+                stats.pops += 1
+                stats.stale_pops += 1
+        while backward and backward[0][-1] in backward_closed:
+            heappop(backward)
+            if stats is not None:
+                stats.pops += 1
+                stats.stale_pops += 1
+        if not forward or not backward:
+            break
+
+        # No unexplored path can beat best anymore: with Dijkstra the keys are
+        # distances from either end, with A* each key is a lower bound on its own
+        top_forward, top_backward = forward[0][0], backward[0][0]
+        if heuristic is None:
+            if top_forward + top_backward >= best:
+                break
+        elif max(top_forward, top_backward) >= best:
+            break
+
+        if top_forward <= top_backward:
+            curr = heappop(forward)[-1]
+            curr.visited = True
+            g_score = curr.g_score
+            for neighbor in curr.neighbors:
+                step = costs[neighbor.index]
+                if step_weights is not None:
+                    step *= step_weights[
+                        neighbor.row_id == curr.row_id or neighbor.col_id == curr.col_id
+                    ]
+                new_g_score = g_score + step
+                if neighbor.g_score > new_g_score:
+                    neighbor.g_score = new_g_score
+                    neighbor.dist = new_g_score
+                    if heuristic is not None:
+                        neighbor.h_score = heuristic(neighbor, end, *weights)
+                        neighbor.dist += neighbor.h_score
+                    neighbor.prev = curr
+                    if neighbor != end:
+                        neighbor.make_frontier()
+                    count += 1
+                    heappush(forward, (neighbor.dist, count, neighbor))
+                    if stats is not None:
+                        stats.relaxations += 1
+                        stats.pushes += 1
+
+                    other_g_score = backward_g_scores.get(neighbor)
+                    if other_g_score is not None and new_g_score + other_g_score < best:
+                        best, meet = new_g_score + other_g_score, neighbor
+            if curr != start:
+                curr.make_examined()
+        else:
+            curr = heappop(backward)[-1]
+            backward_closed.add(curr)
+            # Backward steps run from neighbor into curr
+            g_score = backward_g_scores[curr]
+            for neighbor in curr.neighbors:
+                step = costs[curr.index]
+                if step_weights is not None:
+                    step *= step_weights[
+                        neighbor.row_id == curr.row_id or neighbor.col_id == curr.col_id
+                    ]
+                new_g_score = g_score + step
+                if backward_g_scores.get(neighbor, float("inf")) > new_g_score:
+                    backward_g_scores[neighbor] = new_g_score
+                    successors[neighbor] = curr
+                    key = new_g_score
+                    if heuristic is not None:
+                        key += heuristic(neighbor, start, *weights)
+                    if neighbor != start:
+                        neighbor.make_reverse_frontier()
+                    count += 1
+                    heappush(backward, (key, count, neighbor))
+                    if stats is not None:
+                        stats.relaxations += 1
+                        stats.pushes += 1
+
+                    # Unreached cells hold an infinite g_score, which the
+                    # array backend stores as a large int
+                    reached = neighbor == start or neighbor.prev is not None
+                    if reached and neighbor.g_score + new_g_score < best:
+                        best, meet = neighbor.g_score + new_g_score, neighbor
+            if curr != end:
+                curr.make_reverse_examined()
+        if stats is not None:
+            stats.pops += 1
+        yield curr.index, curr.color
+
+    if meet is None:
+        return False
+    yield from build_path(meet, start, successors)
+    return True
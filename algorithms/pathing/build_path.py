@@ -1,10 +1,25 @@
-from typing import Callable
+from collections.abc import Generator
 
 from algorithms import SquareCell
+from algorithms.utils import Step
 
 
-def build_path(curr: SquareCell, start: SquareCell, draw: Callable[[], None]) -> None:
+def build_path(
+    curr: SquareCell,
+    start: SquareCell,
+    successors: dict[SquareCell, SquareCell] | None = None,
+) -> Generator[Step, None, None]:
+    """Paint the path found from start to curr.
+
+    For bidirectional searches curr is the cell where both halves met, and
+    successors leads from it to the end. That half is stitched onto the prev
+    links first, so the whole path can be followed back from the end.
+    """
+    if successors is not None:
+        while curr in successors:
+            successors[curr].prev = curr
+            curr = successors[curr]
     while curr.prev != start:
         curr = curr.prev
         curr.make_path()
-        draw()
+        yield curr.index, curr.color
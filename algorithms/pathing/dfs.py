@@ -1,41 +1,45 @@
-from collections.abc import Callable
+from collections.abc import Generator
 from collections import deque
 
 from algorithms.pathing.build_path import build_path
-from algorithms.utils import set_caption, should_quit
 from algorithms.maze import SquareCell
+from algorithms.stats import SearchStats
+from algorithms.utils import Step
 
 
-def dfs(start: SquareCell, end: SquareCell, draw: Callable[[], None]) -> bool:
+def dfs(
+    start: SquareCell, end: SquareCell, stats: SearchStats | None = None
+) -> Generator[Step, None, bool]:
     """Depth First Search Algorithm"""
-    set_caption(dfs.__doc__)
-
     stack = deque()
     stack.append(start)
+    if stats is not None:
+        stats.pushes += 1
     while stack:
-        should_quit()
         curr = stack.pop()
+        if stats is not None:
+            stats.pops += 1
 
         if curr == end:
-            build_path(curr, start, draw)
-            set_caption(dfs.__doc__ + "- Path Found!")
+            yield from build_path(curr, start)
             return True
 
         next_step_candidates = [c for c in curr.neighbors if not c.visited]
-        curr.neighbors = next_step_candidates
         if next_step_candidates:
-            neighbor = curr.neighbors.pop()
-            if curr.neighbors:
+            neighbor = next_step_candidates.pop()
+            if next_step_candidates:
                 stack.append(curr)
             neighbor.visited = True
             neighbor.prev = curr
             if neighbor != end and neighbor != start:
                 neighbor.make_frontier()
             stack.append(neighbor)
+            if stats is not None:
+                stats.relaxations += 1
+                stats.pushes += 1 + bool(next_step_candidates)
 
         if curr != start:
             curr.make_examined()
 
-        draw()
-    set_caption(dfs.__doc__ + "- No Path Found.")
+        yield curr.index, curr.color
     return False
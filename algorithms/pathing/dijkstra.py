@@ -1,37 +1,58 @@
-from collections.abc import Callable
+from collections.abc import Generator
 from heapq import heappop, heappush
 
 from algorithms.pathing.build_path import build_path
-from algorithms.utils import set_caption, should_quit
 from algorithms.maze import SquareCell
+from algorithms.stats import SearchStats
+from algorithms.utils import Step
 
 
-def dijkstra(start: SquareCell, end: SquareCell, draw: Callable[[], None]):
+def dijkstra(
+    start: SquareCell, end: SquareCell, stats: SearchStats | None = None
+) -> Generator[Step, None, bool]:
     """Dijkstra's Algorithm"""
-    set_caption(dijkstra.__doc__)
-
+    # A step costs the terrain of the cell it enters times the weight of the
+    # step, see Connectivity
+    costs = start.terrain.costs
+    step_weights = start.connectivity.step_weights
     q = [start]
+    if stats is not None:
+        stats.pushes += 1
     while q:
-        should_quit()
         curr = heappop(q)
+        if stats is not None:
+            stats.pops += 1
+        # Skip duplicates of a cell that was already examined
+        if curr.visited:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+        curr.visited = True
 
         # Completed, begin rebuilding the path
         if curr == end:
-            build_path(curr, start, draw)
-            set_caption(dijkstra.__doc__ + "- Path Found!")
+            yield from build_path(curr, start)
             return True
 
         # Update neighbor dist
-        new_dist = curr.dist + 1
+        dist = curr.dist
         for neighbor in curr.neighbors:
+            step = costs[neighbor.index]
+            if step_weights is not None:
+                step *= step_weights[
+                    neighbor.row_id == curr.row_id or neighbor.col_id == curr.col_id
+                ]
+            new_dist = dist + step
             if neighbor.dist > new_dist:
                 neighbor.dist = new_dist
                 neighbor.prev = curr
                 if neighbor != end:
                     neighbor.make_frontier()
                 heappush(q, neighbor)
+                if stats is not None:
+                    stats.relaxations += 1
+                    stats.pushes += 1
         if curr != start:
             curr.make_examined()
-        draw()
-    set_caption(dijkstra.__doc__ + "- No Path Found.")
+        yield curr.index, curr.color
     return False
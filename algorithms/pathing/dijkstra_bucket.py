@@ -0,0 +1,70 @@
+from collections.abc import Generator
+
+from algorithms.pathing.build_path import build_path
+from algorithms.maze import SquareCell, DIAGONAL, MAX_COST
+from algorithms.stats import SearchStats
+from algorithms.utils import Step
+
+# Largest cost of a single step between neighboring cells
+MAX_EDGE_WEIGHT = MAX_COST * DIAGONAL
+
+
+def dijkstra_bucket(
+    start: SquareCell, end: SquareCell, stats: SearchStats | None = None
+) -> Generator[Step, None, bool]:
+    """Dijkstra's Algorithm (Bucket Queue)"""
+    # Dial's algorithm: pending distances never span more than the largest
+    # step cost, so a circular array of buckets indexed by distance replaces
+    # the heap. A step costs the terrain of the cell it enters times the
+    # weight of the step, see Connectivity.
+    costs = start.terrain.costs
+    step_weights = start.connectivity.step_weights
+    max_step = start.terrain.max_cost * max(step_weights or (1,))
+    num_buckets = min(max_step, MAX_EDGE_WEIGHT) + 1
+    buckets: list[list[SquareCell]] = [[] for _ in range(num_buckets)]
+    buckets[0].append(start)
+    num_pending = 1
+    if stats is not None:
+        stats.pushes += 1
+    dist = start.dist
+    while num_pending:
+        bucket = buckets[dist % num_buckets]
+        while bucket:
+            curr = bucket.pop()
+            num_pending -= 1
+            if stats is not None:
+                stats.pops += 1
+            # Skip entries left behind by a later improvement
+            if curr.dist != dist:
+                if stats is not None:
+                    stats.stale_pops += 1
+                continue
+
+            # Completed, begin rebuilding the path
+            if curr == end:
+                yield from build_path(curr, start)
+                return True
+
+            # Update neighbor dist
+            for neighbor in curr.neighbors:
+                step = costs[neighbor.index]
+                if step_weights is not None:
+                    step *= step_weights[
+                        neighbor.row_id == curr.row_id or neighbor.col_id == curr.col_id
+                    ]
+                new_dist = dist + step
+                if neighbor.dist > new_dist:
+                    neighbor.dist = new_dist
+                    neighbor.prev = curr
+                    if neighbor != end:
+                        neighbor.make_frontier()
+                    buckets[new_dist % num_buckets].append(neighbor)
+                    num_pending += 1
+                    if stats is not None:
+                        stats.relaxations += 1
+                        stats.pushes += 1
+            if curr != start:
+                curr.make_examined()
+            yield curr.index, curr.color
+        dist += 1
+    return False
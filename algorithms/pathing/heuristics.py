@@ -0,0 +1,67 @@
+from collections.abc import Callable
+from math import hypot, sqrt
+
+from ..maze import Connectivity, SquareCell
+
+# Lower bound on the cost of a path from cell to target, given the weights of
+# a straight and a diagonal step. Every step costs at least its weight, the
+# terrain costing 1 or more.
+Heuristic = Callable[[SquareCell, SquareCell, int, int], int]
+
+
+def manhattan(
+    cell: SquareCell, target: SquareCell, straight: int, diagonal: int
+) -> int:
+    """Exact on open 4-connected boards, inadmissible with diagonal steps."""
+    return straight * (
+        abs(cell.row_id - target.row_id) + abs(cell.col_id - target.col_id)
+    )
+
+
+def octile(cell: SquareCell, target: SquareCell, straight: int, diagonal: int) -> int:
+    """Exact on open boards: diagonal steps as long as the shorter side goes,
+    straight ones for the rest. Manhattan when a diagonal takes two steps."""
+    d_row = abs(cell.row_id - target.row_id)
+    d_col = abs(cell.col_id - target.col_id)
+    return straight * max(d_row, d_col) + (diagonal - straight) * min(d_row, d_col)
+
+
+def euclidean(
+    cell: SquareCell, target: SquareCell, straight: int, diagonal: int
+) -> int:
+    """Straight line distance, in units no step is shorter than."""
+    scale = min(straight, diagonal / sqrt(2))
+    return int(scale * hypot(cell.row_id - target.row_id, cell.col_id - target.col_id))
+
+
+def chebyshev(
+    cell: SquareCell, target: SquareCell, straight: int, diagonal: int
+) -> int:
+    """Diagonal steps counted as straight ones."""
+    return straight * max(
+        abs(cell.row_id - target.row_id), abs(cell.col_id - target.col_id)
+    )
+
+
+heuristics: dict[str, Heuristic] = {
+    "manhattan": manhattan,
+    "octile": octile,
+    "euclidean": euclidean,
+    "chebyshev": chebyshev,
+}
+
+
+def get_heuristic(name: str) -> Heuristic:
+    _name = name.lower()
+    if _name in heuristics:
+        return heuristics[_name]
+    else:
+        raise ValueError(f"Heuristic {name} not found!")
+
+
+def tightest_heuristic(connectivity: Connectivity) -> Heuristic:
+    """Largest admissible heuristic for the moves of connectivity: octile with
+    diagonal steps, Manhattan, its equal without."""
+    if connectivity.diagonal:
+        return octile
+    return manhattan
@@ -0,0 +1,433 @@
+from __future__ import annotations
+
+from collections.abc import Generator, Iterable
+from heapq import heappop, heappush
+
+from .astar import astar
+from .heuristics import tightest_heuristic
+from ..maze import SquareCell
+from ..stats import SearchStats
+from ..utils import Step
+
+# Side of the square clusters the board is cut in
+CLUSTER_SIZE: int = 16
+# Entrances at least this wide get a transition at both ends, narrower ones
+# a single one in their middle
+WIDE_ENTRANCE: int = 6
+
+INF = float("inf")
+
+# (row, column) of a cluster
+Cluster = (int, int)
+# Neighbors of each cell of a cluster, by index, with the weight of the step
+Adjacency = dict[int, list[(int, int)]]
+
+
+class ClusterGraph:
+    """Abstract graph of Hierarchical Pathfinding A*.
+
+    The board is cut in square clusters. Where open cells face each other
+    across the border of two clusters, transitions pick a pair of them per
+    entrance. The graph links the two cells of every transition, and the
+    transitions of every cluster to each other, by their distance inside
+    the cluster. A search runs on this graph, then follows the cells inside
+    the clusters it crossed only.
+
+    Cells are found through their neighbors, from the cells searched from
+    and to. After cells change one at a time, only the clusters around them
+    are built again, see BoardEdits.
+    """
+
+    def __init__(self, cell: SquareCell, cluster_size: int = CLUSTER_SIZE) -> None:
+        self.cell: SquareCell = cell
+        self.cluster_size: int = cluster_size
+        self.num_rows: int = cell.num_rows
+        self.num_columns: int = cell.num_columns
+        self.num_cluster_rows: int = -(-self.num_rows // cluster_size)
+        self.num_cluster_columns: int = -(-self.num_columns // cluster_size)
+
+        # Changes of the board since the graph was last up to date
+        self.edits = cell.edits
+        self.version: int = self.edits.version
+        self.changed: list[SquareCell] = []
+        # Past this many changes the graph is built again anyway, see sync
+        self.edits.track(self.changed, self.num_rows * self.num_columns // 8)
+        self._clear()
+
+    def _clear(self) -> None:
+        # A step costs the terrain of the cell it enters times the weight of
+        # the step, see Connectivity
+        self.costs: bytearray = self.cell.terrain.costs
+        self.connectivity = self.cell.connectivity
+        self.step_weights: (int, int) | None = self.connectivity.step_weights
+
+        # Cells found so far, by index and by cluster
+        self.cells: dict[int, SquareCell] = {}
+        self.members: dict[Cluster, dict[int, SquareCell]] = {}
+        # Transitions of the border of a cluster with the one right of or
+        # below it, as (cell of the first, cell of the second) pairs
+        self.transitions: dict[(Cluster, Cluster), list[(SquareCell, SquareCell)]] = {}
+        # Edges by cell index: across transitions, and between the
+        # transitions of a cluster
+        self.inter: dict[int, dict[int, int]] = {}
+        self.intra: dict[Cluster, dict[int, dict[int, int]]] = {}
+        # Clusters to build again
+        self.dirty: set[Cluster] = set()
+
+    def sync(self, cells: Iterable[SquareCell] = ()) -> None:
+        """Bring the graph up to date with the board, and make sure it knows
+        cells."""
+        if self.edits.version != self.version:
+            changes = self.edits.version - self.version
+            if changes != len(self.changed) or changes > len(self.cells) // 8:
+                # The whole board, or much of it, changed
+                self._clear()
+            else:
+                for cell in self.changed:
+                    self._touch(cell)
+            self.changed.clear()
+            self.version = self.edits.version
+
+        for cell in cells:
+            if cell.index not in self.cells:
+                self._discover(cell)
+
+        if self.dirty:
+            self._build(self.dirty)
+            self.dirty = set()
+
+    def search(
+        self, start: SquareCell, end: SquareCell, stats: SearchStats | None = None
+    ) -> Generator[Step, None, bool]:
+        """Search the abstract graph, then follow the cells of the clusters
+        on the way."""
+        self.sync((start, end))
+        start_cluster = self._cluster(start.index)
+        end_cluster = self._cluster(end.index)
+
+        # Link start and end to the transitions of their clusters
+        adjacency = self._adjacency(start_cluster)
+        dist, _ = self._dijkstra(adjacency, start.index)
+        entrances = self._entrances(start_cluster)
+        start_edges = {i: d for i, d in dist.items() if i in entrances}
+        if end.index in dist:
+            start_edges[end.index] = dist[end.index]
+        if end_cluster != start_cluster:
+            adjacency = self._adjacency(end_cluster)
+        dist, _ = self._dijkstra(adjacency, end.index, reverse=True)
+        entrances = self._entrances(end_cluster)
+        end_edges = {i: d for i, d in dist.items() if i in entrances}
+
+        heuristic = tightest_heuristic(self.connectivity)
+        weights = self.connectivity.weights
+        count = 0
+        g_scores = {start.index: 0}
+        prevs = {start.index: None}
+        closed = set()
+        q = [(0, count, start.index)]
+        if stats is not None:
+            stats.pushes += 1
+
+        while q:
+            _, _, index = heappop(q)
+            if stats is not None:
+                stats.pops += 1
+            if index in closed:
+                if stats is not None:
+                    stats.stale_pops += 1
+                continue
+            closed.add(index)
+            if index == end.index:
+                break
+
+            curr = self.cells[index]
+            if index == start.index:
+                edges = list(start_edges.items())
+            else:
+                intra = self.intra.get(self._cluster(index), {})
+                edges = list(intra.get(index, {}).items())
+                if index in end_edges:
+                    edges.append((end.index, end_edges[index]))
+            edges.extend(self.inter.get(index, {}).items())
+
+            g_score = g_scores[index]
+            for neighbor_index, weight in edges:
+                new_g_score = g_score + weight
+                if new_g_score < g_scores.get(neighbor_index, INF):
+                    g_scores[neighbor_index] = new_g_score
+                    prevs[neighbor_index] = index
+                    neighbor = self.cells[neighbor_index]
+                    if neighbor != end:
+                        neighbor.make_frontier()
+
+                    count += 1
+                    dist = new_g_score + heuristic(neighbor, end, *weights)
+                    heappush(q, (dist, count, neighbor_index))
+                    if stats is not None:
+                        stats.relaxations += 1
+                        stats.pushes += 1
+
+            if curr != start:
+                curr.make_examined()
+            yield index, curr.color
+        else:
+            return False
+
+        # Transitions on the way, from start to end
+        nodes = []
+        index = end.index
+        while index is not None:
+            nodes.append(index)
+            index = prevs[index]
+        nodes.reverse()
+
+        # Follow the cells inside the clusters between them
+        path = [start]
+        adjacencies = {}
+        for source, target in zip(nodes, nodes[1:]):
+            cluster = self._cluster(source)
+            if cluster != self._cluster(target):
+                path.append(self.cells[target])
+                continue
+            if cluster not in adjacencies:
+                adjacencies[cluster] = self._adjacency(cluster)
+            _, prev = self._dijkstra(adjacencies[cluster], source, {target})
+            segment = []
+            index = target
+            while index != source:
+                segment.append(self.cells[index])
+                index = prev[index]
+            path.extend(reversed(segment))
+
+        # prev links and distances as the other algorithms leave them
+        g_score = 0
+        for prev_cell, cell in zip(path, path[1:]):
+            g_score += self._cost(prev_cell, cell)
+            cell.refresh_search_state()
+            cell.prev = prev_cell
+            cell.g_score = cell.dist = g_score
+        for cell in path[1:-1]:
+            cell.make_path()
+            yield cell.index, cell.color
+        return True
+
+    def _touch(self, cell: SquareCell) -> None:
+        """Mark the clusters a changed cell may affect: its own, and those of
+        the cells around it, whose steps into it or past its corners
+        changed."""
+        size = self.cluster_size
+        for row_id in range(cell.row_id - 1, cell.row_id + 2):
+            for col_id in range(cell.col_id - 1, cell.col_id + 2):
+                if 0 <= row_id < self.num_rows and 0 <= col_id < self.num_columns:
+                    self.dirty.add((row_id // size, col_id // size))
+        if not cell.is_barrier() and cell.index not in self.cells:
+            self._discover(cell)
+
+    def _discover(self, cell: SquareCell) -> None:
+        """Add the cells reachable from cell the graph does not know yet."""
+        self._add(cell)
+        stack = [cell]
+        while stack:
+            for neighbor in stack.pop().neighbors:
+                if neighbor.index not in self.cells:
+                    self._add(neighbor)
+                    stack.append(neighbor)
+
+    def _add(self, cell: SquareCell) -> None:
+        cluster = self._cluster(cell.index)
+        self.cells[cell.index] = cell
+        self.members.setdefault(cluster, {})[cell.index] = cell
+        self.dirty.add(cluster)
+
+    def _build(self, clusters: set[Cluster]) -> None:
+        """Build again the transitions around clusters, and the edges inside
+        every cluster whose transitions changed."""
+        rebuild = set(clusters)
+        borders = set()
+        for row, col in clusters:
+            for other in (
+                (row, col - 1),
+                (row, col + 1),
+                (row - 1, col),
+                (row + 1, col),
+            ):
+                if (
+                    0 <= other[0] < self.num_cluster_rows
+                    and 0 <= other[1] < self.num_cluster_columns
+                ):
+                    borders.add(
+                        ((row, col), other)
+                        if (row, col) < other
+                        else (other, (row, col))
+                    )
+
+        for border in borders:
+            transitions = self._border_transitions(*border)
+            for a, b in self.transitions.get(border, ()):
+                self.inter[a.index].pop(b.index, None)
+                self.inter[b.index].pop(a.index, None)
+            for a, b in transitions:
+                self.inter.setdefault(a.index, {})[b.index] = self._cost(a, b)
+                self.inter.setdefault(b.index, {})[a.index] = self._cost(b, a)
+            if transitions != self.transitions.get(border, []):
+                rebuild.update(border)
+            self.transitions[border] = transitions
+
+        for cluster in rebuild:
+            adjacency = self._adjacency(cluster)
+            entrances = self._entrances(cluster)
+            edges = {}
+            for index in entrances:
+                dist, _ = self._dijkstra(adjacency, index, entrances)
+                edges[index] = {
+                    i: d for i, d in dist.items() if i in entrances and i != index
+                }
+            self.intra[cluster] = edges
+
+    def _border_transitions(
+        self, first: Cluster, second: Cluster
+    ) -> list[(SquareCell, SquareCell)]:
+        """Transitions between first and the cluster second right of or below
+        it, one or two per run of open cells facing each other."""
+        size, num_columns = self.cluster_size, self.num_columns
+        if first[0] == second[0]:
+            col_id = second[1] * size
+            rows = range(first[0] * size, min((first[0] + 1) * size, self.num_rows))
+            pairs = [
+                (row_id * num_columns + col_id - 1, row_id * num_columns + col_id)
+                for row_id in rows
+            ]
+        else:
+            row_id = second[0] * size
+            columns = range(first[1] * size, min((first[1] + 1) * size, num_columns))
+            pairs = [
+                ((row_id - 1) * num_columns + col_id, row_id * num_columns + col_id)
+                for col_id in columns
+            ]
+
+        transitions = []
+        entrance = []
+        for i, j in pairs + [(-1, -1)]:
+            a, b = self.cells.get(i), self.cells.get(j)
+            crossing = (
+                a is not None
+                and b is not None
+                and not a.is_barrier()
+                and not b.is_barrier()
+                and b in a.neighbors
+            )
+            # An entrance runs along cells linked on both sides of the
+            # border, walls between cells may cut it
+            if entrance and not (
+                crossing
+                and a in entrance[-1][0].neighbors
+                and b in entrance[-1][1].neighbors
+            ):
+                if len(entrance) >= WIDE_ENTRANCE:
+                    transitions.extend((entrance[0], entrance[-1]))
+                else:
+                    transitions.append(entrance[len(entrance) // 2])
+                entrance = []
+            if crossing:
+                entrance.append((a, b))
+        return transitions
+
+    def _entrances(self, cluster: Cluster) -> set[int]:
+        """Indices of the cells of cluster in a transition."""
+        row, col = cluster
+        entrances = set()
+        for border, side in (
+            (((row, col - 1), cluster), 1),
+            ((cluster, (row, col + 1)), 0),
+            (((row - 1, col), cluster), 1),
+            ((cluster, (row + 1, col)), 0),
+        ):
+            for transition in self.transitions.get(border, ()):
+                entrances.add(transition[side].index)
+        return entrances
+
+    def _adjacency(self, cluster: Cluster) -> Adjacency:
+        """Steps between the open cells of cluster, which stay inside it."""
+        members = self.members.get(cluster, {})
+        step_weights = self.step_weights
+        adjacency = {}
+        for index, cell in members.items():
+            if cell.is_barrier():
+                continue
+            steps = []
+            for neighbor in cell.neighbors:
+                if neighbor.index not in members:
+                    continue
+                weight = 1
+                if step_weights is not None:
+                    weight = step_weights[
+                        neighbor.row_id == cell.row_id or neighbor.col_id == cell.col_id
+                    ]
+                steps.append((neighbor.index, weight))
+            adjacency[index] = steps
+        return adjacency
+
+    def _dijkstra(
+        self,
+        adjacency: Adjacency,
+        source: int,
+        targets: set[int] | None = None,
+        reverse: bool = False,
+    ) -> (dict[int, int], dict[int, int]):
+        """Distances inside a cluster from source, or to it with reverse, and
+        the previous cell of each on the way. Stops once targets are
+        reached."""
+        costs = self.costs
+        remaining = len(targets) if targets is not None else -1
+        dist = {source: 0}
+        prev = {}
+        done = set()
+        q = [(0, source)]
+        while q and remaining:
+            d, index = heappop(q)
+            if index in done:
+                continue
+            done.add(index)
+            if targets is not None and index in targets:
+                remaining -= 1
+            for neighbor, weight in adjacency.get(index, ()):
+                # Reversed, the step goes from neighbor into index
+                new_dist = d + weight * costs[index if reverse else neighbor]
+                if new_dist < dist.get(neighbor, INF):
+                    dist[neighbor] = new_dist
+                    prev[neighbor] = index
+                    heappush(q, (new_dist, neighbor))
+        return dist, prev
+
+    def _cluster(self, index: int) -> Cluster:
+        row_id, col_id = divmod(index, self.num_columns)
+        return row_id // self.cluster_size, col_id // self.cluster_size
+
+    def _cost(self, prev: SquareCell, cell: SquareCell) -> int:
+        """Cost of the step from prev into cell."""
+        step = self.costs[cell.index]
+        if self.step_weights is not None:
+            step *= self.step_weights[
+                prev.row_id == cell.row_id or prev.col_id == cell.col_id
+            ]
+        return step
+
+
+def cluster_graph(cell: SquareCell) -> ClusterGraph:
+    """ClusterGraph of the board of cell, built once and kept with the board."""
+    caches = cell.edits.caches
+    if "hpa*" not in caches:
+        caches["hpa*"] = ClusterGraph(cell)
+    return caches["hpa*"]
+
+
+def hpa_star(
+    start: SquareCell, end: SquareCell, stats: SearchStats | None = None
+) -> Generator[Step, None, bool]:
+    """Hierarchical Pathfinding A*"""
+    # Diagonal steps past the corners of barriers may link two clusters with
+    # no pair of cells facing each other, fall back to A*
+    connectivity = start.connectivity
+    if connectivity.diagonal and connectivity.corner_rule == "allow":
+        return (yield from astar(start, end, stats))
+    return (yield from cluster_graph(start).search(start, end, stats))
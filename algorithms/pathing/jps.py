@@ -0,0 +1,167 @@
+from __future__ import annotations
+from collections.abc import Generator, Iterator
+from heapq import heappop, heappush
+
+from .astar import astar
+from .build_path import build_path
+from .heuristics import tightest_heuristic
+from ..maze import ArrayCell, ArrayCells, SquareCell
+from ..maze.array_cells import BARRIER
+from ..stats import SearchStats
+from ..utils import Step
+
+
+def jump_point_search(
+    start: SquareCell, end: SquareCell, stats: SearchStats | None = None
+) -> Generator[Step, None, bool]:
+    """Jump Point Search"""
+    # A* over jump points only: straight runs of open cells are scanned
+    # without being pushed, and only cells where the optimal path may turn
+    # (those with a forced neighbor) enter the queue.
+    board = start.cells if isinstance(start, ArrayCell) else start.neighbor_provider
+    if board is None or not start.terrain.is_uniform() or start.connectivity.diagonal:
+        # DFS mazes block moves with walls between cells, not with barrier
+        # cells, and on weighted terrain paths of equal length differ in
+        # cost, so there is no symmetry to prune. Scans only run straight.
+        return (yield from astar(start, end, stats))
+    blocked, width = _padded_barriers(board)
+    heuristic = tightest_heuristic(start.connectivity)
+    straight, diagonal = start.connectivity.weights
+
+    count = 0
+    q = [(start.dist, count, start)]
+    if stats is not None:
+        stats.pushes += 1
+    while q:
+        curr = heappop(q)[-1]
+        if stats is not None:
+            stats.pops += 1
+        if curr.visited:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+        curr.visited = True
+
+        if curr == end:
+            _link_jumps(board, start, end)
+            yield from build_path(end, start)
+            return True
+
+        for row_id, col_id in _successors(blocked, width, curr, end):
+            jump_point = board.get_cell(row_id, col_id)
+            new_g_score = (
+                curr.g_score + abs(row_id - curr.row_id) + abs(col_id - curr.col_id)
+            )
+            if jump_point.g_score > new_g_score:
+                jump_point.g_score = new_g_score
+                jump_point.h_score = heuristic(jump_point, end, straight, diagonal)
+                jump_point.dist = jump_point.g_score + jump_point.h_score
+                jump_point.prev = curr
+
+                if jump_point != end:
+                    jump_point.make_frontier()
+
+                count += 1
+                heappush(q, (jump_point.dist, count, jump_point))
+                if stats is not None:
+                    stats.relaxations += 1
+                    stats.pushes += 1
+
+        if curr != start:
+            curr.make_examined()
+
+        yield curr.index, curr.color
+    return False
+
+
+def _padded_barriers(board) -> (bytearray, int):
+    """Copy the barrier bitmap inside a one-cell frame of barriers.
+
+    Scans then step through flat indices without any bounds checks.
+    Returns the bitmap and its row width.
+    """
+    num_rows, num_columns = board.num_rows, board.num_columns
+    if isinstance(board, ArrayCells):
+        barriers = (board.state == BARRIER).tobytes()
+    else:
+        barriers = board.barriers
+    width = num_columns + 2
+    padded = bytearray(b"\x01") * ((num_rows + 2) * width)
+    for row_id in range(num_rows):
+        offset = (row_id + 1) * width + 1
+        padded[offset : offset + num_columns] = barriers[
+            row_id * num_columns : (row_id + 1) * num_columns
+        ]
+    return padded, width
+
+
+def _successors(
+    blocked: bytearray, width: int, cell: SquareCell, end: SquareCell
+) -> Iterator[(int, int)]:
+    index = (cell.row_id + 1) * width + cell.col_id + 1
+    parent = cell.prev
+    if parent is None:
+        steps = (-1, 1, -width, width)
+    else:
+        # Keep going straight, or turn to either side, never back
+        d_col = _sign(cell.col_id - parent.col_id)
+        if d_col:
+            steps = (-width, width, d_col)
+        else:
+            steps = (-1, 1, _sign(cell.row_id - parent.row_id) * width)
+
+    target = (end.row_id + 1) * width + end.col_id + 1
+    for step in steps:
+        jump_point = _jump(blocked, width, index + step, step, target)
+        if jump_point is not None:
+            yield jump_point // width - 1, jump_point % width - 1
+
+
+def _jump(
+    blocked: bytearray, width: int, index: int, step: int, target: int
+) -> int | None:
+    """Scan from index in one direction until reaching a jump point."""
+    while not blocked[index]:
+        if index == target:
+            return index
+
+        if step == 1 or step == -1:
+            # An opening above or below that was walled off one step back
+            if (not blocked[index - width] and blocked[index - width - step]) or (
+                not blocked[index + width] and blocked[index + width - step]
+            ):
+                return index
+        else:
+            if (not blocked[index - 1] and blocked[index - 1 - step]) or (
+                not blocked[index + 1] and blocked[index + 1 - step]
+            ):
+                return index
+            # Moving vertically, stop wherever a horizontal scan finds a jump point
+            if (
+                _jump(blocked, width, index + 1, 1, target) is not None
+                or _jump(blocked, width, index - 1, -1, target) is not None
+            ):
+                return index
+
+        index += step
+    return None
+
+
+def _link_jumps(board, start: SquareCell, end: SquareCell) -> None:
+    """Point prev of every cell between consecutive jump points along the path."""
+    curr = end
+    while curr != start:
+        parent = curr.prev
+        d_row = _sign(parent.row_id - curr.row_id)
+        d_col = _sign(parent.col_id - curr.col_id)
+        row_id, col_id = curr.row_id, curr.col_id
+        while (row_id, col_id) != (parent.row_id, parent.col_id):
+            cell = board.get_cell(row_id, col_id)
+            row_id += d_row
+            col_id += d_col
+            cell.prev = board.get_cell(row_id, col_id)
+        curr = parent
+
+
+def _sign(x: int) -> int:
+    return (x > 0) - (x < 0)
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Generator
+from heapq import heappop, heappush
+
+from .build_path import build_path
+from .heuristics import tightest_heuristic
+from ..maze import SquareCell
+from ..stats import SearchStats
+from ..utils import Step
+
+INF = float("inf")
+
+# Two junctions, the corridor cells between them from the first to the
+# second, and the cost of walking it each way
+Corridor = (int, int, list[SquareCell], int, int)
+
+
+class JunctionGraph:
+    """Board with its corridors contracted.
+
+    Open cells with two open neighbors are corridor cells, the others are
+    junctions, dead ends included. Every corridor becomes one weighted edge
+    between the junctions at its ends, so that mazes, made mostly of
+    corridors, shrink to a few nodes.
+
+    Dead ends are then pruned: one with a single edge left is removed, and
+    so on, the junction it hung from becoming a dead end in turn once all its
+    other branches are gone. What is left is the part of the board with
+    loops, and each pruned junction keeps the edge towards it. A path never
+    goes into a pruned branch unless it starts or ends there, so a search
+    only visits what is left, and the branches from start and end up to it.
+    In a perfect maze nothing is left, and only these two branches are
+    visited.
+
+    Cells are found through their neighbors, one connected region at a time,
+    from the cells searched from and to.
+    """
+
+    def __init__(self, cell: SquareCell) -> None:
+        self.version: int = cell.edits.version
+        # A step costs the terrain of the cell it enters times the weight of
+        # the step, see Connectivity
+        self.costs: bytearray = cell.terrain.costs
+        self.connectivity = cell.connectivity
+        self.step_weights: (int, int) | None = self.connectivity.step_weights
+
+        # Junctions, by node id
+        self.nodes: list[SquareCell] = []
+        self.node_ids: dict[int, int] = {}
+        self.components: list[int] = []
+        self.adjacency: list[list[int]] = []
+        # Corridor leading towards what is left after pruning, -1 for
+        # junctions left and the last junction of each region
+        self.parents: list[int] = []
+        self.pruned: list[bool] = []
+
+        self.corridors: list[Corridor] = []
+        # Corridor and position in it of each corridor cell, by index
+        self.corridor_cells: dict[int, (int, int)] = {}
+        self.num_cells: int = 0
+
+    def __contains__(self, cell: SquareCell) -> bool:
+        return cell.index in self.node_ids or cell.index in self.corridor_cells
+
+    def add_region(self, cell: SquareCell) -> None:
+        """Contract the connected region of cell, then prune its dead ends."""
+        component = self.components[-1] + 1 if self.components else 0
+        first_node = len(self.nodes)
+        seen = {cell.index}
+        q = deque([cell])
+        while q:
+            curr = q.popleft()
+            neighbors = curr.neighbors
+            if len(neighbors) != 2:
+                self._add_node(curr, component)
+            for neighbor in neighbors:
+                if neighbor.index not in seen:
+                    seen.add(neighbor.index)
+                    q.append(neighbor)
+        self.num_cells += len(seen)
+        # A loop of corridor cells only
+        if len(self.nodes) == first_node:
+            self._add_node(cell, component)
+
+        for node_id in range(first_node, len(self.nodes)):
+            node = self.nodes[node_id]
+            for neighbor in node.neighbors:
+                if neighbor.index in self.corridor_cells:
+                    continue
+                if neighbor.index in self.node_ids:
+                    if self.node_ids[neighbor.index] > node_id:
+                        self._add_corridor(node, [], neighbor)
+                    continue
+                cells = []
+                prev, curr = node, neighbor
+                while curr.index not in self.node_ids:
+                    cells.append(curr)
+                    a, b = curr.neighbors
+                    prev, curr = curr, b if a == prev else a
+                self._add_corridor(node, cells, curr)
+
+        self._prune(range(first_node, len(self.nodes)))
+
+    def search(
+        self, start: SquareCell, end: SquareCell, stats: SearchStats | None = None
+    ) -> Generator[Step, None, bool]:
+        """A* over the junctions, then the corridors between them."""
+        for cell in (start, end):
+            if cell not in self:
+                self.add_region(cell)
+        start_links = self._links(start)
+        end_links = self._links(end)
+        if self.components[start_links[0][0]] != self.components[end_links[0][0]]:
+            return False
+
+        # Junctions of the pruned branches start and end are in
+        branches = set()
+        for node_id, _ in start_links + end_links:
+            while self.pruned[node_id] and node_id not in branches:
+                branches.add(node_id)
+                if self.parents[node_id] == -1:
+                    break
+                node_id = self._other(self.parents[node_id], node_id)
+
+        # start and end in corridors get the ids after the junctions, with
+        # edges to the junctions at the ends of their corridors: hops to them
+        # hold the cells on the way
+        start_id = self.node_ids.get(start.index, len(self.nodes))
+        end_id = self.node_ids.get(end.index, len(self.nodes) + 1)
+        start_hops = [
+            (node_id, cells + [self.nodes[node_id]])
+            for node_id, cells in start_links
+            if node_id != start_id
+        ]
+        end_hops = [
+            (node_id, cells[::-1] + [end])
+            for node_id, cells in end_links
+            if node_id != end_id
+        ]
+        start_corridor = self.corridor_cells.get(start.index)
+        end_corridor = self.corridor_cells.get(end.index)
+        if start_corridor and end_corridor and start_corridor[0] == end_corridor[0]:
+            cells = self.corridors[start_corridor[0]][2]
+            i, j = start_corridor[1], end_corridor[1]
+            start_hops.append(
+                (end_id, cells[i + 1 : j + 1] if i < j else cells[j:i][::-1])
+            )
+
+        heuristic = tightest_heuristic(self.connectivity)
+        weights = self.connectivity.weights
+        count = 0
+        g_scores = {start_id: 0}
+        prevs = {start_id: None}
+        closed = set()
+        q = [(0, count, start_id)]
+        if stats is not None:
+            stats.pushes += 1
+
+        while q:
+            _, _, node_id = heappop(q)
+            if stats is not None:
+                stats.pops += 1
+            if node_id in closed:
+                if stats is not None:
+                    stats.stale_pops += 1
+                continue
+            closed.add(node_id)
+            if node_id == end_id:
+                break
+
+            if node_id == len(self.nodes):
+                curr = start
+                edges = start_hops
+            else:
+                curr = self.nodes[node_id]
+                edges = []
+                for corridor_id in self.adjacency[node_id]:
+                    other = self._other(corridor_id, node_id)
+                    if other == node_id:
+                        continue
+                    if self.pruned[other] and other not in branches:
+                        continue
+                    edges.append((other, corridor_id))
+                edges.extend(
+                    (end_id, hop) for other, hop in end_hops if other == node_id
+                )
+
+            g_score = g_scores[node_id]
+            for neighbor_id, hop in edges:
+                if isinstance(hop, int):
+                    first, _, _, forward, backward = self.corridors[hop]
+                    weight = forward if node_id == first else backward
+                else:
+                    weight = self._walk_cost(curr, hop)
+                new_g_score = g_score + weight
+                if new_g_score < g_scores.get(neighbor_id, INF):
+                    g_scores[neighbor_id] = new_g_score
+                    prevs[neighbor_id] = node_id, hop
+                    neighbor = end if neighbor_id == end_id else self.nodes[neighbor_id]
+                    if neighbor != end:
+                        neighbor.make_frontier()
+
+                    count += 1
+                    dist = new_g_score + heuristic(neighbor, end, *weights)
+                    heappush(q, (dist, count, neighbor_id))
+                    if stats is not None:
+                        stats.relaxations += 1
+                        stats.pushes += 1
+
+            if curr != start:
+                curr.make_examined()
+            yield curr.index, curr.color
+        else:
+            return False
+
+        # Cells of the hops on the way, from end back to start
+        segments = []
+        node_id = end_id
+        while prevs[node_id] is not None:
+            prev_id, hop = prevs[node_id]
+            if isinstance(hop, int):
+                first, _, cells, _, _ = self.corridors[hop]
+                cells = cells if prev_id == first else cells[::-1]
+                hop = cells + [self.nodes[node_id]]
+            segments.append(hop)
+            node_id = prev_id
+
+        # prev links and distances as the other algorithms leave them
+        prev_cell, g_score = start, 0
+        for segment in reversed(segments):
+            for cell in segment:
+                g_score += self._cost(prev_cell, cell)
+                cell.refresh_search_state()
+                cell.prev = prev_cell
+                cell.g_score = cell.dist = g_score
+                prev_cell = cell
+        yield from build_path(end, start)
+        return True
+
+    def _add_node(self, cell: SquareCell, component: int) -> None:
+        self.node_ids[cell.index] = len(self.nodes)
+        self.nodes.append(cell)
+        self.components.append(component)
+        self.adjacency.append([])
+        self.parents.append(-1)
+        self.pruned.append(False)
+
+    def _add_corridor(
+        self, first: SquareCell, cells: list[SquareCell], last: SquareCell
+    ) -> None:
+        corridor_id = len(self.corridors)
+        first_id, last_id = self.node_ids[first.index], self.node_ids[last.index]
+        for position, cell in enumerate(cells):
+            self.corridor_cells[cell.index] = corridor_id, position
+        forward = self._walk_cost(first, cells + [last])
+        backward = self._walk_cost(last, cells[::-1] + [first])
+        self.corridors.append((first_id, last_id, cells, forward, backward))
+        self.adjacency[first_id].append(corridor_id)
+        self.adjacency[last_id].append(corridor_id)
+
+    def _prune(self, node_ids: range) -> None:
+        """Remove dead ends until the junctions left all have two edges or
+        more, each removed one keeping its last edge as parent."""
+        degrees = {node_id: len(self.adjacency[node_id]) for node_id in node_ids}
+        stack = [node_id for node_id, degree in degrees.items() if degree <= 1]
+        while stack:
+            node_id = stack.pop()
+            self.pruned[node_id] = True
+            for corridor_id in self.adjacency[node_id]:
+                other = self._other(corridor_id, node_id)
+                if not self.pruned[other]:
+                    self.parents[node_id] = corridor_id
+                    degrees[other] -= 1
+                    if degrees[other] == 1:
+                        stack.append(other)
+
+    def _links(self, cell: SquareCell) -> list[(int, list[SquareCell])]:
+        """Junctions a cell leads to without passing another one, with the
+        corridor cells on the way from it."""
+        if cell.index in self.node_ids:
+            return [(self.node_ids[cell.index], [])]
+        corridor_id, position = self.corridor_cells[cell.index]
+        first, last, cells, _, _ = self.corridors[corridor_id]
+        return [(first, cells[:position][::-1]), (last, cells[position + 1 :])]
+
+    def _other(self, corridor_id: int, node_id: int) -> int:
+        first, last, _, _, _ = self.corridors[corridor_id]
+        return last if first == node_id else first
+
+    def _walk_cost(self, cell: SquareCell, cells: list[SquareCell]) -> int:
+        """Cost of the steps from cell through cells."""
+        cost = 0
+        for next_cell in cells:
+            cost += self._cost(cell, next_cell)
+            cell = next_cell
+        return cost
+
+    def _cost(self, prev: SquareCell, cell: SquareCell) -> int:
+        """Cost of the step from prev into cell."""
+        step = self.costs[cell.index]
+        if self.step_weights is not None:
+            step *= self.step_weights[
+                prev.row_id == cell.row_id or prev.col_id == cell.col_id
+            ]
+        return step
+
+
+def junction_graph(cell: SquareCell) -> JunctionGraph:
+    """JunctionGraph of the board of cell, built again once the board
+    changed."""
+    caches = cell.edits.caches
+    graph = caches.get("junctions")
+    if graph is None or graph.version != cell.edits.version:
+        graph = caches["junctions"] = JunctionGraph(cell)
+    return graph
+
+
+def junction_astar(
+    start: SquareCell, end: SquareCell, stats: SearchStats | None = None
+) -> Generator[Step, None, bool]:
+    """A* on Junctions"""
+    return (yield from junction_graph(start).search(start, end, stats))
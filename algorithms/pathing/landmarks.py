@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Generator
+from heapq import heappop, heappush
+from operator import sub
+
+import numpy as np
+
+from .astar import astar
+from .heuristics import tightest_heuristic
+from ..maze import SquareCell
+from ..stats import SearchStats
+from ..utils import Step
+
+# Landmarks picked per board
+NUM_LANDMARKS: int = 8
+
+# Distance of the cells a landmark does not reach
+INF = int(np.iinfo(np.int32).max)
+# Largest bound returned, for distances to stay in int32 with the array
+# backend: cells that cannot reach the target have no finite distance anyway
+MAX_BOUND: int = INF // 2
+
+
+class Landmarks:
+    """Distances between every cell and a few landmarks, for an A* heuristic
+    (ALT: A*, landmarks and the triangle inequality).
+
+    A path from cell to target is at least as long as the distance from a
+    landmark to target, minus the one from the landmark to cell. Landmarks
+    are picked far from each other, each one the farthest cell from those
+    before, and the largest of their bounds beats Manhattan distance where
+    walls force detours, as in mazes.
+
+    Distances are kept in int32 arrays of num_cells x num_landmarks. Steps
+    into weighted terrain cost differently each way, distances to the
+    landmarks are kept as well then.
+    """
+
+    def __init__(self, cell: SquareCell, num_landmarks: int = NUM_LANDMARKS) -> None:
+        self.version: int = cell.edits.version
+        self.costs: bytearray = cell.terrain.costs
+        self.connectivity = cell.connectivity
+        self.step_weights: (int, int) | None = self.connectivity.step_weights
+        self.uniform: bool = cell.terrain.is_uniform()
+        self.base_heuristic = tightest_heuristic(self.connectivity)
+        size = cell.num_rows * cell.num_columns
+
+        self.landmarks: list[SquareCell] = []
+        self.from_landmarks: np.ndarray = np.full(
+            (size, num_landmarks), INF, dtype=np.int32
+        )
+        # Farthest point sampling from cell, over the cells it reaches
+        reached: dict[int, SquareCell] = {}
+        closest = np.array(self._distances(cell, found=reached), dtype=np.int64)
+        for i in range(num_landmarks):
+            farthest = np.where(closest < INF, closest, -1).argmax()
+            landmark = reached[int(farthest)]
+            self.landmarks.append(landmark)
+            dist = self._distances(landmark)
+            self.from_landmarks[:, i] = dist
+            closest = np.minimum(closest, dist)
+
+        self.to_landmarks: np.ndarray | None = None
+        if not self.uniform:
+            self.to_landmarks = np.full((size, num_landmarks), INF, dtype=np.int32)
+            for i, landmark in enumerate(self.landmarks):
+                self.to_landmarks[:, i] = self._distances(landmark, reverse=True)
+
+        self._target: int = -1
+        self._target_from: list[int] = []
+        self._target_to: list[int] = []
+
+    def __call__(
+        self, cell: SquareCell, target: SquareCell, straight: int, diagonal: int
+    ) -> int:
+        """Lower bound on the cost of a path from cell to target, a
+        Heuristic."""
+        if target.index != self._target:
+            self._target = target.index
+            self._target_from = self.from_landmarks[target.index].tolist()
+            if self.to_landmarks is not None:
+                self._target_to = self.to_landmarks[target.index].tolist()
+
+        cell_from = self.from_landmarks[cell.index].tolist()
+        if self.to_landmarks is None:
+            # Distances are the same both ways
+            bound = max(map(abs, map(sub, self._target_from, cell_from)))
+        else:
+            cell_to = self.to_landmarks[cell.index].tolist()
+            bound = max(
+                max(map(sub, self._target_from, cell_from)),
+                max(map(sub, cell_to, self._target_to)),
+            )
+        bound = max(bound, self.base_heuristic(cell, target, straight, diagonal))
+        return min(bound, MAX_BOUND)
+
+    def _distances(
+        self,
+        source: SquareCell,
+        reverse: bool = False,
+        found: dict[int, SquareCell] | None = None,
+    ) -> list[int]:
+        """Distances from source to every cell, or from every cell to it with
+        reverse, INF where unreachable.
+
+        Breadth first when every step costs 1, Dijkstra's algorithm
+        otherwise. Cells are reached through their neighbors, as the searches
+        reach them, and kept in found by index.
+        """
+        costs, step_weights = self.costs, self.step_weights
+        dist = [INF] * len(costs)
+        dist[source.index] = 0
+        cells = {} if found is None else found
+        cells[source.index] = source
+        if step_weights is None and self.uniform:
+            q = deque([source])
+            while q:
+                curr = q.popleft()
+                new_dist = dist[curr.index] + 1
+                for neighbor in curr.neighbors:
+                    if dist[neighbor.index] == INF:
+                        dist[neighbor.index] = new_dist
+                        cells[neighbor.index] = neighbor
+                        q.append(neighbor)
+            return dist
+
+        count = 0
+        q = [(0, count, source)]
+        while q:
+            d, _, curr = heappop(q)
+            if d > dist[curr.index]:
+                continue
+            for neighbor in curr.neighbors:
+                # Reversed, the step goes from neighbor into curr
+                step = costs[curr.index if reverse else neighbor.index]
+                if step_weights is not None:
+                    step *= step_weights[
+                        neighbor.row_id == curr.row_id or neighbor.col_id == curr.col_id
+                    ]
+                if d + step < dist[neighbor.index]:
+                    dist[neighbor.index] = d + step
+                    cells[neighbor.index] = neighbor
+                    count += 1
+                    heappush(q, (d + step, count, neighbor))
+        return dist
+
+
+def landmarks(cell: SquareCell, num_landmarks: int = NUM_LANDMARKS) -> Landmarks:
+    """Landmarks of the board of cell, picked again once the board changed."""
+    caches = cell.edits.caches
+    table = caches.get("alt")
+    if table is None or table.version != cell.edits.version:
+        table = caches["alt"] = Landmarks(cell, num_landmarks)
+    return table
+
+
+def alt(
+    start: SquareCell, end: SquareCell, stats: SearchStats | None = None
+) -> Generator[Step, None, bool]:
+    """A* with Landmarks"""
+    return (yield from astar(start, end, stats, landmarks(start)))
@@ -0,0 +1,205 @@
+from __future__ import annotations
+from collections.abc import Generator, Iterable
+from heapq import heappop, heappush
+
+from .heuristics import Heuristic, tightest_heuristic
+from ..maze import SquareCell
+from ..stats import SearchStats
+from ..utils import Colors, Step
+
+INF = float("inf")
+
+
+class LPAStar:
+    """Lifelong Planning A*: a shortest path from start to end, repaired
+    instead of searched again after cells change.
+
+    g is the distance of a cell when it was last expanded, rhs the distance
+    its neighbors give it now. Cells where the two differ are inconsistent
+    and queued, and a change only makes the cells around it inconsistent, so
+    a search after update_cells expands the part of the search tree the
+    change affects. Both are kept by cell index on the planner, not on the
+    cells, and survive new search generations of the board.
+    """
+
+    def __init__(
+        self,
+        start: SquareCell,
+        end: SquareCell,
+        stats: SearchStats | None = None,
+        heuristic: Heuristic | None = None,
+    ) -> None:
+        self.start: SquareCell = start
+        self.end: SquareCell = end
+        self.stats: SearchStats | None = stats
+        self.heuristic: Heuristic = heuristic or tightest_heuristic(start.connectivity)
+
+        # A step costs the terrain of the cell it enters times the weight of
+        # the step, see Connectivity
+        self.costs: bytearray = start.terrain.costs
+        self.step_weights: (int, int) | None = start.connectivity.step_weights
+        self.weights: (int, int) = start.connectivity.weights
+
+        size = start.num_rows * start.num_columns
+        self.g: list[float] = [INF] * size
+        self.rhs: list[float] = [INF] * size
+        # Binary heap with lazy deletion: the key each queued cell was last
+        # pushed with, outdated entries are skipped
+        self.q: list[(float, float, int, SquareCell)] = []
+        self.queued: dict[int, (float, float)] = {}
+        self.count: int = 0
+
+        # Cells of the last path found, from start to end
+        self.path: list[SquareCell] = []
+
+        self.rhs[start.index] = 0
+        self._queue(start)
+
+    def search(self) -> Generator[Step, None, bool]:
+        """Bring the distances up to date, then paint the path to end."""
+        # The old path shows as examined until the new one is painted
+        for cell in self.path:
+            if cell.color == Colors.PATH:
+                cell.make_examined()
+        self.path = []
+
+        yield from self._compute_shortest_path()
+        if self.g[self.end.index] == INF:
+            return False
+
+        # Follow the cheapest neighbors back from end
+        path = [self.end]
+        curr = self.end
+        while curr != self.start:
+            curr = min(
+                curr.neighbors, key=lambda p: self.g[p.index] + self._cost(p, path[-1])
+            )
+            path.append(curr)
+        path.reverse()
+        self.path = path
+
+        # prev links as the other algorithms leave them
+        for prev, cell in zip(path, path[1:]):
+            cell.refresh_search_state()
+            cell.prev = prev
+        for cell in path[1:-1]:
+            cell.make_path()
+            yield cell.index, cell.color
+        return True
+
+    def update_cells(self, changed: Iterable[SquareCell]) -> None:
+        """Account for cells that became, or stopped being, barriers, or
+        whose terrain changed.
+
+        Steps into a changed cell cost differently, and diagonal steps past
+        its corners may open or close, all between the cell and its
+        neighbors.
+        """
+        for cell in changed:
+            self._update_vertex(cell)
+            for neighbor in cell.neighbors:
+                self._update_vertex(neighbor)
+
+    def _compute_shortest_path(self) -> Generator[Step, None, None]:
+        g, rhs, stats = self.g, self.rhs, self.stats
+        end = self.end
+        while True:
+            top = self._top()
+            end_key = self._key(end)
+            if top is None or (top[:2] >= end_key and rhs[end.index] == g[end.index]):
+                return
+
+            curr = heappop(self.q)[-1]
+            del self.queued[curr.index]
+            if stats is not None:
+                stats.pops += 1
+            index = curr.index
+            if g[index] > rhs[index]:
+                # Overconsistent: settle it, and offer it to its neighbors
+                g[index] = rhs[index]
+                for neighbor in curr.neighbors:
+                    new_rhs = g[index] + self._cost(curr, neighbor)
+                    if new_rhs < rhs[neighbor.index] and neighbor != self.start:
+                        rhs[neighbor.index] = new_rhs
+                        if stats is not None:
+                            stats.relaxations += 1
+                        self._queue(neighbor)
+            else:
+                # Underconsistent: its distance went up, drop it and every
+                # neighbor counting on it
+                g[index] = INF
+                self._update_vertex(curr)
+                for neighbor in curr.neighbors:
+                    self._update_vertex(neighbor)
+
+            if curr != self.start and curr != end and not curr.is_barrier():
+                curr.make_examined()
+            yield curr.index, curr.color
+
+    def _update_vertex(self, cell: SquareCell) -> None:
+        """Recompute rhs of cell from its neighbors, and queue it if
+        inconsistent."""
+        index = cell.index
+        if cell != self.start:
+            if cell.is_barrier():
+                new_rhs = INF
+            else:
+                new_rhs = min(
+                    (self.g[p.index] + self._cost(p, cell) for p in cell.neighbors),
+                    default=INF,
+                )
+            if new_rhs != self.rhs[index]:
+                self.rhs[index] = new_rhs
+                if self.stats is not None:
+                    self.stats.relaxations += 1
+        self._queue(cell)
+
+    def _queue(self, cell: SquareCell) -> None:
+        index = cell.index
+        if self.g[index] == self.rhs[index]:
+            self.queued.pop(index, None)
+            return
+        key = self._key(cell)
+        if self.queued.get(index) == key:
+            return
+        self.queued[index] = key
+        self.count += 1
+        heappush(self.q, (*key, self.count, cell))
+        if self.stats is not None:
+            self.stats.pushes += 1
+        if cell != self.start and cell != self.end and not cell.is_barrier():
+            cell.make_frontier()
+
+    def _top(self) -> (float, float, int, SquareCell) | None:
+        """Smallest queue entry still up to date, dropping outdated ones."""
+        q = self.q
+        while q:
+            k1, k2, _, cell = q[0]
+            if self.queued.get(cell.index) == (k1, k2):
+                return q[0]
+            heappop(q)
+            if self.stats is not None:
+                self.stats.pops += 1
+                self.stats.stale_pops += 1
+        return None
+
+    def _key(self, cell: SquareCell) -> (float, float):
+        dist = min(self.g[cell.index], self.rhs[cell.index])
+        return dist + self.heuristic(cell, self.end, *self.weights), dist
+
+    def _cost(self, prev: SquareCell, cell: SquareCell) -> int:
+        """Cost of the step from prev into cell."""
+        step = self.costs[cell.index]
+        if self.step_weights is not None:
+            step *= self.step_weights[
+                prev.row_id == cell.row_id or prev.col_id == cell.col_id
+            ]
+        return step
+
+
+def lpa_star(
+    start: SquareCell, end: SquareCell, stats: SearchStats | None = None
+) -> Generator[Step, None, bool]:
+    """Lifelong Planning A*"""
+    # A first search from scratch, keep an LPAStar to replan after changes
+    return (yield from LPAStar(start, end, stats).search())
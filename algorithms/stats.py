@@ -0,0 +1,51 @@
+class SearchStats:
+    """Counters and timings of one search.
+
+    Pathing algorithms update the counters as they go when given a
+    SearchStats, AnimationScheduler splits the wall time between the
+    algorithm, drawing, event polling and waiting for the frame cap.
+    """
+
+    def __init__(self) -> None:
+        self.found: bool = False
+
+        # Queue (or stack) operations, stale pops being entries left behind by
+        # a later improvement or of cells already examined
+        self.pushes: int = 0
+        self.pops: int = 0
+        self.stale_pops: int = 0
+        # Times a cell got a better distance, and prev, from a neighbor
+        self.relaxations: int = 0
+
+        # Seconds
+        self.search_time: float = 0.0
+        self.draw_time: float = 0.0
+        self.poll_time: float = 0.0
+        self.wait_time: float = 0.0
+
+    @property
+    def expanded(self) -> int:
+        return self.pops - self.stale_pops
+
+    @property
+    def elapsed(self) -> float:
+        return self.search_time + self.draw_time + self.poll_time + self.wait_time
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Expansions per second of search time, drawing left out."""
+        if self.search_time == 0:
+            return 0.0
+        return self.expanded / self.search_time
+
+    def summary(self) -> str:
+        return (
+            f"{self.expanded} expanded at {self.nodes_per_second:,.0f} nodes/s, "
+            f"{self.pushes} pushes, {self.stale_pops} stale pops, "
+            f"{self.relaxations} relaxations; "
+            f"search {self.search_time:.2f}s, draw {self.draw_time:.2f}s, "
+            f"events {self.poll_time:.2f}s, frame cap {self.wait_time:.2f}s"
+        )
+
+    def __repr__(self) -> str:
+        return f"SearchStats(found={self.found}, {self.summary()})"
@@ -1,30 +1,97 @@
+import random
+from collections.abc import Callable, Generator
 from enum import Enum
+from typing import TYPE_CHECKING, TypeVar, Union
 
-import pygame
-from pygame import Color
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def set_caption(caption: str) -> None:
     """Set caption for pygame window"""
+    # pygame is imported lazily so that the algorithms can run headless
+    import pygame
+
     pygame.display.set_caption(caption)
 
 
 def should_quit() -> None:
     """Close pygame window if quit"""
+    import pygame
+
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             pygame.quit()
 
 
 class Colors(Enum):
-    BLACK = Color(0, 0, 0)
-    WHITE = Color(255, 255, 255)
-    GREY = Color(128, 128, 128)
+    BLACK = (0, 0, 0)
+    WHITE = (255, 255, 255)
+    GREY = (128, 128, 128)
+
+    START = (250, 157, 0)
+    END = (128, 0, 128)
+
+    OPEN = (70, 130, 180)
+    CLOSE = (92, 192, 219)
+
+    # Frontier and examined cells of the backward half of bidirectional searches
+    OPEN_REVERSE = (199, 80, 140)
+    CLOSE_REVERSE = (236, 160, 196)
+
+    PATH = (255, 255, 0)
+
+
+# Event yielded by every step of the pathing algorithms and barrier
+# generators: the index (row_id * num_columns + col_id) and new color of the
+# cell the step was about. Other cells the step repainted, such as a new
+# frontier, are reported by dirty tracking.
+Step = tuple[int, Colors]
+
+T = TypeVar("T")
+
+
+def run_steps(
+    steps: Generator[Step, None, T], on_step: Callable[[Step], None] | None = None
+) -> T:
+    """Drive a stepping algorithm to the end and return its result."""
+    while True:
+        try:
+            step = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        if on_step is not None:
+            on_step(step)
+
+
+# Randomness of a barrier generation: an int seed, or a random.Random or NumPy
+# Generator to draw from. None draws a fresh seed from the random module, so
+# random.seed still makes generations reproducible.
+Seed = Union[int, random.Random, "np.random.Generator", None]
+
+
+def resolve_seed(seed: Seed) -> int:
+    """Int seed standing for seed, to record and replay a generation."""
+    if seed is None:
+        return random.getrandbits(64)
+    if isinstance(seed, int):
+        return seed
+    if isinstance(seed, random.Random):
+        return seed.getrandbits(64)
+    return int(seed.integers(2**63))
+
+
+def make_rng(seed: Seed = None) -> random.Random:
+    """random.Random to draw the cells of a generation from."""
+    if isinstance(seed, random.Random):
+        return seed
+    return random.Random(resolve_seed(seed))
 
-    START = Color(250, 157, 0)
-    END = Color(128, 0, 128)
 
-    OPEN = Color(70, 130, 180)
-    CLOSE = Color(92, 192, 219)
+def make_numpy_rng(seed: Seed = None) -> "np.random.Generator":
+    """NumPy Generator for generations drawing in bulk."""
+    import numpy as np
 
-    PATH = Color(255, 255, 0)
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(resolve_seed(seed))
@@ -0,0 +1,119 @@
+from collections.abc import Callable, Generator
+from time import perf_counter
+from typing import TypeVar
+
+import pygame
+from pygame import KEYDOWN, K_s
+
+from algorithms.stats import SearchStats
+from algorithms.utils import Step, run_steps
+
+T = TypeVar("T")
+
+
+class AnimationScheduler:
+    """Play the steps of an algorithm as frames of Grid.draw.
+
+    A frame is drawn every steps_per_frame steps, and frames are capped at
+    fps (0 for no cap). In skip mode steps only advance the algorithm, and
+    the result is drawn once it returns. Pressing S during the animation
+    skips to the result.
+
+    Given a SearchStats, the time between frames is added to its search time,
+    and the time of every phase of a frame to draw, poll and wait time.
+    """
+
+    # Steps between two event polls while skipping
+    SKIP_POLL_STEPS: int = 4096
+
+    def __init__(
+        self,
+        draw_frame: Callable[[], None],
+        steps_per_frame: int = 1,
+        fps: int = 0,
+        skip: bool = False,
+        stats: SearchStats | None = None,
+    ) -> None:
+        self.draw_frame: Callable[[], None] = draw_frame
+        self.steps_per_frame: int = max(steps_per_frame, 1)
+        self.fps: int = fps
+        self.skip: bool = skip
+        self.stats: SearchStats | None = stats
+
+        self.steps: int = 0
+        self.clock: pygame.time.Clock = pygame.time.Clock()
+        # When the algorithm was last resumed after a frame
+        self._resumed: float = 0.0
+
+    @classmethod
+    def from_duration(
+        cls,
+        draw_frame: Callable[[], None],
+        duration: float,
+        steps_per_frame: int = 1,
+        fps: int = 0,
+        skip: bool = False,
+    ) -> "AnimationScheduler":
+        """Hold every frame for at least duration seconds, fps if duration is 0."""
+        if duration > 0:
+            fps = max(round(1 / duration), 1)
+        return cls(draw_frame, steps_per_frame, fps, skip)
+
+    def play(self, steps: Generator[Step, None, T]) -> T:
+        """Run the algorithm to its end and return its result."""
+        self._resumed = perf_counter()
+        result = run_steps(steps, self.advance)
+        self.flush()
+        return result
+
+    def advance(self, step: Step) -> None:
+        self.steps += 1
+        if self.skip:
+            if self.steps % self.SKIP_POLL_STEPS == 0:
+                if self.stats is None:
+                    self._poll_events()
+                else:
+                    self._timed_frame(draw=False)
+            return
+        if self.steps % self.steps_per_frame == 0:
+            if self.stats is None:
+                self._poll_events()
+                self.draw_frame()
+                self.clock.tick(self.fps)
+            else:
+                self._timed_frame(draw=True)
+
+    def flush(self) -> None:
+        """Draw the steps taken since the last frame."""
+        if self.stats is None:
+            self.draw_frame()
+            return
+        t0 = perf_counter()
+        self.stats.search_time += t0 - self._resumed
+        self.draw_frame()
+        self._resumed = perf_counter()
+        self.stats.draw_time += self._resumed - t0
+
+    def _timed_frame(self, draw: bool) -> None:
+        stats = self.stats
+        t0 = perf_counter()
+        stats.search_time += t0 - self._resumed
+        self._poll_events()
+        self._resumed = perf_counter()
+        stats.poll_time += self._resumed - t0
+        if not draw:
+            return
+        t0 = self._resumed
+        self.draw_frame()
+        t1 = perf_counter()
+        stats.draw_time += t1 - t0
+        self.clock.tick(self.fps)
+        self._resumed = perf_counter()
+        stats.wait_time += self._resumed - t1
+
+    def _poll_events(self) -> None:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+            elif event.type == KEYDOWN and event.key == K_s:
+                self.skip = True
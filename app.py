@@ -1,11 +1,20 @@
 import sys
 
 import pygame
-from pygame import Surface, KEYDOWN, K_SPACE, K_c, K_m
+from pygame import Surface, KEYDOWN, K_SPACE, K_DOWN, K_UP, K_c, K_i, K_m, K_r, K_t
+from pygame import K_1, K_9, K_d
+
+from algorithms.maze import Connectivity, SquareCell
 
 from grid import Grid
 from option_menu import create_menu, menu_loop
 
+# Animation pace, see AnimationScheduler
+FPS: int = 60
+STEPS_PER_FRAME: int = 8
+# Terrain costs painted after pressing 1 to 9
+BRUSH_COSTS: tuple[int, ...] = (1, 2, 4, 8, 16, 32, 64, 128, 255)
+
 
 def main(screen: Surface):
     menu = create_menu(screen)
@@ -15,12 +24,25 @@ def main(screen: Surface):
     cell_size = screen_width // num_columns
     num_rows = screen_height // cell_size
 
-    guide_1 = "Place a START and an END on the board and press SPACE to start."
-    guide_2 = "Press C to clear the screen, and M to go back to the Menu."
+    guide_1 = (
+        "Place a START and an END on the board and press SPACE to start. "
+        "UP and DOWN change the animation speed, S skips to the result, "
+        "I shows the search speed. T paints terrain, 1 to 9 set its cost. "
+        "D allows diagonal steps."
+    )
+    guide_2 = (
+        "Press C to clear the screen, R to clear the path and keep the maze, "
+        "and M to go back to the Menu. After Lifelong Planning A*, draw and "
+        "press SPACE to replan."
+    )
     pygame.display.set_caption(guide_1)
 
     algo_name, barrier_name = menu_loop(menu, screen)
     grid = Grid.create(algo_name, barrier_name, num_rows, num_columns, cell_size)
+    grid.steps_per_frame = STEPS_PER_FRAME
+    grid.fps = FPS
+    brush_cost = BRUSH_COSTS[3]
+    num_neighbors = 4
     solved = False
     while True:
         grid.draw(screen)
@@ -32,25 +54,63 @@ def main(screen: Surface):
                 pos = pygame.mouse.get_pos()
                 grid.process_click(pos)
             if event.type == KEYDOWN:
-                # Start visualization
-                if event.key == K_SPACE and grid.is_ready() and not solved:
-                    # Draw maze
-                    grid.generate_barriers(screen)
+                # Start visualization, again after Lifelong Planning A* to
+                # repair its path around the cells changed since
+                replan = grid.planner is not None
+                if event.key == K_SPACE and grid.is_ready() and (not solved or replan):
+                    # Draw maze, once per board
+                    if not grid.has_barriers:
+                        grid.generate_barriers(screen)
                     # Solve path finding
-                    solved = grid.find_path(screen)
-                    pygame.display.set_caption(guide_2)
+                    solved = grid.find_path(screen).found
+                    if not grid.show_stats:
+                        pygame.display.set_caption(guide_2)
                 # Clear
                 if event.key == K_c:
                     grid.reset()
                     solved = False
+                # Clear the path, keep the maze
+                if event.key == K_r:
+                    grid.clear_search()
+                    solved = False
+                # Animation speed, in algorithm steps per frame
+                if event.key == K_UP:
+                    grid.steps_per_frame *= 2
+                if event.key == K_DOWN:
+                    grid.steps_per_frame = max(grid.steps_per_frame // 2, 1)
+                # Search speed and statistics in the window title
+                if event.key == K_i:
+                    grid.show_stats = not grid.show_stats
+                # Clicks paint terrain instead of barriers
+                if event.key == K_t:
+                    grid.brush_cost = None if grid.brush_cost else brush_cost
+                if K_1 <= event.key <= K_9:
+                    brush_cost = BRUSH_COSTS[event.key - K_1]
+                    grid.brush_cost = brush_cost
+                # Diagonal steps, on boards without walls between cells
+                if event.key == K_d and grid.barrier_spec.cell_type is SquareCell:
+                    num_neighbors = 8 if num_neighbors == 4 else 4
+                    grid.set_connectivity(Connectivity(num_neighbors))
                 # Back to menu
                 if event.key == K_m:
                     algo_name, barrier_name = menu_loop(menu, screen)
+                    steps_per_frame = grid.steps_per_frame
+                    show_stats = grid.show_stats
+                    painting = grid.brush_cost
                     grid = Grid.create(
                         algo_name, barrier_name, num_rows, num_columns, cell_size
                     )
+                    if grid.barrier_spec.cell_type is SquareCell:
+                        grid.set_connectivity(Connectivity(num_neighbors))
+                    grid.steps_per_frame = steps_per_frame
+                    grid.show_stats = show_stats
+                    grid.brush_cost = painting
+                    grid.fps = FPS
                     solved = False
 
+                # The statistics of a search stay in the title until the next key
+                if event.key == K_SPACE and grid.show_stats:
+                    continue
                 pygame.display.set_caption(guide_1)
 
 
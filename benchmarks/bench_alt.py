@@ -0,0 +1,81 @@
+"""Compare A* with landmarks (ALT) with plain A* on mazes.
+
+The first ALT search of a board picks its landmarks and computes their
+distances, later searches reuse them. Random queries then run with both
+algorithms, reporting their time and the nodes they expanded; both find
+shortest paths, whose costs must agree.
+
+Run from the repository root:
+    python -m benchmarks.bench_alt
+"""
+
+import random
+from time import perf_counter
+
+from algorithms import PathingAlgorithm, SearchStats, alt, astar, landmarks
+from algorithms.maze import SquareCell
+from algorithms.utils import Colors, run_steps
+from benchmarks.common import build_board
+
+NUM_ROWS, NUM_COLUMNS = 300, 300
+BOARDS = ["dfs_fast", "recursive_division_maze_fast", "random"]
+NUM_QUERIES = 10
+BACKEND = "objects"
+SEED = 0
+
+
+def main() -> None:
+    for barrier_name in BOARDS:
+        cells, start, end = build_board(
+            barrier_name, NUM_ROWS, NUM_COLUMNS, SEED, BACKEND
+        )
+        rng = random.Random(SEED)
+        t0 = perf_counter()
+        table = landmarks(start)
+        print(
+            f"{barrier_name}: {len(table.landmarks)} landmarks,"
+            f" {table.from_landmarks.nbytes / 2**20:.1f} MiB,"
+            f" computed in {perf_counter() - t0:.2f} s"
+        )
+
+        print(
+            f"{'query':>6} {'alt s':>8} {'a* s':>8} {'speedup':>8}"
+            f" {'alt exp':>9} {'a* exp':>9} {'agree':>6}"
+        )
+        open_cells = [cell for row in cells for cell in row if not cell.is_barrier()]
+        for i in range(NUM_QUERIES):
+            source, target = rng.sample(open_cells, 2)
+            alt_time, alt_expanded, alt_cost = _search(alt, cells, source, target)
+            astar_time, astar_expanded, astar_cost = _search(
+                astar, cells, source, target
+            )
+            print(
+                f"{i:>6} {alt_time:>8.3f} {astar_time:>8.3f}"
+                f" {astar_time / alt_time:>7.1f}x"
+                f" {alt_expanded:>9} {astar_expanded:>9}"
+                f" {str(alt_cost == astar_cost):>6}"
+            )
+        print()
+
+
+def _search(
+    pathing: PathingAlgorithm,
+    cells: list[list[SquareCell]],
+    start: SquareCell,
+    end: SquareCell,
+) -> (float, int, int):
+    """Time, nodes expanded and path cost of a search, cost 0 if none."""
+    # Same board, fresh search state
+    cells[0][0].search_epoch.bump()
+    start.make_start()
+    end.make_end()
+    stats = SearchStats()
+    t0 = perf_counter()
+    found = run_steps(pathing(start, end, stats))
+    elapsed = perf_counter() - t0
+    start.color = end.color = Colors.WHITE
+    return elapsed, stats.pops - stats.stale_pops, end.g_score if found else 0
+
+
+if __name__ == "__main__":
+    main()
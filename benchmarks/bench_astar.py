@@ -0,0 +1,83 @@
+"""Compare A* node-expansion throughput before and after the heapq rewrite.
+
+Run from the repository root:
+    python -m benchmarks.bench_astar
+"""
+
+from collections.abc import Generator
+from queue import PriorityQueue
+
+from algorithms.maze import FOUR_NEIGHBORS, SquareCell
+from algorithms.pathing import astar
+from algorithms.pathing import heuristics
+from algorithms.pathing.build_path import build_path
+from algorithms.utils import Step
+from benchmarks.common import build_board, time_search
+
+# (barrier name, num_rows, num_columns)
+BOARDS = [("diy", 100, 150), ("diy", 200, 300), ("dfs", 100, 150), ("dfs", 200, 300)]
+SEED = 0
+
+
+def astar_priority_queue(
+    start: SquareCell, end: SquareCell
+) -> Generator[Step, None, bool]:
+    """A* as it was before, on queue.PriorityQueue with a parallel q_set."""
+    manhattan = heuristics["manhattan"]
+    weights = FOUR_NEIGHBORS.weights
+    q = PriorityQueue()
+    q_set = set()
+
+    count = 0
+    q.put((start.dist, count, start))
+    q_set.add(start)
+
+    while q_set:
+        curr = q.get()[-1]
+        q_set.remove(curr)
+
+        if curr == end:
+            yield from build_path(curr, start)
+            return True
+
+        new_g_score = curr.g_score + 1
+        for neighbor in curr.neighbors:
+            if neighbor.g_score > new_g_score:
+                neighbor.g_score = new_g_score
+                neighbor.h_score = manhattan(neighbor, end, *weights)
+                neighbor.dist = neighbor.g_score + neighbor.h_score
+                neighbor.prev = curr
+
+                if neighbor not in q_set:
+                    if neighbor != end:
+                        neighbor.make_frontier()
+
+                    count += 1
+                    q.put((neighbor.dist, count, neighbor))
+                    q_set.add(neighbor)
+
+        if curr != start:
+            curr.make_examined()
+
+        yield curr.index, curr.color
+    return False
+
+
+def main() -> None:
+    print(f"{'board':>14} {'impl':>14} {'expanded':>9} {'time s':>7} {'nodes/s':>9}")
+    for barrier_name, num_rows, num_columns in BOARDS:
+        board = f"{barrier_name} {num_rows}x{num_columns}"
+        for name, pathing in [
+            ("PriorityQueue", astar_priority_queue),
+            ("heapq", astar),
+        ]:
+            _, start, end = build_board(barrier_name, num_rows, num_columns, SEED)
+            expanded, elapsed = time_search(pathing, start, end)
+            print(
+                f"{board:>14} {name:>14} {expanded:>9} {elapsed:>7.3f}"
+                f" {expanded / elapsed:>9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
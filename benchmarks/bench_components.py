@@ -0,0 +1,73 @@
+"""Compare answering a query with end walled off through the connected
+components of the board with searching it.
+
+The end cell, in the bottom right corner, is walled off by the barriers
+left of and above it: A* and Dijkstra's algorithm examine every cell they
+reach before giving up, while the labels of the components answer at once.
+The labels are built once per board, then single barriers are added at
+random and the labels follow, splitting the regions they cut.
+
+Run from the repository root:
+    python -m benchmarks.bench_components
+"""
+
+import random
+from time import perf_counter
+
+from algorithms import SearchStats, astar, connected_components, dijkstra
+from algorithms.utils import run_steps
+from benchmarks.common import build_board
+
+NUM_ROWS, NUM_COLUMNS = 1000, 1000
+BOARDS = ["random", "recursive_division_maze_fast"]
+NUM_EDITS = 100
+BACKEND = "objects"
+SEED = 0
+
+
+def main() -> None:
+    for barrier_name in BOARDS:
+        cells, start, end = build_board(
+            barrier_name, NUM_ROWS, NUM_COLUMNS, SEED, BACKEND
+        )
+        cells[-1][-2].make_barrier()
+        cells[-2][-1].make_barrier()
+
+        t0 = perf_counter()
+        components = connected_components(cells)
+        label_time = perf_counter() - t0
+        num_regions = len(set(components.labels.tolist())) - 1
+        print(
+            f"{barrier_name}: {num_regions} regions," f" labelled in {label_time:.3f} s"
+        )
+
+        t0 = perf_counter()
+        connected = components.connected(start, end)
+        print(f"{'components':>12} {perf_counter() - t0:>10.6f} s   found={connected}")
+        for name, pathing in (("a*", astar), ("dijkstra", dijkstra)):
+            # Same board, fresh search state
+            cells[0][0].search_epoch.bump()
+            start.make_start()
+            end.make_end()
+            stats = SearchStats()
+            t0 = perf_counter()
+            found = run_steps(pathing(start, end, stats))
+            print(
+                f"{name:>12} {perf_counter() - t0:>10.3f} s   found={found},"
+                f" {stats.expanded} expanded"
+            )
+
+        # Single barriers, each followed by a query
+        rng = random.Random(SEED)
+        open_cells = [cell for row in cells for cell in row if not cell.is_barrier()]
+        t0 = perf_counter()
+        for cell in rng.sample(open_cells, NUM_EDITS):
+            if cell != start and cell != end:
+                cell.make_barrier()
+                components.connected(start, end)
+        elapsed = perf_counter() - t0
+        print(f"labels after a single barrier: {elapsed / NUM_EDITS * 1000:.2f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
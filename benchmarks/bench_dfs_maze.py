@@ -0,0 +1,64 @@
+"""Compare the DFSMazeCell and wall mask versions of the DFS maze generation,
+and time the other wall mask generations.
+
+Run from the repository root:
+    python -m benchmarks.bench_dfs_maze
+"""
+
+import random
+import tracemalloc
+from time import perf_counter
+
+from algorithms import get_barrier
+from algorithms.maze import DFSMazeCell, create_cells, dfs_maze_walls
+from algorithms.maze import eller_maze_walls, kruskal_maze_walls
+from algorithms.maze import prim_maze_walls, wilson_maze_walls
+from algorithms.utils import run_steps
+
+SIZES = [(100, 150), (300, 450)]
+BARRIERS = ["dfs", "dfs_fast"]
+# Only the wall masks past this size
+WALL_SIZES = [(1000, 1000)]
+MAZE_WALLS = [
+    dfs_maze_walls,
+    kruskal_maze_walls,
+    prim_maze_walls,
+    wilson_maze_walls,
+    eller_maze_walls,
+]
+SEED = 0
+
+
+def run(barrier_name: str, num_rows: int, num_columns: int) -> (float, float):
+    cells = create_cells(DFSMazeCell, num_rows, num_columns, 1)
+    # Memory is measured on a second board, tracemalloc slows allocations down
+    t0 = perf_counter()
+    run_steps(get_barrier(barrier_name).barrier_generation(cells, SEED))
+    elapsed = perf_counter() - t0
+
+    cells = create_cells(DFSMazeCell, num_rows, num_columns, 1)
+    tracemalloc.start()
+    run_steps(get_barrier(barrier_name).barrier_generation(cells, SEED))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    print(f"{'grid':>10} {'barrier':>18} {'time s':>7} {'peak MiB':>9}")
+    for num_rows, num_columns in SIZES:
+        size = f"{num_rows}x{num_columns}"
+        for barrier_name in BARRIERS:
+            elapsed, peak = run(barrier_name, num_rows, num_columns)
+            print(f"{size:>10} {barrier_name:>18} {elapsed:>7.3f} {peak:>9.1f}")
+    for num_rows, num_columns in WALL_SIZES:
+        size = f"{num_rows}x{num_columns}"
+        for maze_walls in MAZE_WALLS:
+            t0 = perf_counter()
+            maze_walls(num_rows, num_columns, random.Random(SEED))
+            elapsed = perf_counter() - t0
+            print(f"{size:>10} {maze_walls.__name__:>18} {elapsed:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Compare the heap and bucket queue versions of Dijkstra's algorithm.
+
+Run from the repository root:
+    python -m benchmarks.bench_dijkstra
+"""
+
+from algorithms import get_pathing_algorithm
+from benchmarks.common import build_board, time_search
+
+# (barrier name, num_rows, num_columns)
+BOARDS = [("diy", 200, 300), ("random", 200, 300), ("dfs", 200, 300)]
+PATHING = ["dijkstra", "dijkstra_bucket"]
+SEED = 0
+
+
+def main() -> None:
+    print(f"{'board':>14} {'pathing':>16} {'steps':>7} {'time s':>7} {'steps/s':>9}")
+    for barrier_name, num_rows, num_columns in BOARDS:
+        board = f"{barrier_name} {num_rows}x{num_columns}"
+        for name in PATHING:
+            _, start, end = build_board(barrier_name, num_rows, num_columns, SEED)
+            steps, elapsed = time_search(get_pathing_algorithm(name), start, end)
+            print(
+                f"{board:>14} {name:>16} {steps:>7} {elapsed:>7.3f}"
+                f" {steps / elapsed:>9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
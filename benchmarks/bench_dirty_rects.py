@@ -0,0 +1,70 @@
+"""Compare frames/sec of the dirty-rect Grid.draw against a full redraw.
+
+Run from the repository root:
+    python -m benchmarks.bench_dirty_rects
+"""
+
+import os
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from algorithms.utils import Step, run_steps
+from grid import Grid
+
+# (num_rows, num_columns, cell_size)
+SIZES = [(53, 93, 15), (100, 180, 8), (200, 360, 4)]
+PATHING = "dijkstra"
+BARRIER = "random"
+SEED = 0
+# Full redraws are slow on big boards, so only the first frames are timed
+MAX_FRAMES = 300
+
+
+class _Done(Exception):
+    pass
+
+
+def run(num_rows: int, num_columns: int, cell_size: int, full_redraw: bool) -> float:
+    screen = pygame.display.set_mode((num_columns * cell_size, num_rows * cell_size))
+    grid = Grid.create(PATHING, BARRIER, num_rows, num_columns, cell_size, seed=SEED)
+    grid.process_click((0, 0))
+    grid.process_click(((num_columns - 1) * cell_size, (num_rows - 1) * cell_size))
+    grid.redraw(screen)
+    run_steps(grid.barrier_spec.barrier_generation(grid.cells, grid.barrier_spec.seed))
+
+    frames = 0
+
+    def _draw(step: Step) -> None:
+        nonlocal frames
+        if frames == MAX_FRAMES:
+            raise _Done
+        frames += 1
+        if full_redraw:
+            grid.redraw(screen)
+        else:
+            grid.draw(screen)
+
+    t0 = perf_counter()
+    try:
+        run_steps(grid.pathing(grid.start, grid.end), _draw)
+    except _Done:
+        pass
+    return frames / (perf_counter() - t0)
+
+
+def main() -> None:
+    pygame.init()
+    print(f"{'grid':>12} {'full fps':>10} {'dirty fps':>10} {'speedup':>8}")
+    for num_rows, num_columns, cell_size in SIZES:
+        full = run(num_rows, num_columns, cell_size, full_redraw=True)
+        dirty = run(num_rows, num_columns, cell_size, full_redraw=False)
+        size = f"{num_rows}x{num_columns}"
+        print(f"{size:>12} {full:>10.1f} {dirty:>10.1f} {dirty / full:>7.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare memory and throughput of the object and array grid backends.
+
+Run from the repository root:
+    python -m benchmarks.bench_grid_backends
+"""
+
+import tracemalloc
+from time import perf_counter
+
+from algorithms import get_pathing_algorithm
+from algorithms.maze import SquareCell, create_cells, update_all_neighbors
+from algorithms.utils import Step, run_steps
+
+SIZES = [(1000, 1000), (4000, 4000)]
+BACKENDS = ["objects", "array"]
+# One object per cell needs several GB past this size
+MAX_OBJECT_CELLS = 2_000_000
+PATHING = "dijkstra"
+# Manhattan distance between start and end of the timed search
+SEARCH_RADIUS = 150
+
+
+def build(num_rows: int, num_columns: int, backend: str):
+    cells = create_cells(SquareCell, num_rows, num_columns, 1, backend)
+    run_steps(update_all_neighbors(cells))
+    return cells
+
+
+def run(num_rows: int, num_columns: int, backend: str) -> (float, float, float):
+    # tracemalloc slows allocations down, so memory is measured separately
+    tracemalloc.start()
+    build(num_rows, num_columns, backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    t0 = perf_counter()
+    cells = build(num_rows, num_columns, backend)
+    build_time = perf_counter() - t0
+
+    row_id, col_id = num_rows // 2, num_columns // 2
+    start = cells[row_id][col_id]
+    end = cells[row_id + SEARCH_RADIUS // 2][col_id + SEARCH_RADIUS // 2]
+    start.make_start()
+    end.make_end()
+    expanded = 0
+
+    def _count_step(step: Step) -> None:
+        nonlocal expanded
+        expanded += 1
+
+    t0 = perf_counter()
+    run_steps(get_pathing_algorithm(PATHING)(start, end), _count_step)
+    throughput = expanded / (perf_counter() - t0)
+    return build_time, peak / 2**20, throughput
+
+
+def main() -> None:
+    print(f"{'grid':>10} {'backend':>8} {'build s':>8} {'peak MiB':>9} {'steps/s':>9}")
+    for num_rows, num_columns in SIZES:
+        size = f"{num_rows}x{num_columns}"
+        for backend in BACKENDS:
+            if backend == "objects" and num_rows * num_columns > MAX_OBJECT_CELLS:
+                print(f"{size:>10} {backend:>8} {'skipped, too large':>28}")
+                continue
+            build_time, peak, throughput = run(num_rows, num_columns, backend)
+            print(
+                f"{size:>10} {backend:>8} {build_time:>8.2f} {peak:>9.1f} {throughput:>9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
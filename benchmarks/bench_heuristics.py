@@ -0,0 +1,54 @@
+"""Compare the heuristics of A* under 4- and 8-connectivity.
+
+Dijkstra's algorithm gives the optimal cost every A* run is checked against,
+an inadmissible heuristic may find a costlier path.
+
+Run from the repository root:
+    python -m benchmarks.bench_heuristics
+"""
+
+from functools import partial
+
+from algorithms import Connectivity, astar, dijkstra, heuristics
+from benchmarks.common import build_board, time_search
+
+# (barrier name, num_rows, num_columns)
+BOARDS = [("diy", 300, 300), ("random", 300, 300), ("terrain", 300, 300)]
+CONNECTIVITIES = [Connectivity(4), Connectivity(8)]
+SEED = 0
+
+
+def main() -> None:
+    print(
+        f"{'board':>16} {'moves':>5} {'pathing':>16} {'steps':>7} {'time s':>7}"
+        f" {'cost':>7} {'optimal':>7}"
+    )
+    for barrier_name, num_rows, num_columns in BOARDS:
+        board = f"{barrier_name} {num_rows}x{num_columns}"
+        for connectivity in CONNECTIVITIES:
+            cells, start, end = build_board(
+                barrier_name, num_rows, num_columns, SEED, connectivity=connectivity
+            )
+            runs = [("dijkstra", dijkstra)]
+            runs += [
+                (f"a* {name}", partial(astar, heuristic=heuristic))
+                for name, heuristic in heuristics.items()
+            ]
+            best = None
+            for name, pathing in runs:
+                # Same board, fresh search state
+                cells[0][0].search_epoch.bump()
+                start.make_start()
+                end.make_end()
+                steps, elapsed = time_search(pathing, start, end)
+                cost = end.dist
+                if best is None:
+                    best = cost
+                print(
+                    f"{board:>16} {connectivity.num_neighbors:>5} {name:>16}"
+                    f" {steps:>7} {elapsed:>7.3f} {cost:>7} {str(cost == best):>7}"
+                )
+
+
+if __name__ == "__main__":
+    main()
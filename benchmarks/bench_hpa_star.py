@@ -0,0 +1,94 @@
+"""Compare Hierarchical Pathfinding A* with A* on large boards.
+
+The first HPA* query builds the cluster graph of the board, later queries
+reuse it. Random queries then run with both algorithms, reporting their time,
+the nodes they expanded and how much longer the HPA* paths are. Last, single
+cells are made barriers and HPA* answers again, building the clusters around
+them only.
+
+Run from the repository root:
+    python -m benchmarks.bench_hpa_star
+"""
+
+import random
+from time import perf_counter
+
+from algorithms import PathingAlgorithm, SearchStats, astar, cluster_graph, hpa_star
+from algorithms.maze import SquareCell
+from algorithms.utils import Colors, run_steps
+from benchmarks.common import build_board
+
+NUM_ROWS, NUM_COLUMNS = 500, 500
+BOARDS = ["random", "recursive_division_maze"]
+NUM_QUERIES = 10
+NUM_EDITS = 10
+BACKEND = "objects"
+SEED = 0
+
+
+def main() -> None:
+    for barrier_name in BOARDS:
+        cells, start, end = build_board(
+            barrier_name, NUM_ROWS, NUM_COLUMNS, SEED, BACKEND
+        )
+        rng = random.Random(SEED)
+        t0 = perf_counter()
+        graph = cluster_graph(start)
+        graph.sync((start,))
+        num_entrances = sum(len(edges) for edges in graph.intra.values())
+        print(
+            f"{barrier_name}: cluster graph of {len(graph.cells)} cells,"
+            f" {num_entrances} transition cells, built in {perf_counter() - t0:.2f} s"
+        )
+
+        print(
+            f"{'query':>6} {'hpa* s':>8} {'a* s':>8} {'speedup':>8}"
+            f" {'hpa* exp':>9} {'a* exp':>9} {'longer':>7}"
+        )
+        open_cells = [cell for row in cells for cell in row if not cell.is_barrier()]
+        for i in range(NUM_QUERIES):
+            source, target = rng.sample(open_cells, 2)
+            hpa_time, hpa_expanded, hpa_cost = _search(hpa_star, cells, source, target)
+            astar_time, astar_expanded, astar_cost = _search(
+                astar, cells, source, target
+            )
+            longer = f"{hpa_cost / astar_cost - 1:>6.1%}" if astar_cost else "-"
+            print(
+                f"{i:>6} {hpa_time:>8.3f} {astar_time:>8.3f}"
+                f" {astar_time / hpa_time:>7.1f}x"
+                f" {hpa_expanded:>9} {astar_expanded:>9} {longer:>7}"
+            )
+
+        # Barrier edits rebuild the clusters around them at the next query
+        edit_time = 0.0
+        for _ in range(NUM_EDITS):
+            rng.choice(open_cells).make_barrier()
+            source, target = rng.sample(open_cells, 2)
+            if source.is_barrier() or target.is_barrier():
+                continue
+            elapsed, _, _ = _search(hpa_star, cells, source, target)
+            edit_time += elapsed
+        print(f"query after a single-cell edit: {edit_time / NUM_EDITS:.3f} s\n")
+
+
+def _search(
+    pathing: PathingAlgorithm,
+    cells: list[list[SquareCell]],
+    start: SquareCell,
+    end: SquareCell,
+) -> (float, int, int):
+    """Time, nodes expanded and path cost of a search, cost 0 if none."""
+    # Same board, fresh search state
+    cells[0][0].search_epoch.bump()
+    start.make_start()
+    end.make_end()
+    stats = SearchStats()
+    t0 = perf_counter()
+    found = run_steps(pathing(start, end, stats))
+    elapsed = perf_counter() - t0
+    start.color = end.color = Colors.WHITE
+    return elapsed, stats.pops - stats.stale_pops, end.g_score if found else 0
+
+
+if __name__ == "__main__":
+    main()
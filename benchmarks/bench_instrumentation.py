@@ -0,0 +1,72 @@
+"""Measure the cost of SearchStats counters, and where the time of an
+animated search goes.
+
+Run from the repository root:
+    python -m benchmarks.bench_instrumentation
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from algorithms import SearchStats, get_pathing_algorithm
+from benchmarks.common import build_board, time_search
+from grid import Grid
+
+# (barrier name, num_rows, num_columns)
+BOARDS = [("diy", 200, 300), ("dfs", 200, 300)]
+PATHING = ["a*", "dijkstra", "dfs"]
+SEED = 0
+# Animated search: (num_rows, num_columns, cell_size) and steps per frame
+GRID_SIZE = (53, 93, 15)
+STEPS_PER_FRAME = [1, 8, 64]
+
+
+def counters_overhead() -> None:
+    print(f"{'board':>12} {'pathing':>9} {'plain s':>8} {'stats s':>8} {'cost':>6}")
+    for barrier_name, num_rows, num_columns in BOARDS:
+        board = f"{barrier_name} {num_rows}x{num_columns}"
+        for name in PATHING:
+            pathing = get_pathing_algorithm(name)
+            _, start, end = build_board(barrier_name, num_rows, num_columns, SEED)
+            _, plain = time_search(pathing, start, end)
+            _, start, end = build_board(barrier_name, num_rows, num_columns, SEED)
+            stats = SearchStats()
+            _, counted = time_search(lambda s, e: pathing(s, e, stats), start, end)
+            print(
+                f"{board:>12} {name:>9} {plain:>8.3f} {counted:>8.3f}"
+                f" {counted / plain - 1:>+6.0%}"
+            )
+
+
+def animated_search() -> None:
+    num_rows, num_columns, cell_size = GRID_SIZE
+    screen = pygame.display.set_mode((num_columns * cell_size, num_rows * cell_size))
+    print(
+        f"\n{'steps/frame':>11} {'search s':>9} {'draw s':>7} {'events s':>9}"
+        f" {'wait s':>7} {'nodes/s':>9}"
+    )
+    for steps_per_frame in STEPS_PER_FRAME:
+        grid = Grid.create("a*", "diy", num_rows, num_columns, cell_size)
+        grid.steps_per_frame = steps_per_frame
+        grid.process_click((0, 0))
+        grid.process_click(((num_columns - 1) * cell_size, (num_rows - 1) * cell_size))
+        grid.generate_barriers(screen)
+        stats = grid.find_path(screen)
+        print(
+            f"{steps_per_frame:>11} {stats.search_time:>9.3f} {stats.draw_time:>7.3f}"
+            f" {stats.poll_time:>9.3f} {stats.wait_time:>7.3f}"
+            f" {stats.nodes_per_second:>9.0f}"
+        )
+
+
+def main() -> None:
+    pygame.init()
+    counters_overhead()
+    animated_search()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Compare Jump Point Search with A* on open boards.
+
+Also checks that both find paths of the same length.
+
+Run from the repository root:
+    python -m benchmarks.bench_jps
+"""
+
+from algorithms import get_pathing_algorithm
+from benchmarks.common import build_board, path_length, time_search
+
+# (barrier name, num_rows, num_columns)
+BOARDS = [
+    ("diy", 100, 150),
+    ("diy", 300, 450),
+    ("random", 100, 150),
+    ("random", 300, 450),
+]
+PATHING = ["a*", "jps"]
+SEED = 0
+
+
+def main() -> None:
+    print(f"{'board':>15} {'pathing':>8} {'expanded':>9} {'length':>7} {'time s':>7}")
+    for barrier_name, num_rows, num_columns in BOARDS:
+        board = f"{barrier_name} {num_rows}x{num_columns}"
+        lengths = set()
+        for name in PATHING:
+            _, start, end = build_board(barrier_name, num_rows, num_columns, SEED)
+            steps, elapsed = time_search(get_pathing_algorithm(name), start, end)
+            length = path_length(start, end)
+            lengths.add(length)
+            # Searches step once per expansion, then once per inner path cell
+            expanded = steps - max(length - 2, 0)
+            print(f"{board:>15} {name:>8} {expanded:>9} {length:>7} {elapsed:>7.3f}")
+        assert len(lengths) == 1, f"Path lengths differ on {board}: {lengths}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Compare A* on the junction graph of perfect mazes with A* on their cells.
+
+The first search of a board contracts its corridors into edges between
+junctions and prunes its dead ends, later searches reuse the graph. The
+number of cells and of junctions, before and after pruning, shows how much
+smaller the graph is. Random queries then run with both algorithms,
+reporting their time and the nodes they expanded; both find shortest paths,
+whose costs must agree.
+
+Run from the repository root:
+    python -m benchmarks.bench_junctions
+"""
+
+import random
+from time import perf_counter
+
+from algorithms import PathingAlgorithm, SearchStats, astar, junction_astar
+from algorithms import junction_graph
+from algorithms.maze import SquareCell
+from algorithms.utils import Colors, run_steps
+from benchmarks.common import build_board
+
+NUM_ROWS, NUM_COLUMNS = 500, 500
+BOARDS = ["dfs_fast", "kruskal", "wilson"]
+NUM_QUERIES = 10
+BACKEND = "objects"
+SEED = 0
+
+
+def main() -> None:
+    for barrier_name in BOARDS:
+        cells, start, end = build_board(
+            barrier_name, NUM_ROWS, NUM_COLUMNS, SEED, BACKEND
+        )
+        rng = random.Random(SEED)
+        t0 = perf_counter()
+        graph = junction_graph(start)
+        graph.add_region(start)
+        elapsed = perf_counter() - t0
+        num_nodes = len(graph.nodes)
+        num_left = num_nodes - sum(graph.pruned)
+        print(
+            f"{barrier_name}: {graph.num_cells} cells, {num_nodes} junctions"
+            f" ({graph.num_cells / num_nodes:.1f}x fewer), {num_left} left after"
+            f" pruning, built in {elapsed:.2f} s"
+        )
+
+        print(
+            f"{'query':>6} {'junc s':>8} {'a* s':>8} {'speedup':>8}"
+            f" {'junc exp':>9} {'a* exp':>9} {'agree':>6}"
+        )
+        open_cells = [cell for row in cells for cell in row if not cell.is_barrier()]
+        total_junction = total_astar = 0.0
+        for i in range(NUM_QUERIES):
+            source, target = rng.sample(open_cells, 2)
+            junction_time, junction_expanded, junction_cost = _search(
+                junction_astar, cells, source, target
+            )
+            astar_time, astar_expanded, astar_cost = _search(
+                astar, cells, source, target
+            )
+            total_junction += junction_time
+            total_astar += astar_time
+            print(
+                f"{i:>6} {junction_time:>8.4f} {astar_time:>8.3f}"
+                f" {astar_time / junction_time:>7.1f}x"
+                f" {junction_expanded:>9} {astar_expanded:>9}"
+                f" {str(junction_cost == astar_cost):>6}"
+            )
+        print(f"total speedup: {total_astar / total_junction:.1f}x\n")
+
+
+def _search(
+    pathing: PathingAlgorithm,
+    cells: list[list[SquareCell]],
+    start: SquareCell,
+    end: SquareCell,
+) -> (float, int, int):
+    """Time, nodes expanded and path cost of a search, cost 0 if none."""
+    # Same board, fresh search state
+    cells[0][0].search_epoch.bump()
+    start.make_start()
+    end.make_end()
+    stats = SearchStats()
+    t0 = perf_counter()
+    found = run_steps(pathing(start, end, stats))
+    elapsed = perf_counter() - t0
+    start.color = end.color = Colors.WHITE
+    return elapsed, stats.pops - stats.stale_pops, end.g_score if found else 0
+
+
+if __name__ == "__main__":
+    main()
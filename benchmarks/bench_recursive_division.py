@@ -0,0 +1,54 @@
+"""Compare the Chamber and NumPy recursive division maze generations.
+
+Also compares the share of barrier cells, which both should agree on.
+
+Run from the repository root:
+    python -m benchmarks.bench_recursive_division
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from algorithms import get_barrier
+from algorithms.maze import SquareCell, create_cells, recursive_division_walls
+from algorithms.maze.array_cells import BARRIER
+from algorithms.utils import run_steps
+
+# (num_rows, num_columns), both generations on the array backend
+SIZES = [(200, 300), (500, 500), (1000, 1000)]
+# Only the bitmap of the NumPy generation past this size
+BITMAP_SIZES = [(2000, 2000), (4000, 4000)]
+BARRIERS = ["recursive_division_maze", "recursive_division_maze_fast"]
+SEED = 0
+
+
+def run(barrier_name: str, num_rows: int, num_columns: int) -> (float, float):
+    cells = create_cells(SquareCell, num_rows, num_columns, 1, "array")
+    t0 = perf_counter()
+    run_steps(get_barrier(barrier_name).barrier_generation(cells, SEED))
+    elapsed = perf_counter() - t0
+    return elapsed, float(np.mean(cells.state == BARRIER))
+
+
+def main() -> None:
+    print(f"{'grid':>10} {'barrier':>29} {'time s':>7} {'barriers':>9}")
+    for num_rows, num_columns in SIZES:
+        size = f"{num_rows}x{num_columns}"
+        for barrier_name in BARRIERS:
+            elapsed, density = run(barrier_name, num_rows, num_columns)
+            print(f"{size:>10} {barrier_name:>29} {elapsed:>7.3f} {density:>9.3f}")
+    for num_rows, num_columns in BITMAP_SIZES:
+        size = f"{num_rows}x{num_columns}"
+        rng = np.random.default_rng(SEED)
+        t0 = perf_counter()
+        walls = recursive_division_walls(num_rows, num_columns, rng)
+        elapsed = perf_counter() - t0
+        print(
+            f"{size:>10} {'recursive_division_walls':>29} {elapsed:>7.3f}"
+            f" {walls.mean():>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare Lifelong Planning A* replanning with A* from scratch after
+single-cell edits on large boards.
+
+After a first search, each edit changes one cell: "path" edits block a cell
+of the current path, so the path has to move, "anywhere" edits toggle a
+random cell between barrier and open. After every edit the LPAStar repairs
+its search, and A* searches the board again from scratch; both report the
+nodes they expanded and the cost of their path, which must agree.
+
+Run from the repository root:
+    python -m benchmarks.bench_replanning
+"""
+
+import random
+from time import perf_counter
+
+from algorithms import LPAStar, SearchStats, astar
+from algorithms.maze import SquareCell
+from algorithms.utils import run_steps
+from benchmarks.common import build_board
+
+NUM_ROWS, NUM_COLUMNS = 500, 500
+BOARDS = ["random", "terrain"]
+EDITS = ["path", "anywhere"]
+NUM_EDITS = 10
+BACKEND = "objects"
+SEED = 0
+
+
+def main() -> None:
+    print(
+        f"{'board':>8} {'edits':>8} {'lpa* s':>8} {'a* s':>8} {'speedup':>8}"
+        f" {'lpa* exp':>9} {'a* exp':>9} {'agree':>6}"
+    )
+    for barrier_name in BOARDS:
+        cells, start, end = build_board(
+            barrier_name, NUM_ROWS, NUM_COLUMNS, SEED, BACKEND
+        )
+        rng = random.Random(SEED)
+        planner = LPAStar(start, end)
+        t0 = perf_counter()
+        run_steps(planner.search())
+        print(f"{barrier_name:>8} {'first':>8} {perf_counter() - t0:>8.3f}")
+
+        for kind in EDITS:
+            lpa_time = astar_time = 0.0
+            lpa_expanded = astar_expanded = agree = 0
+            for _ in range(NUM_EDITS):
+                cell = _edit(cells, planner, kind, rng)
+
+                planner.stats = stats = SearchStats()
+                t0 = perf_counter()
+                planner.update_cells([cell])
+                run_steps(planner.search())
+                lpa_time += perf_counter() - t0
+                lpa_expanded += stats.pops - stats.stale_pops
+
+                # Same board, fresh search state
+                cells[0][0].search_epoch.bump()
+                start.make_start()
+                end.make_end()
+                stats = SearchStats()
+                t0 = perf_counter()
+                run_steps(astar(start, end, stats))
+                astar_time += perf_counter() - t0
+                astar_expanded += stats.pops - stats.stale_pops
+
+                agree += planner.g[end.index] == end.g_score
+            print(
+                f"{barrier_name:>8} {kind:>8} {lpa_time / NUM_EDITS:>8.3f}"
+                f" {astar_time / NUM_EDITS:>8.3f}"
+                f" {astar_time / lpa_time:>7.1f}x"
+                f" {lpa_expanded // NUM_EDITS:>9} {astar_expanded // NUM_EDITS:>9}"
+                f" {agree:>3}/{NUM_EDITS}"
+            )
+
+
+def _edit(
+    cells: list[list[SquareCell]], planner: LPAStar, kind: str, rng: random.Random
+) -> SquareCell:
+    """Change one cell, returning it."""
+    if kind == "path" and len(planner.path) > 2:
+        cell = rng.choice(planner.path[1:-1])
+        cell.make_barrier()
+        return cell
+    while True:
+        cell = cells[rng.randrange(NUM_ROWS)][rng.randrange(NUM_COLUMNS)]
+        if cell.is_start() or cell.is_end():
+            continue
+        if cell.is_barrier():
+            cell.reset()
+        else:
+            cell.make_barrier()
+        return cell
+
+
+if __name__ == "__main__":
+    main()
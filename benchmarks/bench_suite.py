@@ -0,0 +1,373 @@
+"""Sweep grid sizes, barrier generations and pathing algorithms under fixed
+seeds, and compare the results with a baseline.
+
+Every barrier generation is timed on its own, then every pathing algorithm
+searches its board from the top left to the bottom right corner. The first
+search on a board is measured apart, cold: it pays for what some algorithms
+build once per board, such as landmark tables or cluster graphs.
+
+Run from the repository root:
+    python -m benchmarks.bench_suite --json baseline.json
+    python -m benchmarks.bench_suite --baseline baseline.json --csv run.csv
+
+Exits with status 1 when a run regresses against the baseline: a target no
+longer found, more nodes expanded, a longer path, or time or peak memory
+over the tolerance.
+"""
+
+import argparse
+import csv
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+
+from algorithms import get_barrier, get_pathing_algorithm, solve_many
+from algorithms import barriers, pathing_algorithms
+from algorithms.maze import SquareCell, create_cells
+from algorithms.utils import run_steps
+
+SIZES = [(25, 40), (50, 80), (100, 150)]
+SEED = 0
+# Times are the best of this many runs
+REPEAT = 5
+# Relative slack on time and peak memory before a run counts as a regression.
+# Expanded nodes and path lengths are exact under fixed seeds, times are not:
+# compare against a baseline stored on the same machine.
+TOLERANCE = 0.5
+# Differences below these are noise, whatever the tolerance
+NOISE = {"time_s": 0.02, "peak_mib": 0.1, "cold_time_s": 0.02, "cold_peak_mib": 0.1}
+# Fields measured in time or memory, held to the tolerance
+MEASURED = ["time_s", "peak_mib", "cold_time_s", "cold_peak_mib"]
+
+FIELDS = [
+    "kind",
+    "barrier",
+    "pathing",
+    "rows",
+    "columns",
+    "backend",
+    "seed",
+    "time_s",
+    "expanded",
+    "path_length",
+    "peak_mib",
+    "cold_time_s",
+    "cold_peak_mib",
+    "found",
+]
+# Fields telling runs apart, the others are measured
+KEY_FIELDS = FIELDS[:7]
+
+
+def generate(
+    barrier_name: str, num_rows: int, num_columns: int, backend: str, seed: int
+) -> (list[list[SquareCell]], float):
+    """Board with start and end in opposite corners, and its generation time."""
+    barrier_specs = get_barrier(barrier_name)
+    cells = create_cells(barrier_specs.cell_type, num_rows, num_columns, 1, backend)
+    cells[0][0].make_start()
+    cells[num_rows - 1][num_columns - 1].make_end()
+    t0 = perf_counter()
+    run_steps(barrier_specs.barrier_generation(cells, seed))
+    return cells, perf_counter() - t0
+
+
+def bench_generation(
+    barrier_name: str,
+    num_rows: int,
+    num_columns: int,
+    backend: str,
+    seed: int,
+    repeat: int,
+) -> (list[list[SquareCell]], dict):
+    # tracemalloc slows allocations down, so memory is measured separately
+    tracemalloc.start()
+    generate(barrier_name, num_rows, num_columns, backend, seed)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times = []
+    for _ in range(repeat):
+        with _gc_paused():
+            cells, elapsed = generate(
+                barrier_name, num_rows, num_columns, backend, seed
+            )
+        times.append(elapsed)
+    record = {
+        "kind": "generation",
+        "barrier": barrier_name,
+        "pathing": "",
+        "time_s": min(times),
+        "expanded": None,
+        "path_length": None,
+        "peak_mib": peak / 2**20,
+        "cold_time_s": None,
+        "cold_peak_mib": None,
+        "found": None,
+    }
+    return cells, record
+
+
+def bench_search(
+    cells: list[list[SquareCell]], barrier_name: str, pathing_name: str, repeat: int
+) -> dict:
+    query = ((0, 0), (len(cells) - 1, len(cells[0]) - 1))
+    # The first query on the board builds what the algorithm keeps per board
+    with _gc_paused():
+        _, cold = next(solve_many(cells, pathing_name, [query]))
+    # A board change drops it, for the memory of a cold query to be traced
+    cells[0][0].edits.bump()
+    cold_peak = _traced_peak(cells, pathing_name, query)
+
+    with _gc_paused():
+        results = [
+            result for _, result in solve_many(cells, pathing_name, [query] * repeat)
+        ]
+    peak = _traced_peak(cells, pathing_name, query)
+
+    return {
+        "kind": "search",
+        "barrier": barrier_name,
+        "pathing": pathing_name,
+        "time_s": min(result.elapsed for result in results),
+        "expanded": results[0].expanded,
+        "path_length": len(results[0].path),
+        "peak_mib": peak / 2**20,
+        "cold_time_s": cold.elapsed,
+        "cold_peak_mib": cold_peak / 2**20,
+        "found": results[0].found,
+    }
+
+
+def _traced_peak(
+    cells: list[list[SquareCell]], pathing_name: str, query: ((int, int), (int, int))
+) -> int:
+    """Peak memory in bytes of one query, tracemalloc slowing it down."""
+    tracemalloc.start()
+    for _ in solve_many(cells, pathing_name, [query]):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run_suite(
+    sizes: list[(int, int)],
+    barrier_names: list[str],
+    pathing_names: list[str],
+    backend: str = "objects",
+    seed: int = SEED,
+    repeat: int = REPEAT,
+) -> list[dict]:
+    """One generation record per board, then one search record per pathing
+    algorithm on it."""
+    records = []
+    for num_rows, num_columns in sizes:
+        board = {
+            "rows": num_rows,
+            "columns": num_columns,
+            "backend": backend,
+            "seed": seed,
+        }
+        for barrier_name in barrier_names:
+            # DFSMazeCell keeps walls between cells, which arrays do not store
+            if (
+                backend == "array"
+                and get_barrier(barrier_name).cell_type is not SquareCell
+            ):
+                continue
+            cells, record = bench_generation(
+                barrier_name, num_rows, num_columns, backend, seed, repeat
+            )
+            records.append({**board, **record})
+            _print_record(records[-1])
+            for pathing_name in pathing_names:
+                record = bench_search(cells, barrier_name, pathing_name, repeat)
+                records.append({**board, **record})
+                _print_record(records[-1])
+    return records
+
+
+def compare(
+    records: list[dict], baseline: list[dict], tolerance: float = TOLERANCE
+) -> list[(dict, str, str)]:
+    """Regressions of records against the baseline records, as (record,
+    field, message) triples.
+
+    Runs missing from the baseline are skipped.
+    """
+    before = {_key(record): record for record in baseline}
+    regressions = []
+    for record in records:
+        old = before.get(_key(record))
+        if old is None:
+            continue
+        name = " ".join(str(value) for value in _key(record) if value != "")
+        if old["found"] and not record["found"]:
+            regressions.append((record, "found", f"{name}: target no longer found"))
+        for field in ("expanded", "path_length"):
+            if old[field] is not None and record[field] > old[field]:
+                message = f"{name}: {field} {old[field]} -> {record[field]}"
+                regressions.append((record, field, message))
+        for field in MEASURED:
+            # Baselines from before the cold fields lack them
+            new_value, old_value = record[field], old.get(field)
+            if new_value is None or old_value is None:
+                continue
+            if (
+                new_value > old_value * (1 + tolerance)
+                and new_value - old_value > NOISE[field]
+            ):
+                message = (
+                    f"{name}: {field} {old_value:.4f} -> {new_value:.4f}"
+                    f" (+{new_value / old_value - 1:.0%})"
+                )
+                regressions.append((record, field, message))
+    return regressions
+
+
+def retime(record: dict, repeat: int = REPEAT) -> dict:
+    """record with its best times over a new measurement of the same run."""
+    cells, measured = bench_generation(
+        record["barrier"],
+        record["rows"],
+        record["columns"],
+        record["backend"],
+        record["seed"],
+        repeat,
+    )
+    if record["kind"] == "search":
+        measured = bench_search(cells, record["barrier"], record["pathing"], repeat)
+    times = {
+        field: min(record[field], measured[field])
+        for field in ("time_s", "cold_time_s")
+        if record[field] is not None
+    }
+    return {**record, **times}
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Keep collection pauses out of the timings, as timeit does."""
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def _key(record: dict) -> tuple:
+    return tuple(record[field] for field in KEY_FIELDS)
+
+
+def _print_record(record: dict) -> None:
+    size = f"{record['rows']}x{record['columns']}"
+    expanded = "" if record["expanded"] is None else record["expanded"]
+    length = "" if record["path_length"] is None else record["path_length"]
+    cold = "" if record["cold_time_s"] is None else f"{record['cold_time_s']:.4f}"
+    print(
+        f"{size:>9} {record['barrier']:>28} {record['pathing']:>22}"
+        f" {record['time_s']:>8.4f} {expanded:>8} {length:>6}"
+        f" {record['peak_mib']:>8.2f} {cold:>8}"
+    )
+
+
+def write_json(path: str, records: list[dict]) -> None:
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "records": records,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=1)
+
+
+def write_csv(path: str, records: list[dict]) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def _parse_sizes(text: str) -> list[(int, int)]:
+    """'50x80,100x150' -> [(50, 80), (100, 150)]"""
+    sizes = []
+    for size in text.split(","):
+        num_rows, num_columns = size.lower().split("x")
+        sizes.append((int(num_rows), int(num_columns)))
+    return sizes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=_parse_sizes, default=SIZES)
+    parser.add_argument(
+        "--barriers", default=",".join(barriers), help="comma separated names"
+    )
+    parser.add_argument(
+        "--pathing", default=",".join(pathing_algorithms), help="comma separated names"
+    )
+    parser.add_argument("--backend", default="objects", choices=["objects", "array"])
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--json", help="write the records to this JSON file")
+    parser.add_argument("--csv", help="write the records to this CSV file")
+    parser.add_argument("--baseline", help="JSON file of an earlier run")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args()
+
+    barrier_names = args.barriers.split(",")
+    pathing_names = args.pathing.split(",")
+    # Unknown names fail before anything runs
+    for name in barrier_names:
+        get_barrier(name)
+    for name in pathing_names:
+        get_pathing_algorithm(name)
+
+    print(
+        f"{'grid':>9} {'barrier':>28} {'pathing':>22} {'time s':>8}"
+        f" {'expanded':>8} {'length':>6} {'peak MiB':>8} {'cold s':>8}"
+    )
+    records = run_suite(
+        args.sizes, barrier_names, pathing_names, args.backend, args.seed, args.repeat
+    )
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["records"]
+        regressions = compare(records, baseline, args.tolerance)
+        # A busy machine slows down whole stretches of a run, slow runs are
+        # measured again before failing
+        slow = [
+            record
+            for record, field, _ in regressions
+            if field in ("time_s", "cold_time_s")
+        ]
+        if slow:
+            retimed = {_key(record): retime(record, args.repeat) for record in slow}
+            records = [retimed.get(_key(record), record) for record in records]
+            regressions = compare(records, baseline, args.tolerance)
+
+    if args.json:
+        write_json(args.json, records)
+    if args.csv:
+        write_csv(args.csv, records)
+
+    if args.baseline:
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for _, _, message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print(f"\nNo regression against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Compare searches on plain and weighted terrain on a million-cell board.
+
+Every search runs from the top left to the bottom right corner, once on the
+plain board and once on random terrain with costs up to 255.
+
+Run from the repository root:
+    python -m benchmarks.bench_weighted
+"""
+
+from algorithms import get_pathing_algorithm
+from benchmarks.common import build_board, time_search
+
+NUM_ROWS, NUM_COLUMNS = 1000, 1000
+# Plain board, then weighted terrain
+BOARDS = ["diy", "terrain"]
+PATHING = ["dijkstra", "dijkstra_bucket", "a*"]
+BACKEND = "objects"
+SEED = 0
+
+
+def main() -> None:
+    print(
+        f"{'board':>8} {'pathing':>16} {'steps':>8} {'time s':>7}"
+        f" {'steps/s':>8} {'cost':>7}"
+    )
+    for barrier_name in BOARDS:
+        cells, start, end = build_board(
+            barrier_name, NUM_ROWS, NUM_COLUMNS, SEED, BACKEND
+        )
+        for name in PATHING:
+            # Same board, fresh search state
+            cells[0][0].search_epoch.bump()
+            start.make_start()
+            end.make_end()
+            steps, elapsed = time_search(get_pathing_algorithm(name), start, end)
+            print(
+                f"{barrier_name:>8} {name:>16} {steps:>8} {elapsed:>7.2f}"
+                f" {steps / elapsed:>8.0f} {end.dist:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Helpers shared by the benchmark scripts."""
+
+from time import perf_counter
+
+from algorithms import PathingAlgorithm, get_barrier
+from algorithms.maze import FOUR_NEIGHBORS, Connectivity, SquareCell, create_cells
+from algorithms.utils import Step, run_steps
+
+
+def build_board(
+    barrier_name: str,
+    num_rows: int,
+    num_columns: int,
+    seed: int = 0,
+    backend: str = "objects",
+    connectivity: Connectivity = FOUR_NEIGHBORS,
+) -> (list[list[SquareCell]], SquareCell, SquareCell):
+    """Create a board with start/end in opposite corners and its barriers."""
+    barrier_specs = get_barrier(barrier_name)
+    cells = create_cells(
+        barrier_specs.cell_type, num_rows, num_columns, 1, backend, connectivity
+    )
+    start, end = cells[0][0], cells[num_rows - 1][num_columns - 1]
+    start.make_start()
+    end.make_end()
+    run_steps(barrier_specs.barrier_generation(cells, seed))
+    return cells, start, end
+
+
+def time_search(
+    pathing: PathingAlgorithm, start: SquareCell, end: SquareCell
+) -> (int, float):
+    """Run a search, returning its number of steps and wall time."""
+    steps = 0
+
+    def _count_step(step: Step) -> None:
+        nonlocal steps
+        steps += 1
+
+    t0 = perf_counter()
+    run_steps(pathing(start, end), _count_step)
+    return steps, perf_counter() - t0
+
+
+def path_length(start: SquareCell, end: SquareCell) -> int:
+    """Number of cells on the path found by the last search, 0 if none."""
+    if end.prev is None:
+        return 0
+    length, curr = 1, end
+    while curr != start:
+        curr = curr.prev
+        length += 1
+    return length
@@ -1,18 +1,39 @@
 from __future__ import annotations
 
-from time import sleep
+from collections.abc import Generator
+from time import perf_counter
 
 import pygame
 from pygame import Surface
 
-from algorithms.maze import SquareCell
+from animation import AnimationScheduler
+from algorithms.maze import MIN_COST, SquareCell, ArrayCells, create_cells
+from algorithms.maze import Connectivity, DFSMazeCell, FOUR_NEIGHBORS
+from algorithms.utils import Colors, Seed, Step, resolve_seed, set_caption
 from algorithms import (
     PathingAlgorithm,
     BarrierSpecs,
+    LPAStar,
+    SearchStats,
+    connected_components,
     get_pathing_algorithm,
+    lpa_star,
     get_barrier,
 )
 
+# Colors painted by the pathing algorithms
+SEARCH_COLORS: frozenset[Colors] = frozenset(
+    (
+        Colors.OPEN,
+        Colors.CLOSE,
+        Colors.PATH,
+        Colors.OPEN_REVERSE,
+        Colors.CLOSE_REVERSE,
+    )
+)
+# Seconds between two updates of the nodes/s shown in the window title
+STATS_CAPTION_INTERVAL: float = 0.25
+
 
 class Grid:
     """2D SquareCell matrix:
@@ -28,14 +49,14 @@ class Grid:
 
     def __init__(
         self,
-        cells: list[list[SquareCell]],
+        cells: list[list[SquareCell]] | ArrayCells,
         pathing: PathingAlgorithm,
         barrier_spec: BarrierSpecs,
         num_rows: int,
         num_columns: int,
         cell_size: int,
     ) -> None:
-        self.cells: list[list[SquareCell]] = cells
+        self.cells: list[list[SquareCell]] | ArrayCells = cells
         self.pathing: PathingAlgorithm = pathing
         self.barrier_spec: BarrierSpecs = barrier_spec
         self.num_rows: int = num_rows
@@ -44,6 +65,31 @@ class Grid:
 
         self.start: SquareCell | None = None
         self.end: SquareCell | None = None
+        self.has_barriers: bool = False
+        # Int seed of the last barrier generation, to generate it again
+        self.seed: int | None = None
+
+        # Animation settings, see AnimationScheduler
+        self.steps_per_frame: int = 1
+        self.fps: int = 0
+        self.skip: bool = False
+        # Show the nodes/s of the search in the window title
+        self.show_stats: bool = False
+        # Terrain cost painted by clicks, None to draw barriers instead
+        self.brush_cost: int | None = None
+
+        # Cells whose color or walls changed since the last draw
+        self.dirty_cells: list[SquareCell] = []
+        # Cells painted by the last search, see clear_search
+        self.searched_cells: list[SquareCell] = []
+        # Planner of the last Lifelong Planning A* search, and the cells
+        # changed since, for find_path to repair the path instead of
+        # searching again
+        self.planner: LPAStar | None = None
+        self.changed_cells: list[SquareCell] = []
+        for row in cells:
+            for cell in row:
+                cell.track_dirty(self.dirty_cells)
 
     @classmethod
     def create(
@@ -53,12 +99,45 @@ class Grid:
         num_rows: int,
         num_columns: int,
         cell_size: int,
+        backend: str = "objects",
+        seed: Seed = None,
+        connectivity: Connectivity = FOUR_NEIGHBORS,
     ) -> "Grid":
         pathing = get_pathing_algorithm(pathing_name)
         barrier_specs = get_barrier(barrier_name)
-        cells = _get_cells(barrier_specs.cell_type, num_rows, num_columns, cell_size)
+        if seed is not None:
+            barrier_specs = barrier_specs._replace(seed=seed)
+        cells = create_cells(
+            barrier_specs.cell_type,
+            num_rows,
+            num_columns,
+            cell_size,
+            backend,
+            connectivity,
+        )
         return cls(cells, pathing, barrier_specs, num_rows, num_columns, cell_size)
 
+    @property
+    def connectivity(self) -> Connectivity:
+        return self.cells[0][0].connectivity
+
+    def set_connectivity(self, connectivity: Connectivity) -> None:
+        """Change the moves between cells, keeping the board."""
+        if connectivity.diagonal and isinstance(self.cells[0][0], DFSMazeCell):
+            raise ValueError("DFSMazeCell does not support diagonal steps")
+        # Every step may cost differently
+        self.planner = None
+        self.cells[0][0].edits.bump()
+        if isinstance(self.cells, ArrayCells):
+            self.cells.connectivity = connectivity
+            return
+        for row in self.cells:
+            for cell in row:
+                cell.connectivity = connectivity
+        provider = self.cells[0][0].neighbor_provider
+        if provider is not None:
+            provider.rebuild()
+
     def process_click(self, pos: (int, int)) -> None:
         r, c = self._get_clicked_cell_id(pos)
         cell = self.cells[r][c]
@@ -71,8 +150,18 @@ class Grid:
             cell.make_end()
             self.end = cell
         elif cell != self.start and cell != self.end:
-            # Create barrier
-            cell.make_barrier()
+            if self.brush_cost is not None:
+                if cell.cost == self.brush_cost:
+                    return
+                # Paint terrain
+                cell.cost = self.brush_cost
+            else:
+                if cell.is_barrier():
+                    return
+                # Create barrier
+                cell.make_barrier()
+            if self.planner is not None:
+                self.changed_cells.append(cell)
 
     def _get_clicked_cell_id(self, pos: (int, int)) -> (int, int):
         x, y = pos
@@ -80,51 +169,126 @@ class Grid:
         row_id = y // self.cell_size
         return row_id, col_id
 
-    def draw(self, screen: Surface, duration: int = 0):
+    def draw(self, screen: Surface):
+        """Repaint the cells that changed since the last draw."""
+        if self.dirty_cells:
+            rects = [cell.draw(screen) for cell in self.dirty_cells]
+            self.dirty_cells.clear()
+            pygame.display.update(rects)
+
+    def redraw(self, screen: Surface) -> None:
+        """Repaint every cell and the whole window."""
         for row in self.cells:
             for cell in row:
                 cell.draw(screen)
-
+        self.dirty_cells.clear()
         pygame.display.update()
-        if duration > 0:
-            sleep(duration)
 
     def generate_barriers(self, screen: Surface) -> None:
-        def _draw() -> None:
+        def _draw_frame() -> None:
             self.draw(screen)
 
-        self.barrier_spec.barrier_generation(self.cells, _draw)
+        # duration holds each frame of the generation, the grid fps otherwise
+        scheduler = AnimationScheduler.from_duration(
+            _draw_frame,
+            self.barrier_spec.duration,
+            self.steps_per_frame,
+            self.fps,
+            self.skip,
+        )
+        self.seed = resolve_seed(self.barrier_spec.seed)
+        scheduler.play(self.barrier_spec.barrier_generation(self.cells, self.seed))
+        self.has_barriers = True
+
+    def find_path(self, screen: Surface) -> SearchStats:
+        """Animate the search, returning its counters and timings.
+
+        After a Lifelong Planning A* search, only the part of the search the
+        cells changed since affect is repeated. When end is walled off from
+        start, no search runs at all, see Components.
+        """
+        stats = SearchStats()
+        caption = self.pathing.__doc__
+        last_caption = perf_counter()
 
-    def find_path(self, screen: Surface) -> bool:
-        def _draw() -> None:
+        def _draw_frame() -> None:
+            nonlocal last_caption
+            self.searched_cells.extend(self.dirty_cells)
             self.draw(screen)
+            if (
+                self.show_stats
+                and perf_counter() - last_caption > STATS_CAPTION_INTERVAL
+            ):
+                set_caption(f"{caption} - {stats.nodes_per_second:,.0f} nodes/s")
+                last_caption = perf_counter()
+
+        set_caption(caption)
+        scheduler = AnimationScheduler(
+            _draw_frame, self.steps_per_frame, self.fps, self.skip, stats
+        )
+        if connected_components(self.cells).connected(self.start, self.end):
+            stats.found = scheduler.play(self._search(stats))
+        caption += "- Path Found!" if stats.found else "- No Path Found!"
+        if self.show_stats:
+            caption += f" {stats.summary()}"
+        set_caption(caption)
+        return stats
+
+    def _search(self, stats: SearchStats) -> Generator[Step, None, bool]:
+        if self.planner is not None:
+            self.planner.stats = stats
+            self.planner.update_cells(self.changed_cells)
+            self.changed_cells.clear()
+            return self.planner.search()
+        if self.pathing is lpa_star:
+            self.planner = LPAStar(self.start, self.end, stats)
+            return self.planner.search()
+        return self.pathing(self.start, self.end, stats)
 
-        return self.pathing(self.start, self.end, _draw)
+    def clear_search(self) -> None:
+        """Clear the last search and free start and end, keeping the barriers.
+
+        The search state of every cell is cleared by a new search generation,
+        only the cells the search painted are visited.
+        """
+        self.cells[0][0].search_epoch.bump()
+        for cell in self.searched_cells:
+            if cell.color in SEARCH_COLORS:
+                cell.color = Colors.WHITE
+        self.searched_cells.clear()
+        self.planner = None
+        self.changed_cells.clear()
+        for cell in (self.start, self.end):
+            if cell is not None:
+                cell.color = Colors.WHITE
+        self.start = None
+        self.end = None
 
     def reset(self) -> None:
         self.start = None
         self.end = None
+        self.has_barriers = False
+        self.searched_cells.clear()
+        self.planner = None
+        self.changed_cells.clear()
+        if isinstance(self.cells, ArrayCells):
+            self.cells.terrain.clear()
+            self.cells.reset()
+            return
+        self.cells[0][0].search_epoch.bump()
         for row in self.cells:
             for cell in row:
+                # Repaint the terrain cleared below
+                if cell.cost != MIN_COST:
+                    cell.mark_dirty()
                 cell.reset()
+        self.cells[0][0].terrain.clear()
+        self.cells[0][0].edits.bump()
 
     def is_ready(self) -> bool:
         return self.start is not None and self.end is not None
 
 
-def _get_cells(
-    cell_cls: SquareCell.__class__, num_rows: int, num_columns: int, cell_size: int
-) -> list[list[SquareCell]]:
-    cells = []
-    for r in range(num_rows):
-        row = []
-        for c in range(num_columns):
-            cell = cell_cls(r, c, cell_size, num_rows, num_columns)
-            row.append(cell)
-        cells.append(row)
-    return cells
-
-
 if __name__ == "__main__":
     num_rows_ = 3
     num_cols_ = 5
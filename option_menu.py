@@ -6,7 +6,6 @@ from pygame import Surface
 from gui.menu import Menu
 from gui.menu_fabric import MenuFabric
 
-
 pygame.font.init()
 TITLE_FONT = pygame.font.SysFont("Verdana", 20)
 TITLE_FONT.set_underline(True)
@@ -15,12 +14,27 @@ OPTION_FONT = pygame.font.SysFont("Verdana", 15)
 
 _map = {
     "A*": "a*",
+    "A* (Landmarks)": "alt",
+    "Jump Point Search": "jps",
     "Dijkstra's": "dijkstra",
+    "Dijkstra's (Bucket Queue)": "dijkstra_bucket",
+    "Bidirectional A*": "bidirectional_a*",
+    "Bidirectional Dijkstra's": "bidirectional_dijkstra",
+    "Lifelong Planning A*": "lpa*",
+    "Hierarchical A*": "hpa*",
+    "A* on Junctions": "junctions",
     "Depth First Search": "dfs",
     "Draw it yourself": "diy",
     "Recursive Division Maze": "recursive_division_maze",
+    "Recursive Division Maze (Fast)": "recursive_division_maze_fast",
     "DFS Maze": "dfs",
+    "DFS Maze (Fast)": "dfs_fast",
+    "Kruskal's Maze": "kruskal",
+    "Prim's Maze": "prim",
+    "Wilson's Maze": "wilson",
+    "Eller's Maze": "eller",
     "Random Obstacles": "random",
+    "Random Terrain": "terrain",
 }
 
 
@@ -38,7 +52,19 @@ def create_menu(screen: Surface) -> Menu:
     menu.add(pathing_title_item)
     pathing_title_item.set_owner(menu)
 
-    pathing_options = ["A*", "Dijkstra's", "Depth First Search"]
+    pathing_options = [
+        "A*",
+        "A* (Landmarks)",
+        "Jump Point Search",
+        "Dijkstra's",
+        "Dijkstra's (Bucket Queue)",
+        "Bidirectional A*",
+        "Bidirectional Dijkstra's",
+        "Lifelong Planning A*",
+        "Hierarchical A*",
+        "A* on Junctions",
+        "Depth First Search",
+    ]
     for item_name in pathing_options:
         pathing_center = (pathing_center[0], pathing_center[1] + 30)
         pathing_item = menu_fabric.create_pathing_item(item_name, pathing_center)
@@ -52,8 +78,15 @@ def create_menu(screen: Surface) -> Menu:
     barrier_options = [
         "Draw it yourself",
         "Recursive Division Maze",
+        "Recursive Division Maze (Fast)",
         "DFS Maze",
+        "DFS Maze (Fast)",
+        "Kruskal's Maze",
+        "Prim's Maze",
+        "Wilson's Maze",
+        "Eller's Maze",
         "Random Obstacles",
+        "Random Terrain",
     ]
     for item_name in barrier_options:
         barrier_center = (barrier_center[0], barrier_center[1] + 30)
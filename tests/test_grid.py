@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from grid import Grid
+
+CELL_SIZE = 10
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    yield pygame.display.set_mode((5 * CELL_SIZE, 5 * CELL_SIZE))
+    pygame.quit()
+
+
+def click(grid: Grid, row_id: int, col_id: int) -> None:
+    grid.process_click((col_id * CELL_SIZE + 1, row_id * CELL_SIZE + 1))
+
+
+@pytest.mark.parametrize("backend", ["objects", "array"])
+@pytest.mark.parametrize("pathing_name", ["a*", "junctions", "hpa*", "alt"])
+def test_start_on_former_barrier(screen, backend, pathing_name):
+    grid = Grid.create(pathing_name, "diy", 5, 5, CELL_SIZE, backend=backend)
+    grid.skip = True
+    click(grid, 0, 0)
+    click(grid, 4, 0)
+    grid.generate_barriers(screen)
+    click(grid, 2, 2)
+    assert grid.find_path(screen).found
+
+    grid.clear_search()
+    click(grid, 2, 2)
+    click(grid, 4, 4)
+    assert grid.find_path(screen).found
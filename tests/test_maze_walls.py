@@ -0,0 +1,23 @@
+import random
+
+import pytest
+
+from algorithms import solve
+
+NUM_ROWS, NUM_COLUMNS = 15, 15
+START, END = (0, 0), (NUM_ROWS - 1, NUM_COLUMNS - 1)
+
+
+@pytest.mark.parametrize(
+    "barrier_name", ["dfs", "dfs_fast", "kruskal", "prim", "wilson", "eller"]
+)
+@pytest.mark.parametrize("seed", range(5))
+def test_walls_survive_maze_generation(barrier_name, seed):
+    rng = random.Random(seed)
+    walls = {
+        (rng.randrange(NUM_ROWS), rng.randrange(NUM_COLUMNS)) for _ in range(12)
+    } - {START, END}
+    result = solve(
+        "a*", barrier_name, NUM_ROWS, NUM_COLUMNS, START, END, walls, seed=seed
+    )
+    assert not walls & set(result.path)
@@ -0,0 +1,49 @@
+import pytest
+
+from algorithms import create_cells, get_barrier, run_steps, solve_many
+
+NUM_ROWS, NUM_COLUMNS = 30, 40
+SEED = 3
+
+
+def random_board(backend: str):
+    barrier_specs = get_barrier("random")
+    cells = create_cells(barrier_specs.cell_type, NUM_ROWS, NUM_COLUMNS, 1, backend)
+    run_steps(barrier_specs.barrier_generation(cells, SEED))
+    return cells
+
+
+def barrier_query(cells) -> ((int, int), (int, int)):
+    """Query from the first barrier to the last open cell."""
+    barrier = next(cell for row in cells for cell in row if cell.is_barrier())
+    end = next(
+        cell
+        for row in reversed(cells)
+        for cell in reversed(row)
+        if not cell.is_barrier()
+    )
+    return (barrier.row_id, barrier.col_id), (end.row_id, end.col_id)
+
+
+@pytest.mark.parametrize("backend", ["objects", "array"])
+@pytest.mark.parametrize("pathing_name", ["junctions", "alt", "hpa*"])
+def test_endpoint_on_barrier(backend, pathing_name):
+    cells = random_board(backend)
+    queries = [((0, 0), (NUM_ROWS - 1, NUM_COLUMNS - 1)), barrier_query(cells)]
+    # Per-board caches are built by the first query, then the second one
+    # opens a barrier
+    expected = dict(solve_many(random_board(backend), "a*", queries))
+    results = dict(solve_many(cells, pathing_name, queries))
+    for i in range(len(queries)):
+        assert results[i].found == expected[i].found
+        assert len(results[i].path) == len(expected[i].path)
+
+
+@pytest.mark.parametrize("backend", ["objects", "array"])
+def test_queries_keep_barriers(backend):
+    cells = random_board(backend)
+    barriers = [cell.is_barrier() for row in cells for cell in row]
+    queries = [barrier_query(cells), ((0, 0), (NUM_ROWS - 1, NUM_COLUMNS - 1))]
+    for _ in solve_many(cells, "junctions", queries):
+        assert [cell.is_barrier() for row in cells for cell in row] == barriers
+    assert not any(cell.is_start() or cell.is_end() for row in cells for cell in row)